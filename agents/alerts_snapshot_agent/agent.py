@@ -4,14 +4,36 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-from typing import List, Dict, Any, Optional
-from google.adk.agents import LlmAgent, SequentialAgent
+import json
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional, AsyncGenerator
+from google.adk.agents import BaseAgent, LlmAgent, SequentialAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.genai import types
 from pydantic import BaseModel, Field
-from .tools.tools import get_nws_alerts, geocode_address, generate_map, get_zone_coordinates
+from .tools.async_tools import get_nws_alerts, get_nws_alerts_multi, geocode_address, generate_map, get_zone_coordinates
+from .tools.alerts_summary import parse_alerts_request, build_alerts_snapshot, build_alerts_delta
+from .tools.alerts_snapshots import get_latest_snapshot, start_background_refresher
 from .tools.logging_utils import log_agent_entry, log_agent_exit
+from .tools.pipeline import staged_pipeline
+
+logger = logging.getLogger(__name__)
+
+# Pipeline used when a request does not choose one with state["alerts_mode"]:
+# "llm" runs the four-agent pipeline, "fast" builds the summary in code
+ALERTS_SNAPSHOT_MODE = os.getenv("ALERTS_SNAPSHOT_MODE", "llm")
+# How the fast path writes insights ("template" or "llm"); overridable per request with
+# state["alerts_insights"]. The LLM writer's text goes to state["alerts_insights_text"].
+ALERTS_INSIGHTS_MODE = os.getenv("ALERTS_INSIGHTS_MODE", "template")
+# Run the snapshot refresher inside this process (otherwise run `python -m shared_tools.alerts_snapshots run`)
+ALERTS_BACKGROUND_REFRESH = os.getenv("ALERTS_BACKGROUND_REFRESH", "false").lower() == "true"
+
 
 class AlertDetail(BaseModel):
     """Individual weather alert details"""
+    id: Optional[str] = Field(default=None, description="NWS alert identifier")
     event: str = Field(description="Alert event type (e.g., Tornado Warning)")
     severity: str = Field(description="Alert severity level")
     headline: str = Field(description="Alert headline")
@@ -20,6 +42,7 @@ class AlertDetail(BaseModel):
     affected_zones: List[str] = Field(description="List of affected zones")
     start_time: str = Field(description="Alert start time")
     end_time: str = Field(description="Alert end time")
+    replaces: Optional[List[str]] = Field(default=None, description="Alert ids this update supersedes (incremental mode)")
 
 
 class AlertsFormatterOutput(BaseModel):
@@ -39,6 +62,13 @@ class AlertsSummary(BaseModel):
     locations: List[str] = Field(description="List of affected locations")
     insights: str = Field(description="Summary and safety recommendations")
     map_data: Optional[Dict[str, Any]] = Field(description="Data for generating a map of alert locations")
+    snapshot_version: Optional[int] = Field(default=None, description="Precomputed snapshot version, if served from one")
+    snapshot_generated_at: Optional[str] = Field(default=None, description="When the snapshot was built")
+    snapshot_age_seconds: Optional[float] = Field(default=None, description="Age of the snapshot when served")
+    cursor: Optional[str] = Field(default=None, description="Pass back as state['alerts_since'] to get only changes next time")
+    delta: Optional[bool] = Field(default=None, description="True when alerts holds only added/updated alerts")
+    reset: Optional[bool] = Field(default=None, description="True when the client must discard its previous alert set")
+    expired_alert_ids: Optional[List[str]] = Field(default=None, description="Alert ids no longer active (incremental mode)")
 
 
 # Phase 1: Retriever Agent - Fetches alert data
@@ -50,7 +80,7 @@ retriever_agent = LlmAgent(
     You are a weather alerts data retrieval specialist.
     
     **Your Task:**
-    Retrieve active weather alerts for the requested location using the get_nws_alerts tool.
+    Retrieve active weather alerts for the requested location using the get_nws_alerts or get_nws_alerts_multi tool.
     
     **Tool Usage Guidelines:**
     
@@ -66,9 +96,16 @@ retriever_agent = LlmAgent(
     3. **For SPECIFIC COORDINATES** (if lat/lng provided):
        - Call: get_nws_alerts(latitude=37.7749, longitude=-122.4194)
     
-    4. **For MULTIPLE STATES** (e.g., "CA,TX,FL"):
-       - Make separate calls for each state
-       - Combine results before passing to formatter
+    4. **For MULTIPLE STATES OR LOCATIONS** (e.g., "CA,TX,FL", or states plus coordinates):
+       - Make ONE call: get_nws_alerts_multi(states=["CA", "TX", "FL"])
+       - Coordinates go in points as "lat,lng" strings: get_nws_alerts_multi(states=["FL"], points=["32.0809,-81.0912"])
+       - The tool fetches all locations at once and removes duplicate alerts
+       - Do NOT make separate calls per state
+    
+    5. **For SPECIFIC HAZARDS OR ZONES** (only when the user asks for them):
+       - Event types: get_nws_alerts(state="TX", event="Tornado Warning,Flash Flood Warning")
+       - Zones: get_nws_alerts(zone="FLZ069,FLZ070")
+       - These filters are applied by NWS, so pass them instead of filtering results yourself
     
     **Important:**
     - DO NOT pass state parameter for national queries
@@ -78,11 +115,12 @@ retriever_agent = LlmAgent(
     **Examples:**
     - "Get alerts for United States" → get_nws_alerts()
     - "Get alerts for California" → get_nws_alerts(state="CA")  
+    - "Get alerts for California, Texas and Florida" → get_nws_alerts_multi(states=["CA", "TX", "FL"])
     - "Get alerts for Miami coordinates" → get_nws_alerts(latitude=25.7617, longitude=-80.1918)
     
     Store the collected alert data in your response for the next agent.
     """,
-    tools=[get_nws_alerts],
+    tools=[get_nws_alerts, get_nws_alerts_multi],
     output_key="alerts_data",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
@@ -135,13 +173,15 @@ map_generator = LlmAgent(
     instruction="""
     You are a geographic data specialist. Your task is to convert NWS zone IDs into geographic coordinates and generate map data.
 
-    **Input Data from State:**
-    -   Alert data with affected_zones is available in `state['formatted_alerts'].alerts`.
-    -   Each alert has an `affected_zones` field containing NWS zone IDs (e.g., ['FLZ069', 'FLZ127']).
+    **Input Data:**
+    -   Use the alerts returned by the alerts_retriever's get_nws_alerts / get_nws_alerts_multi call
+        (also saved in `state['alerts']`). You run alongside the formatter, so do not wait for `state['formatted_alerts']`.
+    -   Each alert has an `affected_zones` field. Entries may be zone URLs
+        (e.g., 'https://api.weather.gov/zones/forecast/FLZ069'); the zone ID is the last path segment ('FLZ069').
 
     **Process:**
-    1.  **Collect All Zone IDs**: Extract all unique zone IDs from all alerts in `state['formatted_alerts'].alerts`.
-        - Iterate through each alert's `affected_zones` field
+    1.  **Collect All Zone IDs**: Extract all unique zone IDs from all retrieved alerts.
+        - Iterate through each alert's `affected_zones` field and keep only the zone ID
         - Collect all unique zone IDs into a single list
         - Remove duplicates
     
@@ -209,18 +249,182 @@ final_synthesizer = LlmAgent(
 )
 
 
-# Sequential Pipeline: Retriever → Formatter → MapGenerator → FinalSynthesizer
-alerts_snapshot_workflow = SequentialAgent(
+# Pipeline: Retriever → (Formatter ‖ MapGenerator) → FinalSynthesizer
+# The formatter and map generator both only need the retrieved alerts, so they run concurrently.
+alerts_snapshot_workflow = staged_pipeline(
     name="alerts_snapshot_pipeline",
     description="Retrieves weather alerts, generates structured analysis with safety insights, and creates a map.",
-    sub_agents=[
-        retriever_agent,
-        alerts_formatter,
-        map_generator,
-        final_synthesizer,
+    stages=[
+        (retriever_agent, []),
+        (alerts_formatter, [retriever_agent]),
+        (map_generator, [retriever_agent]),
+        (final_synthesizer, [alerts_formatter, map_generator]),
     ],
 )
 
+# Fast path: the formatter, map generator and synthesizer above only reshape data,
+# so build the AlertsSummary in code and use the LLM (optionally) for insights only.
+insights_writer = LlmAgent(
+    model="gemini-2.5-flash-lite",
+    name="alerts_insights_writer",
+    description="Writes the insights text for a prebuilt alerts summary",
+    instruction="""
+    You are a weather safety communicator.
+    
+    **Input:** An alerts summary built from live NWS data:
+    {alerts_snapshot_draft}
+    
+    **Your Task:**
+    Write 2-4 sentences summarizing the alert situation (how many alerts, the most
+    dangerous hazards, where) followed by concrete safety recommendations.
+    
+    Return ONLY the insights text - no JSON, no headings.
+    """,
+    output_key="alerts_insights_text",
+    before_model_callback=log_agent_entry,
+    after_model_callback=log_agent_exit,
+)
+
+
+def _user_text(ctx: InvocationContext) -> str:
+    """Plain text of the message that started this invocation."""
+    content = ctx.user_content
+    if not content or not content.parts:
+        return ""
+    return "".join(part.text for part in content.parts if part.text)
+
+
+class AlertsFastPathAgent(BaseAgent):
+    """Serves the latest precomputed snapshot when one is fresh; otherwise builds the
+    AlertsSummary directly from the NWS alerts API and the zone index/cache."""
+
+    insights_writer: LlmAgent
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    def __init__(self, name: str, insights_writer: LlmAgent):
+        super().__init__(
+            name=name,
+            description="Builds the alerts summary and map without LLM formatting",
+            insights_writer=insights_writer,
+            sub_agents=[insights_writer],
+        )
+
+    @staticmethod
+    def request_for(ctx: InvocationContext) -> Optional[Dict[str, Any]]:
+        """Fetch arguments from state["alerts_request"] or the message, or None if unrecognized."""
+        request = ctx.session.state.get("alerts_request")
+        if isinstance(request, dict):
+            return request
+        return parse_alerts_request(_user_text(ctx))
+
+    def _event(self, ctx: InvocationContext, state_delta: Dict[str, Any], text: Optional[str] = None) -> Event:
+        return Event(
+            author=self.name,
+            invocation_id=ctx.invocation_id,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=text)]) if text is not None else None,
+            actions=EventActions(state_delta=state_delta),
+        )
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        request = self.request_for(ctx) or {}
+        insights_mode = ctx.session.state.get("alerts_insights", ALERTS_INSIGHTS_MODE)
+        since = ctx.session.state.get("alerts_since")
+
+        # Serve the background refresher's snapshot when there is a fresh one
+        snapshot = None if since else await asyncio.to_thread(get_latest_snapshot, request)
+        if snapshot:
+            summary = dict(snapshot["summary"])
+            summary["snapshot_version"] = snapshot["version"]
+            summary["snapshot_generated_at"] = snapshot["generated_at"]
+            summary["snapshot_age_seconds"] = snapshot["age_seconds"]
+            logger.info(f"Serving alerts snapshot v{snapshot['version']} for {snapshot['scope']} ({snapshot['age_seconds']}s old)")
+        else:
+            # Network-bound and synchronous; keep it off the event loop
+            if since:
+                # Incremental polling: only alerts changed since the client's cursor
+                result = await asyncio.to_thread(build_alerts_delta, request, since)
+            else:
+                result = await asyncio.to_thread(build_alerts_snapshot, request)
+            if result["status"] != "success":
+                logger.error(f"Alerts fast path failed: {result.get('message')}")
+                summary = {
+                    "alerts": [],
+                    "total_count": 0,
+                    "severe_count": 0,
+                    "locations": [],
+                    "insights": f"Unable to retrieve weather alerts right now: {result.get('message')}",
+                    "map_data": None,
+                }
+                summary = AlertsSummary(**summary).model_dump()
+                yield self._event(ctx, {"final_summary": summary}, text=json.dumps(summary))
+                return
+            summary = result["summary"]
+
+        # Snapshots and live summaries carry template insights; rewrite them on request
+        if insights_mode == "llm":
+            draft = {key: value for key, value in summary.items() if key != "map_data"}
+            # Clear the previous request's text so an empty rewrite keeps the template insights
+            yield self._event(ctx, {"alerts_snapshot_draft": json.dumps(draft), "alerts_insights_text": None})
+            async for event in self.insights_writer.run_async(ctx):
+                yield event
+            summary["insights"] = ctx.session.state.get("alerts_insights_text") or summary["insights"]
+
+        summary = AlertsSummary(**summary).model_dump()
+        yield self._event(ctx, {"final_summary": summary}, text=json.dumps(summary))
+
+
+class AlertsSnapshotRouter(BaseAgent):
+    """Runs the code-only fast path or the LLM pipeline, per request.
+
+    The mode comes from state["alerts_mode"] ("fast" or "llm", default ALERTS_SNAPSHOT_MODE);
+    incremental polls (state["alerts_since"] set to "start" or a previous cursor) use
+    the fast path. Requests the fast path cannot parse (cities, addresses, free-form
+    questions) always go to the LLM pipeline.
+    """
+
+    fast_path: AlertsFastPathAgent
+    pipeline: SequentialAgent
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    def __init__(self, name: str, fast_path: AlertsFastPathAgent, pipeline: SequentialAgent):
+        super().__init__(
+            name=name,
+            description=pipeline.description,
+            fast_path=fast_path,
+            pipeline=pipeline,
+            sub_agents=[fast_path, pipeline],
+        )
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        mode = ctx.session.state.get("alerts_mode", ALERTS_SNAPSHOT_MODE)
+        # Incremental polls (state["alerts_since"]) are only supported by the fast path
+        wants_fast = mode == "fast" or bool(ctx.session.state.get("alerts_since"))
+        if wants_fast and self.fast_path.request_for(ctx) is not None:
+            agent = self.fast_path
+        else:
+            agent = self.pipeline
+        logger.info(f"Alerts snapshot mode={mode}, running {agent.name}")
+
+        async for event in agent.run_async(ctx):
+            yield event
+
+
+alerts_fast_path = AlertsFastPathAgent(name="alerts_fast_path", insights_writer=insights_writer)
+
+if ALERTS_BACKGROUND_REFRESH:
+    start_background_refresher()
+
+alerts_snapshot_router = AlertsSnapshotRouter(
+    name="alerts_snapshot_router",
+    fast_path=alerts_fast_path,
+    pipeline=alerts_snapshot_workflow,
+)
+
+
 # ADK export pattern
-# The root agent is the full workflow. The final output will be under the 'final_summary' key.
-root_agent = alerts_snapshot_workflow
+# The root agent routes between the fast path and the full workflow. The final
+# output will be under the 'final_summary' key either way.
+root_agent = alerts_snapshot_router
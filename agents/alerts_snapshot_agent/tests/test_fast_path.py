@@ -0,0 +1,80 @@
+import json
+import asyncio
+from typing import List
+
+from google.adk.agents import LlmAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_response import LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from alerts_snapshot_agent import agent as alerts_agent
+
+TEMPLATE_INSIGHTS = "No active alerts for Florida."
+
+
+class ScriptedLlm(BaseLlm):
+    """Answers each call with the next scripted text (None: a response without text)."""
+
+    replies: List = []
+
+    async def generate_content_async(self, llm_request, stream=False):
+        text = self.replies.pop(0)
+        parts = [types.Part(text=text)] if text is not None else []
+        yield LlmResponse(content=types.Content(role="model", parts=parts))
+
+
+def snapshot(request, max_age=None):
+    summary = {
+        "alerts": [], "total_count": 0, "severe_count": 0, "locations": [],
+        "insights": TEMPLATE_INSIGHTS, "map_data": None
+    }
+    return {"summary": summary, "version": 7, "generated_at": "2026-10-18T07:00:00+00:00", "age_seconds": 12.0, "scope": "FL"}
+
+
+def run_requests(monkeypatch, replies, state):
+    monkeypatch.setattr(alerts_agent, "get_latest_snapshot", snapshot)
+    writer = LlmAgent(
+        model=ScriptedLlm(model="scripted", replies=list(replies)),
+        name=alerts_agent.insights_writer.name,
+        instruction=alerts_agent.insights_writer.instruction,
+        output_key=alerts_agent.insights_writer.output_key,
+    )
+    fast_path = alerts_agent.AlertsFastPathAgent(name="alerts_fast_path", insights_writer=writer)
+    runner = InMemoryRunner(agent=fast_path, app_name="alerts_test")
+
+    async def run():
+        session = await runner.session_service.create_session(app_name="alerts_test", user_id="user", state=state)
+        summaries = []
+        for _ in replies:
+            message = types.Content(role="user", parts=[types.Part(text="Get alerts for Florida")])
+            final = None
+            async for event in runner.run_async(user_id="user", session_id=session.id, new_message=message):
+                if event.author == fast_path.name and event.content and event.content.parts:
+                    final = json.loads(event.content.parts[0].text)
+            summaries.append(final)
+        session = await runner.session_service.get_session(app_name="alerts_test", user_id="user", session_id=session.id)
+        return summaries, session.state
+
+    return asyncio.run(run())
+
+
+def test_llm_insights_mode_survives_the_rewrite(monkeypatch):
+    summaries, state = run_requests(monkeypatch, ["Flood watch first.", "Flood watch second."], {"alerts_insights": "llm"})
+
+    assert [summary["insights"] for summary in summaries] == ["Flood watch first.", "Flood watch second."]
+    assert state["alerts_insights"] == "llm"
+    assert summaries[0]["snapshot_version"] == 7
+
+
+def test_empty_rewrite_keeps_the_template_insights(monkeypatch):
+    summaries, _ = run_requests(monkeypatch, ["Flood watch first.", None], {"alerts_insights": "llm"})
+
+    assert summaries[1]["insights"] == TEMPLATE_INSIGHTS
+
+
+def test_template_mode_does_not_call_the_model(monkeypatch):
+    summaries, state = run_requests(monkeypatch, ["unused"], {"alerts_insights": "template"})
+
+    assert summaries[0]["insights"] == TEMPLATE_INSIGHTS
+    assert "alerts_insights_text" not in state
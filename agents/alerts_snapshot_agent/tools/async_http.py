@@ -0,0 +1,129 @@
+import os
+import asyncio
+import logging
+import weakref
+from typing import Dict, Any, Optional
+
+import httpx
+
+from .http_client import HTTP_POOL_SIZE, HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_RETRY_STATUS_CODES
+from .rate_limit import limiter_for_url, retry_after_seconds, THROTTLE_STATUS_CODES
+from .circuit_breaker import breaker_for_url, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+# Connections the shared async client may open across all hosts
+ASYNC_HTTP_MAX_CONNECTIONS = int(os.getenv("ASYNC_HTTP_MAX_CONNECTIONS", "100"))
+
+# httpx clients are bound to the event loop they were first used on, so keep one per loop
+# (the ADK server runs a single loop, so in practice this is one shared client)
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the shared keep-alive AsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=ASYNC_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_POOL_SIZE
+            ),
+            headers={"Accept-Encoding": "gzip, deflate"},
+            follow_redirects=True
+        )
+        _clients[loop] = client
+        logger.info(f"Created shared async HTTP client (max {ASYNC_HTTP_MAX_CONNECTIONS} connections)")
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the running loop's client (e.g. on server shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def async_http_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    stream: bool = False
+) -> httpx.Response:
+    """Async GET over the shared client, with the same retry policy as http_get.
+
+    429 and 5xx responses and connection errors are retried up to HTTP_MAX_RETRIES
+    times with exponential backoff, honoring Retry-After. Every attempt waits for
+    the upstream's rate limiter (see rate_limit.py).
+
+    Args:
+        url (str): Absolute URL to fetch
+        params (dict): Optional query string parameters
+        headers (dict): Optional request headers
+        timeout (float): Timeout in seconds
+        stream (bool): Defer downloading the body (read it with aiter_bytes() and
+            close the response with aclose())
+
+    Returns:
+        httpx.Response: The response (retries already applied)
+
+    Raises:
+        CircuitOpenError: The upstream's circuit is open (see circuit_breaker.py)
+    """
+    breaker = breaker_for_url(url)
+    if breaker and not breaker.allow():
+        raise CircuitOpenError(f"{breaker.name} circuit open; not calling {url}")
+    try:
+        response = await _send_with_retries(url, params, headers, timeout, stream)
+    except httpx.TransportError:
+        if breaker:
+            breaker.record_failure()
+        raise
+    if breaker:
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    return response
+
+
+async def _send_with_retries(
+    url: str,
+    params: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+    timeout: float,
+    stream: bool
+) -> httpx.Response:
+    client = get_async_client()
+    limiter = limiter_for_url(url)
+    request = client.build_request("GET", url, params=params, headers=headers, timeout=timeout)
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        backoff = HTTP_BACKOFF_FACTOR * (2 ** attempt)
+        if limiter:
+            await limiter.aacquire()
+        try:
+            response = await client.send(request, stream=stream)
+        except httpx.TransportError as e:
+            if attempt >= HTTP_MAX_RETRIES:
+                raise
+            logger.warning(f"GET {url} failed ({str(e)}); retrying in {backoff:.1f}s")
+            await asyncio.sleep(backoff)
+            continue
+
+        delay = retry_after_seconds(response)
+        if limiter and response.status_code in THROTTLE_STATUS_CODES:
+            limiter.throttled(delay)
+        elif limiter and response.status_code < 400:
+            limiter.succeeded()
+
+        if response.status_code not in HTTP_RETRY_STATUS_CODES or attempt >= HTTP_MAX_RETRIES:
+            return response
+
+        await response.aclose()
+        if delay is None or (limiter and response.status_code in THROTTLE_STATUS_CODES):
+            delay = backoff  # The limiter already waits out Retry-After before the next attempt
+        logger.warning(f"GET {url} returned {response.status_code}; retrying in {delay:.1f}s")
+        await asyncio.sleep(delay)
+    return response
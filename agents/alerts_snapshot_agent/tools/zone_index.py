@@ -0,0 +1,219 @@
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+import logging
+import threading
+from typing import Dict, Any, Optional, List
+
+from .geometry import polygon_stats
+
+logger = logging.getLogger(__name__)
+
+# Location of the prebuilt index; by default it ships next to this module
+ZONE_INDEX_PATH = os.getenv(
+    "ZONE_INDEX_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "zones.idx")
+)
+
+# File layout (little-endian):
+#   header  : magic, record count, slot count, offset of the name table
+#   slots   : open-addressing hash table of 1-based record numbers (0 = empty)
+#   records : zone_id, lat, lon, bbox (min_lon, min_lat, max_lon, max_lat; min_lon > max_lon when the
+#             zone crosses the antimeridian), name offset/length, type
+#   names   : UTF-8 zone names
+_MAGIC = b"NWSZIDX1"
+_HEADER = struct.Struct("<8sIII")
+_SLOT = struct.Struct("<I")
+_RECORD = struct.Struct("<8s6fIHB")
+
+_ZONE_TYPES = ["forecast", "county", "fire"]
+# NWS zone dump "type" property -> zone type used by the tools
+_DUMP_TYPES = {"public": "forecast", "forecast": "forecast", "county": "county", "fire": "fire"}
+
+
+def _slot_hash(zone_id: bytes) -> int:
+    return zlib.crc32(zone_id)
+
+
+def build_zone_index(dump_paths: List[str], output_path: str = ZONE_INDEX_PATH) -> int:
+    """Build the zone index from bulk NWS zone dumps.
+
+    Each dump is a GeoJSON FeatureCollection of forecast, county or fire zones
+    (e.g. https://api.weather.gov/zones?type=forecast with geometry, or a zone
+    shapefile converted with ogr2ogr -f GeoJSON). When the same ID appears as more
+    than one zone type, the forecast/county zone wins over the fire zone, matching
+    how get_zone_coordinates resolves IDs.
+
+    Args:
+        dump_paths (list[str]): GeoJSON files to ingest
+        output_path (str): Where to write the index
+
+    Returns:
+        int: Number of zones in the index
+    """
+    zones: Dict[str, Dict[str, Any]] = {}
+    for path in dump_paths:
+        with open(path, "r", encoding="utf-8") as f:
+            collection = json.load(f)
+
+        for feature in collection.get("features", []):
+            props = feature.get("properties") or {}
+            geometry = feature.get("geometry")
+            zone_id = (props.get("id") or "").upper()
+            if not zone_id or not geometry or len(zone_id.encode("ascii", "ignore")) > 8:
+                continue
+
+            zone_type = _DUMP_TYPES.get(str(props.get("type", "")).lower(), "forecast")
+            existing = zones.get(zone_id)
+            if existing and (zone_type == "fire" or existing["type"] != "fire"):
+                continue
+
+            stats = polygon_stats(geometry)
+            if not stats:
+                continue
+
+            zones[zone_id] = {
+                "lat": stats["centroid"]["lat"],
+                "lon": stats["centroid"]["lon"],
+                "bbox": stats["bbox"],
+                "name": props.get("name") or zone_id,
+                "type": zone_type
+            }
+        logger.info(f"Ingested {path}: {len(zones)} zones so far")
+
+    zone_ids = sorted(zones)
+    slot_count = 1
+    while slot_count < max(2 * len(zone_ids), 8):
+        slot_count *= 2
+
+    slots = [0] * slot_count
+    records = bytearray()
+    names = bytearray()
+    for number, zone_id in enumerate(zone_ids, start=1):
+        zone = zones[zone_id]
+        key = zone_id.encode("ascii")
+        name = zone["name"].encode("utf-8")[:0xFFFF].decode("utf-8", "ignore").encode("utf-8")  # Cut on a character boundary
+
+        records += _RECORD.pack(
+            key, zone["lat"], zone["lon"], *zone["bbox"],
+            len(names), len(name), _ZONE_TYPES.index(zone["type"])
+        )
+        names += name
+
+        slot = _slot_hash(key) & (slot_count - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = number
+
+    names_offset = _HEADER.size + slot_count * _SLOT.size + len(records)
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(zone_ids), slot_count, names_offset))
+        f.write(struct.pack(f"<{slot_count}I", *slots))
+        f.write(records)
+        f.write(names)
+    os.replace(tmp_path, output_path)
+
+    logger.info(f"Wrote zone index with {len(zone_ids)} zones to {output_path}")
+    return len(zone_ids)
+
+
+class ZoneIndex:
+    """Read-only, memory-mapped view of a zone index file.
+
+    Opening only maps the file; each lookup is a hash probe that touches a few pages.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count, self._slot_count, self._names_offset = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a zone index")
+        self._records_offset = _HEADER.size + self._slot_count * _SLOT.size
+
+    def lookup(self, zone_id: str) -> Optional[Dict[str, Any]]:
+        """Get the indexed record for a zone ID, or None if unknown."""
+        key = zone_id.upper().encode("ascii", "ignore")
+        if not key or len(key) > 8:
+            return None
+
+        padded = key.ljust(8, b"\0")
+        mask = self._slot_count - 1
+        slot = _slot_hash(key) & mask
+        for _ in range(self._slot_count):
+            (number,) = _SLOT.unpack_from(self._map, _HEADER.size + slot * _SLOT.size)
+            if number == 0:
+                return None
+
+            fields = _RECORD.unpack_from(self._map, self._records_offset + (number - 1) * _RECORD.size)
+            if fields[0] == padded:
+                _, lat, lon, min_lon, min_lat, max_lon, max_lat, name_offset, name_length, type_code = fields
+                start = self._names_offset + name_offset
+                return {
+                    "zone_id": zone_id.upper(),
+                    "latitude": round(lat, 4),
+                    "longitude": round(lon, 4),
+                    "name": self._map[start:start + name_length].decode("utf-8"),
+                    "type": _ZONE_TYPES[type_code],
+                    "bbox": [round(min_lon, 4), round(min_lat, 4), round(max_lon, 4), round(max_lat, 4)]
+                }
+            slot = (slot + 1) & mask
+        return None
+
+    def __len__(self) -> int:
+        return self.count
+
+
+_index: Optional[ZoneIndex] = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def get_zone_index() -> Optional[ZoneIndex]:
+    """Open the zone index on first use; None when no index has been built."""
+    global _index, _index_loaded
+    if not _index_loaded:
+        with _index_lock:
+            if not _index_loaded:
+                if os.path.exists(ZONE_INDEX_PATH):
+                    try:
+                        _index = ZoneIndex(ZONE_INDEX_PATH)
+                        logger.info(f"Loaded zone index with {len(_index)} zones from {ZONE_INDEX_PATH}")
+                    except Exception as e:
+                        logger.warning(f"Could not open zone index {ZONE_INDEX_PATH}: {str(e)}")
+                _index_loaded = True
+    return _index
+
+
+def lookup_zone(zone_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a zone in the offline index, or None if it is not indexed."""
+    index = get_zone_index()
+    return index.lookup(zone_id) if index else None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python -m shared_tools.zone_index build <zones.geojson>... | lookup <zone_id>..."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2 or argv[0] not in ("build", "lookup"):
+        print("Usage: python -m shared_tools.zone_index build <zones.geojson> [...] | lookup <zone_id> [...]")
+        return 2
+
+    if argv[0] == "build":
+        count = build_zone_index(argv[1:])
+        print(f"Indexed {count} zones into {ZONE_INDEX_PATH}")
+    else:
+        for zone_id in argv[1:]:
+            print(json.dumps(lookup_zone(zone_id)))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
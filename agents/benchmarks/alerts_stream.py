@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Compare the national alerts path before and after streaming: json.loads of the whole
+/alerts/active feed plus build-every-alert-and-sort, versus the incremental top-k
+parser in shared_tools/alerts_stream.py. Reports wall time and peak Python memory.
+
+Record a feed once, then benchmark against it so runs are comparable:
+
+    cd agents
+    python benchmarks/alerts_stream.py --record alerts_active.json
+    python benchmarks/alerts_stream.py --feed alerts_active.json --runs 5
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import tracemalloc
+import importlib.util
+
+AGENTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ALERTS_URL = "https://api.weather.gov/alerts/active"
+CHUNK_SIZE = 64 * 1024
+
+# Load the module by path so the benchmark does not import the ADK via shared_tools/__init__
+_spec = importlib.util.spec_from_file_location(
+    "alerts_stream", os.path.join(AGENTS_DIR, "shared_tools", "alerts_stream.py")
+)
+alerts_stream = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(alerts_stream)
+
+
+def record_feed(path: str) -> None:
+    """Download the live national feed to path."""
+    import requests
+
+    response = requests.get(
+        ALERTS_URL,
+        headers={"User-Agent": "(WeatherAdvisor benchmark)", "Accept": "application/geo+json"},
+        timeout=30
+    )
+    response.raise_for_status()
+    with open(path, "wb") as f:
+        f.write(response.content)
+    print(f"Recorded {len(response.content) / 1e6:.2f} MB to {path}")
+
+
+def full_parse(raw: bytes, severity=None):
+    """The original path: materialize everything, build every alert, sort, keep 5."""
+    data = json.loads(raw)
+    alerts = []
+    for feature in data.get("features", []):
+        props = feature.get("properties", {})
+        if severity and props.get("severity") != severity:
+            continue
+        alerts.append(alerts_stream.format_alert(props))
+    alerts.sort(key=lambda x: alerts_stream.SEVERITY_PRIORITY.get(x["severity"], 4))
+    return len(alerts), alerts[:5]
+
+
+def streaming_parse(raw: bytes, severity=None):
+    """The streaming path, fed in network-sized chunks."""
+    chunks = (raw[i:i + CHUNK_SIZE] for i in range(0, len(raw), CHUNK_SIZE))
+    summary = alerts_stream.summarize_alerts(
+        alerts_stream.iter_feature_properties(chunks, defer=alerts_stream.LONG_TEXT_FIELDS),
+        top_k=10, severity=severity
+    )
+    return summary["total_count"], summary["alerts"][:5]
+
+
+def measure(func, raw: bytes, runs: int, severity=None):
+    """Median wall time over runs, plus peak traced memory of one extra run."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(raw, severity)
+        samples.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    total, _ = func(raw, severity)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "total_count": total,
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "min_ms": round(min(samples) * 1000, 1),
+        "peak_mb": round(peak / 1e6, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--record", metavar="PATH", help="Save the live national feed to PATH and exit")
+    parser.add_argument("--feed", metavar="PATH", help="Recorded /alerts/active response to benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--severity", help="Optional severity filter, e.g. Severe")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    if args.record:
+        record_feed(args.record)
+        return 0
+    if not args.feed:
+        parser.error("--feed is required (record one with --record)")
+
+    with open(args.feed, "rb") as f:
+        raw = f.read()
+
+    results = {
+        "feed_mb": round(len(raw) / 1e6, 2),
+        "full_parse": measure(full_parse, raw, args.runs, args.severity),
+        "streaming": measure(streaming_parse, raw, args.runs, args.severity),
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"feed: {results['feed_mb']} MB")
+        print(f"{'path':12} {'alerts':>8} {'median ms':>10} {'min ms':>10} {'peak MB':>10}")
+        for name in ("full_parse", "streaming"):
+            stats = results[name]
+            print(f"{name:12} {stats['total_count']:>8} {stats['median_ms']:>10} {stats['min_ms']:>10} {stats['peak_mb']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
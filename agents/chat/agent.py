@@ -1,7 +1,8 @@
 from google.adk.agents import LlmAgent
 from google.adk.tools.agent_tool import AgentTool
 # Import the actual workflow agents
-from .sub_agents.alerts_snapshot_agent.agent import alerts_snapshot_workflow
+# The router picks the code-only fast path (snapshots, since= polling) or the LLM pipeline per request
+from .sub_agents.alerts_snapshot_agent.agent import alerts_snapshot_router
 from .sub_agents.forecast_agent.agent import forecast_workflow
 from .sub_agents.risk_analysis_agent.agent import risk_analysis_workflow
 from .sub_agents.emergency_resources_agent.agent import emergency_resources_workflow
@@ -47,7 +48,7 @@ chat_orchestrator = LlmAgent(
     **ROUTING LOGIC:**
     Analyze the user's query and use the appropriate tool:
     
-    - **Alerts/Warnings/Watches** → alerts_snapshot_pipeline
+    - **Alerts/Warnings/Watches** → alerts_snapshot_router
       Keywords: alert, warning, watch, severe, emergency alert, active alerts
       Example: "What alerts are active in California?"
     
@@ -74,7 +75,7 @@ chat_orchestrator = LlmAgent(
     - Pass the user's query directly to the selected workflow
     """,
     tools=[
-        AgentTool(alerts_snapshot_workflow),
+        AgentTool(alerts_snapshot_router),
         AgentTool(forecast_workflow),
         AgentTool(risk_analysis_workflow),
         AgentTool(emergency_resources_workflow),
@@ -1,8 +1,9 @@
 from typing import List, Optional, Dict
-from google.adk.agents import LlmAgent, SequentialAgent
+from google.adk.agents import LlmAgent
 from pydantic import BaseModel, Field
-from ...tools import geocode_address, search_nearby_places, get_directions
+from ...tools.async_tools import geocode_address, search_nearby_places_multi, get_directions
 from ...tools.logging_utils import log_agent_entry, log_agent_exit
+from ...tools.pipeline import staged_pipeline
 
 class Coordinates(BaseModel):
     """Geographic coordinates"""
@@ -52,28 +53,29 @@ location_parser = LlmAgent(
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
 )
-# Phase 2: Resource Finder
+# Phase 2: Resource Finder - every category in one batched search
 resource_finder = LlmAgent(
     model="gemini-2.5-flash-lite",
     name="resource_finder",
-    description="Finds emergency resources (shelters, hospitals, pharmacies) near a location based on user-specified type and radius.",
+    description="Finds shelters, hospitals and pharmacies near the geocoded location",
     instruction="""
-    You are a dynamic emergency resource locator.
+    You are an emergency resource locator.
 
     **CONTEXT:**
-    The user has provided a `location`, a `resourceType` (e.g., 'shelters', 'hospitals', 'pharmacies'), and a `radius`.
-    The previous agent has geocoded the location and stored it in `state['location_data']`.
+    The user has provided a `location`, optionally a `resourceType` (e.g., 'shelters', 'hospitals', 'pharmacies'), and a `radius`.
+    The location parser has geocoded the location and stored it in `state['location_data']`.
 
     **YOUR TASK:**
-    1.  Identify the `resourceType` and `radius` from the initial user input, which are available in the `state`.
-    2.  Map the `resourceType` to the correct `place_type` for the tool:
-        - 'shelters' -> 'emergency shelter'
-        - 'hospitals' -> 'hospital'
-        - 'pharmacies' -> 'pharmacy'
-    3.  Call the `search_nearby_places` tool using the coordinates from `state['location_data']`, the user's `radius`, and the correct `place_type`.
-    4.  Store the results for the next agent.
+    1.  Call the `search_nearby_places_multi` tool ONCE with the coordinates from `state['location_data']`
+        and the user's `radius` (if given):
+        - hospitals: place_types ["hospital"]
+        - pharmacies: place_types ["pharmacy"]
+        - shelters: keywords ["emergency shelter"]
+        Search only the requested `resourceType`, or all three when none is given.
+    2.  Each returned place lists the `categories` that matched it and its `distance_km`; the list is nearest first.
+    3.  Store the results for the next agents.
     """,
-    tools=[search_nearby_places],
+    tools=[search_nearby_places_multi],
     output_key="facilities",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
@@ -92,8 +94,9 @@ route_calculator = LlmAgent(
     
     **Process:**
     1. Extract origin location from state["location_data"]["formatted_address"]
-    2. Identify safe destinations (use nearest shelters from state["facilities"])
-    3. For top 3 nearest shelters, use get_directions tool:
+    2. Identify safe destinations: the nearest shelters (category "emergency shelter") from
+       state["facilities"]; if no shelters were searched or found, use the nearest other facilities
+    3. For the top 3 nearest destinations, use get_directions tool:
        - origin: from state["location_data"]["formatted_address"]
        - destination: shelter address
        - alternatives: true (to get multiple route options)
@@ -122,13 +125,13 @@ final_synthesizer = LlmAgent(
     You are the final assembly agent. Your only job is to take the data collected by the previous agents and structure it into the final `EmergencyResourcesSummary` JSON object.
 
     **CONTEXT:**
-    - The `state['facilities']` key contains a list of found facilities (shelters, hospitals, or pharmacies).
+    - The `state['facilities']` key contains the facilities found, nearest first; each lists the `categories`
+      that matched it ("hospital", "pharmacy" or "emergency shelter") and its `distance_km`.
     - The `state['routes']` key contains a list of calculated evacuation routes.
-    - The `state['input']['resourceType']` contains the type of resource the user searched for.
 
     **YOUR TASK:**
     1.  Create the `EmergencyResourcesSummary` object.
-    2.  Populate the correct facility list (`shelters`, `hospitals`, or `pharmacies`) using the data from `state['facilities']`.
+    2.  Populate `shelters`, `hospitals` and `pharmacies` from `state['facilities']` by category, converting distance to miles (empty list when not requested or none found).
     3.  Populate the `evacuation_routes` list using the data from `state['routes']`.
     4.  Generate a brief, helpful summary for the `insights` field based on what was found.
 
@@ -140,14 +143,14 @@ final_synthesizer = LlmAgent(
     after_model_callback=log_agent_exit,
 )
 
-# Sequential Pipeline: Location -> Resources -> Routes -> Format
-emergency_resources_workflow = SequentialAgent(
+# Pipeline: Location -> Resources -> Routes -> Format
+emergency_resources_workflow = staged_pipeline(
     name="emergency_resources_pipeline",
     description="Finds emergency shelters, hospitals, and evacuation routes near a location with distance-sorted recommendations",
-    sub_agents=[
-        location_parser,
-        resource_finder,
-        route_calculator,
-        final_synthesizer,
+    stages=[
+        (location_parser, []),
+        (resource_finder, [location_parser]),
+        (route_calculator, [location_parser, resource_finder]),
+        (final_synthesizer, [resource_finder, route_calculator]),
     ],
 )
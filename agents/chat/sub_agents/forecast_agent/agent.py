@@ -1,8 +1,9 @@
 from typing import List, Dict
-from google.adk.agents import LlmAgent, SequentialAgent
+from google.adk.agents import LlmAgent
 from pydantic import BaseModel, Field
-from ...tools import geocode_address, get_nws_forecast
+from ...tools.async_tools import geocode_address, get_nws_forecast
 from ...tools.logging_utils import log_agent_entry, log_agent_exit
+from ...tools.pipeline import staged_pipeline
 
 class DailyForecast(BaseModel):
     """Individual day forecast"""
@@ -79,13 +80,14 @@ formatter = LlmAgent(
 )
 
 # Sequential Pipeline: Geocoding -> Retrieval -> Formatting
-forecast_workflow = SequentialAgent(
+# Each stage reads the previous stage's output, so there is nothing to run concurrently
+forecast_workflow = staged_pipeline(
     name="forecast_pipeline",
     description="Geocodes location, retrieves weather forecast, and generates structured analysis with planning insights",
-    sub_agents=[
-        geocoder,
-        retriever,
-        formatter,
+    stages=[
+        (geocoder, []),
+        (retriever, [geocoder]),
+        (formatter, [retriever]),
     ],
 )
 
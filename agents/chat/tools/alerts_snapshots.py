@@ -0,0 +1,252 @@
+import os
+import sys
+import json
+import time
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Iterable
+
+from .cache import CACHE_DIR
+from .http_client import http_get
+from .alerts_stream import iter_feature_properties, summarize_alerts
+from .alerts_summary import build_alerts_summary, US_STATE_CODES
+from .tools import NWS_API_BASE, NWS_HEADERS, NATIONAL_ALERTS_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+# SQLite file holding versioned alerts snapshots (shared by the refresher and the agents)
+ALERTS_SNAPSHOT_PATH = os.getenv("ALERTS_SNAPSHOT_PATH", os.path.join(CACHE_DIR, "alerts_snapshots.sqlite3"))
+# Seconds between refreshes when running the refresher loop
+ALERTS_REFRESH_INTERVAL = float(os.getenv("ALERTS_REFRESH_INTERVAL", "120"))
+# Snapshots older than this are not served; the agent builds a live summary instead
+ALERTS_SNAPSHOT_MAX_AGE = float(os.getenv("ALERTS_SNAPSHOT_MAX_AGE", "600"))
+# Versions kept per scope
+ALERTS_SNAPSHOT_KEEP = int(os.getenv("ALERTS_SNAPSHOT_KEEP", "20"))
+
+NATIONAL_SCOPE = "US"
+_STATE_CODES = sorted(set(US_STATE_CODES.values()))
+
+
+class AlertsSnapshotStore:
+    """Versioned AlertsSummary snapshots per scope ("US" or a state code) in SQLite.
+
+    Safe to share between a refresher process and any number of agent processes.
+    """
+
+    def __init__(self, path: str = ALERTS_SNAPSHOT_PATH, keep: int = ALERTS_SNAPSHOT_KEEP):
+        self.path = path
+        self.keep = keep
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        """Open the store on first use (caller holds the lock)."""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " scope TEXT NOT NULL,"
+                " version INTEGER NOT NULL,"
+                " generated_at REAL NOT NULL,"
+                " summary TEXT NOT NULL,"
+                " PRIMARY KEY (scope, version))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def put_many(self, summaries: Dict[str, Dict[str, Any]], generated_at: Optional[float] = None) -> int:
+        """Store one new version for each scope in a single transaction.
+
+        Returns:
+            int: The version number written (shared by every scope in this batch)
+        """
+        generated_at = generated_at or time.time()
+        with self._lock:
+            conn = self._db()
+            with conn:
+                row = conn.execute("SELECT COALESCE(MAX(version), 0) FROM snapshots").fetchone()
+                version = row[0] + 1
+                conn.executemany(
+                    "INSERT INTO snapshots (scope, version, generated_at, summary) VALUES (?, ?, ?, ?)",
+                    [
+                        (scope, version, generated_at, json.dumps(summary))
+                        for scope, summary in summaries.items()
+                    ]
+                )
+                conn.execute("DELETE FROM snapshots WHERE version <= ?", (version - self.keep,))
+        return version
+
+    def latest(self, scope: str) -> Optional[Dict[str, Any]]:
+        """Get the newest snapshot for a scope with its version and age, or None."""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT version, generated_at, summary FROM snapshots"
+                " WHERE scope = ? ORDER BY version DESC LIMIT 1",
+                (scope.upper(),)
+            ).fetchone()
+        if not row:
+            return None
+        version, generated_at, summary = row
+        return {
+            "scope": scope.upper(),
+            "version": version,
+            "generated_at": datetime.fromtimestamp(generated_at).isoformat(),
+            "age_seconds": round(time.time() - generated_at, 1),
+            "summary": json.loads(summary)
+        }
+
+    def versions(self, scope: str) -> List[int]:
+        """Stored versions for a scope, newest first."""
+        with self._lock:
+            rows = self._db().execute(
+                "SELECT version FROM snapshots WHERE scope = ? ORDER BY version DESC", (scope.upper(),)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+_store: Optional[AlertsSnapshotStore] = None
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> AlertsSnapshotStore:
+    """Get the process-wide snapshot store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = AlertsSnapshotStore()
+    return _store
+
+
+def snapshot_scope(request: Dict[str, Any]) -> Optional[str]:
+    """Scope a parsed alerts request can be served from: "US", a single state, or None."""
+    if not request:
+        return NATIONAL_SCOPE
+    states = request.get("states") or []
+    if list(request) == ["states"] and len(states) == 1:
+        return states[0].upper()
+    return None
+
+
+def get_latest_snapshot(request: Dict[str, Any], max_age: float = ALERTS_SNAPSHOT_MAX_AGE) -> Optional[Dict[str, Any]]:
+    """Latest snapshot for a parsed request if one exists and is fresh enough, else None."""
+    scope = snapshot_scope(request)
+    if scope is None or not os.path.exists(get_snapshot_store().path):
+        return None
+    try:
+        snapshot = get_snapshot_store().latest(scope)
+    except sqlite3.Error as e:
+        logger.warning(f"Alerts snapshot store unavailable: {str(e)}")
+        return None
+    if snapshot is None or snapshot["age_seconds"] > max_age:
+        return None
+    return snapshot
+
+
+def _alert_states(props: Dict[str, Any]) -> set:
+    """State codes an alert applies to, from its UGC zone codes (e.g. FLZ069 -> FL)."""
+    zones = (props.get("geocode") or {}).get("UGC") or [
+        zone.rstrip("/").rsplit("/", 1)[-1] for zone in props.get("affectedZones") or []
+    ]
+    return {zone[:2].upper() for zone in zones if zone[:2].upper() in _STATE_CODES}
+
+
+def _scope_result(properties: Iterable[Dict[str, Any]], national: bool) -> Dict[str, Any]:
+    """Rank one scope's alerts the way fetch_nws_alerts does (top 5 nationally, 10 per state)."""
+    summary = summarize_alerts(properties, top_k=10)
+    alerts = summary["alerts"]
+    if national and summary["total_count"] > 10:
+        alerts = alerts[:5]
+    return {
+        "status": "success",
+        "alerts": alerts,
+        "total_count": summary["total_count"],
+        "severity_breakdown": summary["severity_breakdown"]
+    }
+
+
+def build_snapshots() -> Dict[str, Dict[str, Any]]:
+    """Download /alerts/active once and build the national and per-state AlertsSummary dicts."""
+    response = http_get(f"{NWS_API_BASE}/alerts/active", headers=NWS_HEADERS, timeout=30, stream=True)
+    try:
+        response.raise_for_status()
+        properties = list(iter_feature_properties(response.iter_content(NATIONAL_ALERTS_CHUNK_SIZE)))
+    finally:
+        response.close()
+
+    by_state: Dict[str, List[Dict[str, Any]]] = {code: [] for code in _STATE_CODES}
+    for props in properties:
+        for code in _alert_states(props):
+            by_state[code].append(props)
+
+    summaries = {NATIONAL_SCOPE: build_alerts_summary(_scope_result(properties, national=True))}
+    for code, state_properties in by_state.items():
+        summaries[code] = build_alerts_summary(
+            _scope_result(state_properties, national=False),
+            include_map=bool(state_properties)
+        )
+    logger.info(f"Built alerts snapshots for {len(summaries)} scopes from {len(properties)} alerts")
+    return summaries
+
+
+def refresh_alerts_snapshots(store: Optional[AlertsSnapshotStore] = None) -> int:
+    """Build and store one new snapshot version.
+
+    Returns:
+        int: The version written
+    """
+    start = time.perf_counter()
+    summaries = build_snapshots()
+    version = (store or get_snapshot_store()).put_many(summaries)
+    logger.info(f"Stored alerts snapshot version {version} in {time.perf_counter() - start:.1f}s")
+    return version
+
+
+def run_refresher(interval: float = ALERTS_REFRESH_INTERVAL, stop_event: Optional[threading.Event] = None) -> None:
+    """Refresh snapshots every interval seconds until stop_event is set; failures are logged and retried."""
+    stop_event = stop_event or threading.Event()
+    while not stop_event.is_set():
+        started = time.monotonic()
+        try:
+            refresh_alerts_snapshots()
+        except Exception as e:
+            logger.error(f"Alerts snapshot refresh failed: {str(e)}")
+        stop_event.wait(max(0.0, interval - (time.monotonic() - started)))
+
+
+def start_background_refresher(interval: float = ALERTS_REFRESH_INTERVAL) -> threading.Event:
+    """Run the refresher in a daemon thread of this process; set the returned event to stop it."""
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=run_refresher, args=(interval, stop_event), name="alerts-snapshot-refresher", daemon=True
+    )
+    thread.start()
+    logger.info(f"Started alerts snapshot refresher (every {interval:.0f}s)")
+    return stop_event
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python -m shared_tools.alerts_snapshots refresh | run [interval] | latest [scope]"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ("refresh", "run", "latest"):
+        print("Usage: python -m shared_tools.alerts_snapshots refresh | run [interval_seconds] | latest [scope]")
+        return 2
+
+    if argv[0] == "refresh":
+        print(f"Stored version {refresh_alerts_snapshots()} in {ALERTS_SNAPSHOT_PATH}")
+    elif argv[0] == "run":
+        run_refresher(float(argv[1]) if len(argv) > 1 else ALERTS_REFRESH_INTERVAL)
+    else:
+        snapshot = get_snapshot_store().latest(argv[1] if len(argv) > 1 else NATIONAL_SCOPE)
+        print(json.dumps(snapshot, indent=2) if snapshot else "No snapshot stored")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
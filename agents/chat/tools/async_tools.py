@@ -0,0 +1,696 @@
+import asyncio
+import logging
+from functools import wraps
+from typing import Dict, Any, Optional, List, Awaitable
+
+from google.adk.tools.tool_context import ToolContext
+
+from . import tools
+from .http_cache import (
+    async_cached_get_json, async_cached_get_json_with_age, async_cached_get_parsed_with_age,
+    async_fetch_json, async_fetch_parsed
+)
+from .alerts_stream import aiter_feature_properties, TopAlerts, LONG_TEXT_FIELDS
+from .tools import (
+    track_tool_call,
+    NWS_API_BASE,
+    NWS_HEADERS,
+    NATIONAL_ALERTS_CHUNK_SIZE,
+    GOOGLE_MAPS_BASE,
+    ALERTS_FETCH_CONCURRENCY,
+    PLACES_FETCH_CONCURRENCY,
+    PLACES_MAX_PAGES,
+    PLACES_PAGE_TOKEN_DELAY,
+    ZONE_FETCH_CONCURRENCY,
+    gridpoint_cache,
+    generate_map,
+    calculate_evacuation_priority,
+)
+
+logger = logging.getLogger(__name__)
+
+# Async versions of the tools in tools.py, for agents served from an event loop.
+#
+# NWS, NHC and Google Maps calls go through one shared httpx.AsyncClient and the
+# same HTTP cache as the sync tools, so an in-flight tool call holds no thread.
+# Request building and result shaping are shared with tools.py; only the I/O differs.
+# BigQuery has no asyncio API, so those tools run the sync version in a worker thread;
+# so does every TieredCache/SQLite access (gridpoints, zones, geocodes, alert cursors).
+
+
+async def _gather_limited(limit: int, calls: Dict[str, Awaitable]) -> Dict[str, Any]:
+    """Await calls with at most `limit` in flight.
+
+    Returns:
+        dict: Each key mapped to its result, or to the exception it raised
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(call):
+        async with semaphore:
+            try:
+                return await call
+            except Exception as e:
+                return e
+
+    results = await asyncio.gather(*(run(call) for call in calls.values()))
+    return dict(zip(calls, results))
+
+
+def _threaded(func):
+    """Async tool that runs a blocking tool in a worker thread (keeps its name, docstring and signature)."""
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(func, *args, **kwargs)
+    return wrapper
+
+
+# BigQuery tools
+get_census_demographics = _threaded(tools.get_census_demographics)
+find_nearest_weather_station = _threaded(tools.find_nearest_weather_station)
+query_historical_weather = _threaded(tools.query_historical_weather)
+get_weather_statistics = _threaded(tools.get_weather_statistics)
+get_census_tracts_in_area = _threaded(tools.get_census_tracts_in_area)
+get_flood_risk_data = _threaded(tools.get_flood_risk_data)
+
+
+async def _resolve_gridpoint(latitude: float, longitude: float, refresh: bool = False) -> Dict[str, Any]:
+    """Async tools._resolve_gridpoint (same persistent gridpoint cache)."""
+    key = tools._gridpoint_key(latitude, longitude)
+    if not refresh:
+        cached = await asyncio.to_thread(gridpoint_cache.get, key)
+        if cached:
+            return cached
+
+    points_data = await async_cached_get_json(f"{NWS_API_BASE}/points/{key}", headers=NWS_HEADERS, timeout=10)
+    gridpoint = tools._gridpoint_from_points(points_data)
+    await asyncio.to_thread(gridpoint_cache.set, key, gridpoint)
+    return gridpoint
+
+
+async def _fetch_forecasts(latitude: float, longitude: float, kinds: list):
+    """Async tools._fetch_forecasts: products are fetched concurrently from one gridpoint."""
+    for attempt in range(2):
+        gridpoint = await _resolve_gridpoint(latitude, longitude, refresh=attempt > 0)
+        try:
+            results = await asyncio.gather(*(
+                async_cached_get_json_with_age(gridpoint[kind], headers=NWS_HEADERS, timeout=10) for kind in kinds
+            ))
+            return {kind: payload for kind, (payload, _) in zip(kinds, results)}, tools._oldest_stale(results)
+        except Exception as e:
+            if attempt > 0:
+                raise
+            logger.warning(f"Forecast fetch via cached gridpoint failed ({str(e)}); re-resolving /points")
+
+
+@track_tool_call("get_nws_forecast")
+async def get_nws_forecast(
+    tool_context: ToolContext,
+    latitude: float,
+    longitude: float,
+    period: str = "7day"
+) -> Dict[str, Any]:
+    """Get weather forecast from NWS API for a specific location.
+
+    Args:
+        latitude (float): Latitude of location
+        longitude (float): Longitude of location
+        period (str): Forecast period - "7day", "hourly", or "both" (7-day and hourly
+            fetched concurrently; hourly periods are returned as "hourly_periods")
+
+    Returns:
+        dict: Forecast data with periods, temperatures, and conditions
+    """
+    try:
+        kinds = tools._forecast_kinds(period)
+        forecasts, stale_age = await _fetch_forecasts(latitude, longitude, kinds)
+        return tools._forecast_result(tool_context, latitude, longitude, period, kinds, forecasts, stale_age)
+
+    except Exception as e:
+        logger.error(f"Error getting NWS forecast: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get forecast: {str(e)}"
+        }
+
+
+@track_tool_call("get_hourly_forecast")
+async def get_hourly_forecast(
+    tool_context: ToolContext,
+    latitude: float,
+    longitude: float
+) -> Dict[str, Any]:
+    """Get hourly forecast for next 48 hours from NWS API.
+
+    Args:
+        latitude (float): Latitude of location
+        longitude (float): Longitude of location
+
+    Returns:
+        dict: Hourly forecast data
+    """
+    return await get_nws_forecast(tool_context, latitude, longitude, period="hourly")
+
+
+async def _fetch_alert_properties(params: Dict[str, str]) -> list:
+    """Async tools._fetch_alert_properties."""
+    alerts_data = await async_cached_get_json(f"{NWS_API_BASE}/alerts/active", params=params, headers=NWS_HEADERS, timeout=10)
+    return [feature.get("properties", {}) for feature in alerts_data.get("features", [])]
+
+
+async def _alert_properties(response) -> list:
+    return [props async for props in aiter_feature_properties(response.aiter_bytes(NATIONAL_ALERTS_CHUNK_SIZE))]
+
+
+async def _top_alerts(response) -> Dict[str, Any]:
+    """Parse a streamed national feed into its top-10 summary (same cache variant as the sync tool)."""
+    top = TopAlerts(10)
+    async for props in aiter_feature_properties(response.aiter_bytes(NATIONAL_ALERTS_CHUNK_SIZE), defer=LONG_TEXT_FIELDS):
+        top.add(props)
+    return top.summary()
+
+
+async def fetch_nws_alerts(
+    state: Optional[str] = None,
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    severity: Optional[str] = None,
+    states: Optional[List[str]] = None,
+    urgency: Optional[str] = None,
+    certainty: Optional[str] = None,
+    event: Optional[str] = None,
+    zone: Optional[str] = None,
+    region_type: Optional[str] = None,
+    status: Optional[str] = None,
+    message_type: Optional[str] = None,
+    since: Optional[str] = None
+) -> Dict[str, Any]:
+    """Async tools.fetch_nws_alerts; the ToolContext-free core of get_nws_alerts."""
+    try:
+        params, national = tools._alert_request(
+            state, latitude, longitude, severity, states, urgency, certainty,
+            event, zone, region_type, status, message_type
+        )
+
+        if since:
+            # Incremental polling diffs the full alert set, not just the top alerts
+            if national:
+                properties = await async_fetch_parsed(
+                    f"{NWS_API_BASE}/alerts/active",
+                    _alert_properties,
+                    params=params,
+                    headers=NWS_HEADERS,
+                    timeout=10,
+                    variant="alert-properties",
+                    stream=True
+                )
+            else:
+                properties = await _fetch_alert_properties(params)
+            # Reads and writes the alert cursor cache
+            return await asyncio.to_thread(tools._incremental_alerts_result, properties, params, since)
+
+        if national:
+            summary, stale_age = await async_cached_get_parsed_with_age(
+                f"{NWS_API_BASE}/alerts/active",
+                _top_alerts,
+                params=params,
+                headers=NWS_HEADERS,
+                timeout=10,
+                variant="alerts-top10",
+                stream=True
+            )
+            return tools._national_alerts_result(summary, params, stale_age)
+
+        alerts_data, stale_age = await async_cached_get_json_with_age(
+            f"{NWS_API_BASE}/alerts/active", params=params, headers=NWS_HEADERS, timeout=10
+        )
+        return tools._regional_alerts_result(alerts_data, params, stale_age)
+
+    except Exception as e:
+        logger.error(f"Error getting NWS alerts: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get alerts: {str(e)}"
+        }
+
+
+@track_tool_call("get_nws_alerts")
+async def get_nws_alerts(
+    tool_context: ToolContext,
+    state: Optional[str] = None,
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    severity: Optional[str] = None,
+    states: Optional[List[str]] = None,
+    urgency: Optional[str] = None,
+    certainty: Optional[str] = None,
+    event: Optional[str] = None,
+    zone: Optional[str] = None,
+    region_type: Optional[str] = None,
+    status: Optional[str] = None,
+    message_type: Optional[str] = None,
+    since: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get active weather alerts from NWS API (real-time).
+
+    All filters are applied by NWS, so only matching alerts are downloaded.
+    Comma-separated values are accepted wherever several values make sense.
+
+    Args:
+        state (str): Two-letter state code (e.g., "FL") or several ("FL,GA,AL")
+        latitude (float): Latitude for point-based alerts
+        longitude (float): Longitude for point-based alerts
+        severity (str): Filter by severity - "Extreme", "Severe", "Moderate", "Minor"
+        states (list): Two-letter state codes, fetched in a single request
+        urgency (str): Filter by urgency - "Immediate", "Expected", "Future", "Past"
+        certainty (str): Filter by certainty - "Observed", "Likely", "Possible", "Unlikely"
+        event (str): Filter by event name (e.g., "Tornado Warning,Flood Warning")
+        zone (str): NWS zone IDs (e.g., "FLZ069,FLC086")
+        region_type (str): "land" or "marine"
+        status (str): "actual", "exercise", "system", "test" or "draft"
+        message_type (str): "alert", "update" or "cancel"
+        since (str): Incremental polling. Pass "start" on the first poll, then the
+            "cursor" returned by the previous poll; only added, updated and expired
+            alerts are returned instead of the top alerts
+
+    Returns:
+        dict: Active weather alerts (or the changes since the cursor)
+    """
+    result = await fetch_nws_alerts(
+        state=state,
+        latitude=latitude,
+        longitude=longitude,
+        severity=severity,
+        states=states,
+        urgency=urgency,
+        certainty=certainty,
+        event=event,
+        zone=zone,
+        region_type=region_type,
+        status=status,
+        message_type=message_type,
+        since=since
+    )
+
+    tools._save_alerts_state(tool_context, result)
+    return result
+
+
+@track_tool_call("get_nws_alerts_multi")
+async def get_nws_alerts_multi(
+    tool_context: ToolContext,
+    states: Optional[List[str]] = None,
+    points: Optional[List[str]] = None,
+    severity: Optional[str] = None,
+    max_alerts: int = 20
+) -> Dict[str, Any]:
+    """Get active alerts for several states and/or points in one call.
+
+    All states go to NWS as a single area request; each point is its own request.
+    The requests run concurrently, alerts returned by more than one location are
+    merged by their NWS id, and the result is ranked by severity, urgency and onset.
+
+    Args:
+        states (list): Two-letter state codes (e.g., ["FL", "GA"])
+        points (list): "latitude,longitude" strings (e.g., ["25.7617,-80.1918"])
+        severity (str): Filter by severity - "Extreme", "Severe", "Moderate", "Minor"
+        max_alerts (int): Maximum number of alerts to return (most critical first)
+
+    Returns:
+        dict: Merged, deduplicated alerts with per-location counts
+    """
+    try:
+        requests_by_location, error = tools._alerts_multi_requests(states, points, severity)
+        if error:
+            return error
+
+        outcomes = await _gather_limited(ALERTS_FETCH_CONCURRENCY, {
+            location: _fetch_alert_properties(params) for location, params in requests_by_location.items()
+        })
+        return tools._merge_alerts_multi(tool_context, outcomes, max_alerts)
+
+    except Exception as e:
+        logger.error(f"Error getting NWS alerts for multiple locations: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get alerts: {str(e)}"
+        }
+
+
+@track_tool_call("get_current_conditions")
+async def get_current_conditions(
+    tool_context: ToolContext,
+    station_id: str
+) -> Dict[str, Any]:
+    """Get current weather observations from a NWS station (live data).
+
+    Args:
+        station_id (str): NWS station ID (e.g., "KMIA" for Miami)
+
+    Returns:
+        dict: Current weather conditions
+    """
+    try:
+        # Get latest observation
+        obs_url = f"{NWS_API_BASE}/stations/{station_id}/observations/latest"
+        obs_data, stale_age = await async_cached_get_json_with_age(obs_url, headers=NWS_HEADERS, timeout=10)
+        return tools._current_conditions_result(tool_context, station_id, obs_data, stale_age)
+
+    except Exception as e:
+        logger.error(f"Error getting current conditions: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get conditions: {str(e)}"
+        }
+
+
+@track_tool_call("get_hurricane_track")
+async def get_hurricane_track(
+    tool_context: ToolContext,
+    storm_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Get live hurricane tracking data and projected path from NWS/NHC with KMZ visualization links.
+
+    Args:
+        storm_id (str, optional): Storm ID (e.g., "AL092024"). If not provided, returns all active tropical cyclones.
+
+    Returns:
+        dict: Hurricane tracking data including current position, intensity, forecast track, and KMZ visualization files
+    """
+    try:
+        storms_data = await async_fetch_json("https://www.nhc.noaa.gov/CurrentStorms.json", timeout=15)
+        return tools._hurricane_track_result(tool_context, storms_data, storm_id)
+
+    except Exception as e:
+        logger.error(f"Error getting hurricane track: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get hurricane data: {str(e)}. Check https://www.nhc.noaa.gov/ for manual updates."
+        }
+
+
+async def geocode_location(address: str) -> Dict[str, Any]:
+    """Async tools.geocode_location (Gazetteer, then cache, then Google)."""
+    # Reads the geocode cache (and starts the Gazetteer load on first use)
+    query, local = await asyncio.to_thread(tools._geocode_locally, address)
+    if local:
+        return local
+
+    api_key = tools._google_maps_api_key()
+    if not api_key:
+        return {
+            "status": "error",
+            "message": "GOOGLE_MAPS_API_KEY not configured"
+        }
+
+    data = await async_fetch_json(f"{GOOGLE_MAPS_BASE}/geocode/json", params={"address": address, "key": api_key}, timeout=10)
+    # Stores the result in the geocode cache
+    return await asyncio.to_thread(tools._google_geocode_result, address, query, data)
+
+
+@track_tool_call("geocode_address")
+async def geocode_address(
+    tool_context: ToolContext,
+    address: str
+) -> Dict[str, Any]:
+    """Geocode an address to latitude/longitude coordinates.
+
+    Cities ("Miami, FL"), counties and ZIP codes are resolved locally; street
+    addresses use the Google Maps Geocoding API (results are cached).
+
+    Args:
+        address (str): Address to geocode (e.g., "1600 Amphitheatre Parkway, Mountain View, CA")
+
+    Returns:
+        dict: Geocoding results with coordinates and formatted address
+    """
+    try:
+        result = await geocode_location(address)
+
+        # Save to state
+        if result.get("status") == "success":
+            tool_context.state["geocode_result"] = result["result"]
+
+        return result
+
+    except Exception as e:
+        logger.error(f"Error geocoding address: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to geocode address: {str(e)}"
+        }
+
+
+@track_tool_call("get_directions")
+async def get_directions(
+    tool_context: ToolContext,
+    origin: str,
+    destination: str,
+    mode: str = "driving",
+    alternatives: bool = True
+) -> Dict[str, Any]:
+    """Get directions between two locations using Google Maps Directions API.
+
+    Args:
+        origin (str): Starting location (address or "lat,lng")
+        destination (str): Ending location (address or "lat,lng")
+        mode (str): Travel mode - "driving", "walking", "bicycling", "transit"
+        alternatives (bool): Whether to return alternative routes
+
+    Returns:
+        dict: Directions with routes, distances, and travel times
+    """
+    try:
+        api_key = tools._google_maps_api_key()
+        if not api_key:
+            return {
+                "status": "error",
+                "message": "GOOGLE_MAPS_API_KEY not configured"
+            }
+
+        params = {
+            "origin": origin,
+            "destination": destination,
+            "mode": mode,
+            "alternatives": str(alternatives).lower(),
+            "key": api_key
+        }
+
+        data = await async_fetch_json(f"{GOOGLE_MAPS_BASE}/directions/json", params=params, timeout=10)
+        return tools._directions_result(tool_context, origin, destination, mode, data)
+
+    except Exception as e:
+        logger.error(f"Error getting directions: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get directions: {str(e)}"
+        }
+
+
+@track_tool_call("search_nearby_places")
+async def search_nearby_places(
+    tool_context: ToolContext,
+    location: str,
+    place_type: str,
+    radius: int = 5000,
+    keyword: Optional[str] = None
+) -> Dict[str, Any]:
+    """Search for nearby places using Google Maps Places API.
+
+    Args:
+        location (str): Center point as "lat,lng"
+        place_type (str): Type of place (e.g., "hospital", "shelter", "pharmacy", "gas_station")
+        radius (int): Search radius in meters (default 5000m = 5km)
+        keyword (str): Optional keyword to refine search (e.g., "emergency")
+
+    Returns:
+        dict: List of nearby places with details
+    """
+    try:
+        api_key = tools._google_maps_api_key()
+        if not api_key:
+            return {
+                "status": "error",
+                "message": "GOOGLE_MAPS_API_KEY not configured"
+            }
+
+        params = {
+            "location": location,
+            "radius": radius,
+            "type": place_type,
+            "key": api_key
+        }
+
+        if keyword:
+            params["keyword"] = keyword
+
+        data = await async_fetch_json(f"{GOOGLE_MAPS_BASE}/place/nearbysearch/json", params=params, timeout=10)
+        return tools._nearby_places_result(tool_context, location, place_type, radius, keyword, data)
+
+    except Exception as e:
+        logger.error(f"Error searching nearby places: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to search places: {str(e)}"
+        }
+
+
+async def _search_places_category(params: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+    """Async tools._search_places_category: later pages are only requested if needed."""
+    places_url = f"{GOOGLE_MAPS_BASE}/place/nearbysearch/json"
+    places = []
+    page_params = params
+    for page in range(PLACES_MAX_PAGES):
+        for attempt in range(2):
+            data = await async_fetch_json(places_url, params=page_params, timeout=10)
+            if tools._page_token_pending(page, attempt, data):
+                await asyncio.sleep(PLACES_PAGE_TOKEN_DELAY)
+                continue
+            break
+
+        places.extend(tools._places_page_results(data))
+        token = data.get("next_page_token")
+        if len(places) >= limit or not token:
+            break
+        await asyncio.sleep(PLACES_PAGE_TOKEN_DELAY)
+        page_params = {"pagetoken": token, "key": params["key"]}
+    return places[:limit]
+
+
+@track_tool_call("search_nearby_places_multi")
+async def search_nearby_places_multi(
+    tool_context: ToolContext,
+    location: str,
+    place_types: Optional[List[str]] = None,
+    keywords: Optional[List[str]] = None,
+    radius: int = 5000,
+    max_per_category: int = 10,
+    max_results: int = 20
+) -> Dict[str, Any]:
+    """Search several kinds of nearby places in one call using Google Maps Places API.
+
+    Each place type and each keyword is its own Nearby Search; the searches run
+    concurrently. Places found by more than one search are merged by place_id and
+    the merged list is ranked by distance from the center.
+
+    Args:
+        location (str): Center point as "lat,lng"
+        place_types (list): Place types (e.g., ["hospital", "pharmacy", "gas_station"])
+        keywords (list): Free-text searches for places without a type (e.g., ["emergency shelter"])
+        radius (int): Search radius in meters (default 5000m = 5km)
+        max_per_category (int): Results to take from each search (more than 20 fetches extra pages)
+        max_results (int): Maximum number of merged places to return (nearest first; each
+            category that found places keeps its nearest max_results // categories)
+
+    Returns:
+        dict: Nearby places with distance_km and the categories that matched them
+    """
+    try:
+        searches, error = tools._places_multi_searches(location, place_types, keywords, radius)
+        if error:
+            return error
+
+        outcomes = await _gather_limited(PLACES_FETCH_CONCURRENCY, {
+            category: _search_places_category(params, max_per_category) for category, params in searches.items()
+        })
+        return tools._merge_places_multi(tool_context, location, radius, outcomes, max_results)
+
+    except Exception as e:
+        logger.error(f"Error searching nearby places: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to search places: {str(e)}"
+        }
+
+
+async def _fetch_zone_coordinates(zone_id: str) -> Optional[Dict[str, Any]]:
+    """Async tools._fetch_zone_coordinates (fallback endpoints tried in order)."""
+    try:
+        data = None
+        for url in tools._zone_endpoints(zone_id):
+            try:
+                data = await async_fetch_json(url, headers=NWS_HEADERS, timeout=10)
+                break
+            except Exception:
+                continue
+
+        # Stores the record in the zone cache
+        return await asyncio.to_thread(tools._zone_record, zone_id, data)
+
+    except Exception as e:
+        logger.error(f"Error getting coordinates for zone {zone_id}: {str(e)}")
+        return None
+
+
+async def resolve_zone_coordinates(zone_ids: List[str]) -> List[Dict[str, Any]]:
+    """Async tools.resolve_zone_coordinates: at most ZONE_FETCH_CONCURRENCY zones in flight."""
+    # The first lookup may open the zone index, so keep it off the event loop
+    resolved, pending = await asyncio.to_thread(tools._local_zone_coordinates, zone_ids)
+
+    if pending:
+        outcomes = await _gather_limited(ZONE_FETCH_CONCURRENCY, {
+            zone_id: _fetch_zone_coordinates(zone_id) for zone_id in pending
+        })
+        resolved.update({zone_id: coords for zone_id, coords in outcomes.items() if isinstance(coords, dict)})
+
+    # Preserve the requested order (including repeated IDs)
+    return [resolved[zone_id] for zone_id in zone_ids if zone_id in resolved]
+
+
+@track_tool_call("get_zone_coordinates")
+async def get_zone_coordinates(
+    tool_context: ToolContext,
+    zone_ids: list[str]
+) -> Dict[str, Any]:
+    """Get geographic coordinates for NWS zone IDs.
+
+    Supports multiple zone types:
+    - Forecast zones (e.g., FLZ069, TXZ123)
+    - County zones (e.g., FLC073, TXC209)
+    - Fire weather zones (e.g., FLZ001)
+
+    Zones are resolved concurrently (at most ZONE_FETCH_CONCURRENCY requests in
+    flight) and returned in the order they were requested.
+
+    Args:
+        zone_ids (list[str]): List of NWS zone IDs
+
+    Returns:
+        dict: Coordinates for each zone with status
+    """
+    try:
+        return tools._zone_coordinates_result(tool_context, zone_ids, await resolve_zone_coordinates(zone_ids))
+
+    except Exception as e:
+        logger.error(f"Error in get_zone_coordinates: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get zone coordinates: {str(e)}"
+        }
+
+
+__all__ = [
+    "get_census_demographics",
+    "find_nearest_weather_station",
+    "query_historical_weather",
+    "get_weather_statistics",
+    "get_census_tracts_in_area",
+    "get_flood_risk_data",
+    "get_nws_forecast",
+    "get_hourly_forecast",
+    "fetch_nws_alerts",
+    "get_nws_alerts",
+    "get_nws_alerts_multi",
+    "get_current_conditions",
+    "get_hurricane_track",
+    "geocode_location",
+    "geocode_address",
+    "get_directions",
+    "search_nearby_places",
+    "search_nearby_places_multi",
+    "resolve_zone_coordinates",
+    "get_zone_coordinates",
+    # CPU-only tools (no I/O), re-exported so agents can import every tool from here
+    "generate_map",
+    "calculate_evacuation_priority",
+]
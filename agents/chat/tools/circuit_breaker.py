@@ -0,0 +1,113 @@
+import os
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+from .rate_limit import upstream_for
+
+logger = logging.getLogger(__name__)
+
+# Consecutive failed requests (errors, timeouts, 5xx) that open an upstream's circuit
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+# Seconds an open circuit rejects calls before one trial request is let through
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Closed -> open after CIRCUIT_FAILURE_THRESHOLD consecutive failures; after
+    CIRCUIT_RESET_TIMEOUT one trial call is allowed (half-open) and its outcome
+    closes or re-opens the circuit. A trial that never reports back (cancelled,
+    rate limited) is replaced by another one after a further CIRCUIT_RESET_TIMEOUT."""
+
+    def __init__(self, name: str, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"opened": 0, "rejected": 0, "failures": 0, "successes": 0}
+
+    @property
+    def closed(self) -> bool:
+        return self.state == CLOSED
+
+    def ready(self) -> bool:
+        """True if a call would be let through now (without claiming the half-open trial)."""
+        with self._lock:
+            return self.state == CLOSED or time.monotonic() - self._opened_at >= self.reset_timeout
+
+    def allow(self) -> bool:
+        """Whether a call may go to the upstream; claims the trial call when one is due."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if now - self._opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._opened_at = now
+                logger.info(f"Circuit {self.name} half-open: sending a trial request")
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._stats["successes"] += 1
+            self._failures = 0
+            if self.state != CLOSED:
+                logger.info(f"Circuit {self.name} closed: upstream recovered")
+            self.state = CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._stats["failures"] += 1
+            self._failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self._failures >= self.failure_threshold):
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+                self._stats["opened"] += 1
+                logger.warning(
+                    f"Circuit {self.name} open after {self._failures} consecutive failures; "
+                    f"retrying in {self.reset_timeout:.0f}s"
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["state"] = self.state
+            stats["consecutive_failures"] = self._failures
+            if self.state != CLOSED:
+                stats["retry_in_seconds"] = round(max(0.0, self._opened_at + self.reset_timeout - time.monotonic()), 1)
+        return stats
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for_url(url: str) -> Optional[CircuitBreaker]:
+    """The circuit breaker of a URL's upstream (NWS, NHC, Maps APIs), or None."""
+    parts = urlsplit(url)
+    name = upstream_for(parts.netloc, parts.path)
+    if not name:
+        return None
+    breaker = _breakers.get(name)
+    if breaker is None:
+        with _breakers_lock:
+            breaker = _breakers.setdefault(name, CircuitBreaker(name))
+    return breaker
+
+
+def get_circuit_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-upstream circuit state and counters."""
+    return {name: breaker.stats() for name, breaker in list(_breakers.items())}
@@ -0,0 +1,212 @@
+import os
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from .rate_limit import upstream_for, get_limiter, retry_after_seconds, THROTTLE_STATUS_CODES, RATE_LIMIT_ENABLED
+from .circuit_breaker import breaker_for_url, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+# Pooled HTTP client configuration
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "20"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# One keep-alive session per upstream host (api.weather.gov, maps.googleapis.com, ...)
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+# Per-host connection counters
+_stats: Dict[str, Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(host: str, **increments: float) -> None:
+    """Add increments to the counters of a host."""
+    with _stats_lock:
+        host_stats = _stats.setdefault(host, {
+            "requests": 0,
+            "handshakes": 0,
+            "handshake_seconds": 0.0
+        })
+        for key, value in increments.items():
+            host_stats[key] = host_stats.get(key, 0) + value
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    """HTTP connection that records how long it takes to connect."""
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _record(self.host, handshakes=1, handshake_seconds=time.perf_counter() - start)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    """HTTPS connection that records how long the TCP + TLS handshake takes."""
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        _record(self.host, handshakes=1, handshake_seconds=time.perf_counter() - start)
+
+
+class _LimitedPoolMixin:
+    """Paces every attempt (urllib3 retries call urlopen again) through the host's
+    rate limiter and feeds each response back to it."""
+
+    def urlopen(self, method, url, *args, **kwargs):
+        _record(self.host, requests=1)
+        limiter = get_limiter(upstream_for(self.host, url))
+        if limiter:
+            limiter.acquire()
+        return super().urlopen(method, url, *args, **kwargs)
+
+    def _make_request(self, conn, method, url, *args, **kwargs):
+        response = super()._make_request(conn, method, url, *args, **kwargs)
+        limiter = get_limiter(upstream_for(self.host, url))
+        if limiter and response.status in THROTTLE_STATUS_CODES:
+            limiter.throttled(retry_after_seconds(response))
+        elif limiter and response.status < 400:
+            limiter.succeeded()
+        return response
+
+
+class _CountingHTTPConnectionPool(_LimitedPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(_LimitedPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools report request and handshake counts."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool
+        }
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with retry/backoff on 429 and 5xx responses.
+
+    With rate limiting on, the limiter already pauses the upstream for Retry-After
+    (see _LimitedPoolMixin), so Retry only adds its own backoff.
+    """
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=HTTP_RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=not RATE_LIMIT_ENABLED,
+        raise_on_status=False
+    )
+    adapter = _PooledAdapter(
+        pool_connections=1,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """Get the shared pooled session for the host of a URL."""
+    host = urlsplit(url).netloc
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _build_session()
+                _sessions[host] = session
+                logger.info(f"Created pooled HTTP session for {host} (pool size {HTTP_POOL_SIZE})")
+    return session
+
+
+def http_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    stream: bool = False
+) -> requests.Response:
+    """Issue a GET over the pooled, keep-alive session for the URL's host.
+
+    Args:
+        url (str): Absolute URL to fetch
+        params (dict): Optional query string parameters
+        headers (dict): Optional request headers
+        timeout (float): Timeout in seconds
+        stream (bool): Defer downloading the body (read it with iter_content())
+
+    Returns:
+        requests.Response: The response (retries on 429/5xx already applied; every
+            attempt is paced by the upstream's rate limiter, see rate_limit.py)
+
+    Raises:
+        CircuitOpenError: The upstream's circuit is open (see circuit_breaker.py)
+    """
+    breaker = breaker_for_url(url)
+    if breaker and not breaker.allow():
+        raise CircuitOpenError(f"{breaker.name} circuit open; not calling {url}")
+    try:
+        response = get_session(url).get(url, params=params, headers=headers, timeout=timeout, stream=stream)
+    except requests.RequestException:
+        if breaker:
+            breaker.record_failure()
+        raise
+    if breaker:
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+    return response
+
+
+def get_http_stats() -> Dict[str, Dict[str, Any]]:
+    """Get per-host connection pool statistics.
+
+    A pool hit is a request served over an already-open connection; a miss
+    required a new DNS + TCP + TLS handshake.
+
+    Returns:
+        dict: Counters keyed by host
+    """
+    with _stats_lock:
+        snapshot = {host: dict(values) for host, values in _stats.items()}
+
+    for values in snapshot.values():
+        handshakes = int(values["handshakes"])
+        requests_made = int(values["requests"])
+        values["requests"] = requests_made
+        values["handshakes"] = handshakes
+        values["pool_misses"] = handshakes
+        values["pool_hits"] = max(requests_made - handshakes, 0)
+        values["handshake_seconds"] = round(values["handshake_seconds"], 4)
+        values["avg_handshake_ms"] = round(values["handshake_seconds"] * 1000 / handshakes, 2) if handshakes else None
+    return snapshot
+
+
+def reset_http_stats() -> None:
+    """Clear all per-host counters."""
+    with _stats_lock:
+        _stats.clear()
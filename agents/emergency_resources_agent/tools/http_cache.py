@@ -0,0 +1,488 @@
+import os
+import re
+import time
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
+
+from .http_client import http_get
+from .async_http import async_http_get
+from .singleflight import SingleFlight
+from .circuit_breaker import breaker_for_url
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of parsed responses kept in memory
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "512"))
+# Oldest last-good response (seconds since it was fetched) served while the upstream is down
+HTTP_STALE_MAX_AGE = float(os.getenv("HTTP_STALE_MAX_AGE", "3600"))
+# Threads refreshing stale entries in the background for sync callers
+HTTP_REFRESH_WORKERS = int(os.getenv("HTTP_REFRESH_WORKERS", "4"))
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*(?:s-maxage|max-age)\s*=\s*(\d+)", re.IGNORECASE)
+
+_entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_lock = threading.Lock()
+_stats = {
+    "fresh_hits": 0, "revalidations": 0, "full_fetches": 0, "uncacheable": 0,
+    "stale_served": 0, "background_refreshes": 0
+}
+
+# Concurrent misses for the same resource share one upstream request
+http_flights = SingleFlight("http")
+
+_refresh_executor = ThreadPoolExecutor(max_workers=HTTP_REFRESH_WORKERS, thread_name_prefix="http-refresh")
+# Strong references to background refresh tasks until they finish
+_refresh_tasks = set()
+
+
+def _cache_key(
+    url: str,
+    params: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]],
+    variant: str = "json"
+) -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+    accept = (headers or {}).get("Accept", "")
+    return f"{url}?{query}|{accept}|{variant}"
+
+
+def _freshness(response) -> Optional[float]:
+    """Seconds the response may be served without revalidation, or None if it must not be stored."""
+    cache_control = response.headers.get("Cache-Control", "")
+    if "no-store" in cache_control.lower():
+        return None
+    if "no-cache" in cache_control.lower():
+        return 0.0
+    match = _MAX_AGE_RE.search(cache_control)
+    return float(match.group(1)) if match else 0.0
+
+
+def _bump(stat: str) -> None:
+    with _lock:
+        _stats[stat] += 1
+
+
+def cached_get_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10
+) -> Any:
+    """GET a JSON resource through an HTTP cache that honors Cache-Control max-age
+    and revalidates stale entries with If-None-Match / If-Modified-Since.
+
+    Concurrent misses for the same resource (e.g. many sessions asking for the
+    same /alerts/active or /points at once) share one upstream request. While
+    the upstream is failing, the last good response is returned instead (see
+    cached_get_parsed_with_age). The returned payload may be shared with other
+    callers; treat it as read-only.
+
+    Args:
+        url (str): Absolute URL to fetch
+        params (dict): Optional query string parameters
+        headers (dict): Optional request headers
+        timeout (float): Timeout in seconds
+
+    Returns:
+        Parsed JSON body (the cached body on a fresh hit or a 304)
+
+    Raises:
+        requests.HTTPError: For non-success responses
+    """
+    return cached_get_parsed(url, lambda response: response.json(), params=params, headers=headers, timeout=timeout)
+
+
+def cached_get_parsed(
+    url: str,
+    parse: Callable[[Any], Any],
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    variant: str = "json",
+    stream: bool = False
+) -> Any:
+    """Like cached_get_json, but caches whatever parse(response) returns.
+
+    Lets a caller reduce a large body while it downloads (stream=True) and cache
+    only the reduced result; the upstream validators still drive revalidation.
+
+    Args:
+        url (str): Absolute URL to fetch
+        parse (callable): Turns a successful response into the value to cache
+        params (dict): Optional query string parameters
+        headers (dict): Optional request headers
+        timeout (float): Timeout in seconds
+        variant (str): Distinguishes different parses of the same resource in the cache
+        stream (bool): Hand parse() a response whose body has not been read yet
+
+    Returns:
+        The parsed value (the cached value on a fresh hit or a 304)
+    """
+    payload, _ = cached_get_parsed_with_age(
+        url, parse, params=params, headers=headers, timeout=timeout, variant=variant, stream=stream
+    )
+    return payload
+
+
+def cached_get_json_with_age(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10
+) -> Tuple[Any, Optional[float]]:
+    """cached_get_json that also reports whether the last good response was served instead."""
+    return cached_get_parsed_with_age(url, lambda response: response.json(), params=params, headers=headers, timeout=timeout)
+
+
+def cached_get_parsed_with_age(
+    url: str,
+    parse: Callable[[Any], Any],
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    variant: str = "json",
+    stream: bool = False
+) -> Tuple[Any, Optional[float]]:
+    """cached_get_parsed with stale-while-revalidate.
+
+    An expired entry (up to HTTP_STALE_MAX_AGE old) is served immediately when
+    the upstream's circuit is open or another caller is already refreshing it;
+    the refresh then happens in the background. A refresh that fails falls back
+    to the expired entry too, so callers only see an error when nothing usable
+    is cached.
+
+    Returns:
+        tuple: (payload, stale_age) where stale_age is None for a current response,
+            otherwise the age in seconds of the last good response served instead
+    """
+    key = _cache_key(url, params, headers, variant)
+    entry, fresh = _lookup(key)
+    if fresh:
+        return entry["payload"], None
+
+    def fetch():
+        response = http_get(url, params=params, headers=_conditional_headers(entry, headers), timeout=timeout, stream=stream)
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            return _revalidated(entry, response)
+
+        try:
+            response.raise_for_status()
+            payload = parse(response)
+        finally:
+            response.close()
+        return _store(key, response, payload)
+
+    stale = _usable_stale(entry)
+    if stale is not None and _serve_stale_now(key, url):
+        if _refresh_due(key, url):
+            _bump("background_refreshes")
+            _refresh_executor.submit(_refresh, key, url, fetch)
+        return _serve_stale(stale, url)
+
+    try:
+        payload, _ = http_flights.do(key, fetch)
+    except Exception as e:
+        if stale is None:
+            raise
+        logger.warning(f"Refreshing {url} failed ({str(e)}); serving last good response")
+        return _serve_stale(stale, url)
+    return payload, None
+
+
+async def async_cached_get_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10
+) -> Any:
+    """Async cached_get_json over the shared httpx client; shares the same cache entries."""
+    async def parse(response):
+        return response.json()
+
+    return await async_cached_get_parsed(url, parse, params=params, headers=headers, timeout=timeout)
+
+
+async def async_cached_get_parsed(
+    url: str,
+    parse: Callable[[Any], Awaitable[Any]],
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    variant: str = "json",
+    stream: bool = False
+) -> Any:
+    """Async cached_get_parsed; parse is a coroutine function taking the httpx response."""
+    payload, _ = await async_cached_get_parsed_with_age(
+        url, parse, params=params, headers=headers, timeout=timeout, variant=variant, stream=stream
+    )
+    return payload
+
+
+async def async_cached_get_json_with_age(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10
+) -> Tuple[Any, Optional[float]]:
+    """Async cached_get_json_with_age over the shared httpx client."""
+    async def parse(response):
+        return response.json()
+
+    return await async_cached_get_parsed_with_age(url, parse, params=params, headers=headers, timeout=timeout)
+
+
+async def async_cached_get_parsed_with_age(
+    url: str,
+    parse: Callable[[Any], Awaitable[Any]],
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    variant: str = "json",
+    stream: bool = False
+) -> Tuple[Any, Optional[float]]:
+    """Async cached_get_parsed_with_age; background refreshes run as tasks on the running loop."""
+    key = _cache_key(url, params, headers, variant)
+    entry, fresh = _lookup(key)
+    if fresh:
+        return entry["payload"], None
+
+    async def fetch():
+        response = await async_http_get(
+            url, params=params, headers=_conditional_headers(entry, headers), timeout=timeout, stream=stream
+        )
+
+        if response.status_code == 304 and entry is not None:
+            await response.aclose()
+            return _revalidated(entry, response)
+
+        try:
+            response.raise_for_status()
+            payload = await parse(response)
+        finally:
+            await response.aclose()
+        return _store(key, response, payload)
+
+    stale = _usable_stale(entry)
+    if stale is not None and _serve_stale_now(key, url):
+        if _refresh_due(key, url):
+            _bump("background_refreshes")
+            task = asyncio.get_running_loop().create_task(_arefresh(key, url, fetch))
+            _refresh_tasks.add(task)
+            task.add_done_callback(_refresh_tasks.discard)
+        return _serve_stale(stale, url)
+
+    try:
+        payload, _ = await http_flights.ado(key, fetch)
+    except Exception as e:
+        if stale is None:
+            raise
+        logger.warning(f"Refreshing {url} failed ({str(e)}); serving last good response")
+        return _serve_stale(stale, url)
+    return payload, None
+
+
+def fetch_parsed(
+    url: str,
+    parse: Callable[[Any], Any],
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    variant: str = "json",
+    stream: bool = False
+) -> Any:
+    """GET without caching; concurrent identical requests share one call and its parse.
+
+    For responses that must not be reused across calls (Google Maps, NHC, alert
+    polls) but are often requested by many sessions at once. The parsed value may
+    be shared; treat it as read-only.
+
+    Args:
+        url (str): Absolute URL to fetch
+        parse (callable): Turns a successful response into the value to return
+        params (dict): Optional query string parameters
+        headers (dict): Optional request headers
+        timeout (float): Timeout in seconds
+        variant (str): Distinguishes different parses of the same resource
+        stream (bool): Hand parse() a response whose body has not been read yet
+
+    Raises:
+        requests.HTTPError: For non-success responses
+    """
+    def fetch():
+        response = http_get(url, params=params, headers=headers, timeout=timeout, stream=stream)
+        try:
+            response.raise_for_status()
+            return parse(response)
+        finally:
+            response.close()
+
+    payload, _ = http_flights.do(_cache_key(url, params, headers, f"uncached-{variant}"), fetch)
+    return payload
+
+
+def fetch_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10
+) -> Any:
+    """fetch_parsed for a JSON body."""
+    return fetch_parsed(url, lambda response: response.json(), params=params, headers=headers, timeout=timeout)
+
+
+async def async_fetch_parsed(
+    url: str,
+    parse: Callable[[Any], Awaitable[Any]],
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    variant: str = "json",
+    stream: bool = False
+) -> Any:
+    """Async fetch_parsed; parse is a coroutine function taking the httpx response."""
+    async def fetch():
+        response = await async_http_get(url, params=params, headers=headers, timeout=timeout, stream=stream)
+        try:
+            response.raise_for_status()
+            return await parse(response)
+        finally:
+            await response.aclose()
+
+    payload, _ = await http_flights.ado(_cache_key(url, params, headers, f"uncached-{variant}"), fetch)
+    return payload
+
+
+async def async_fetch_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10
+) -> Any:
+    """Async fetch_json over the shared httpx client."""
+    async def parse(response):
+        return response.json()
+
+    return await async_fetch_parsed(url, parse, params=params, headers=headers, timeout=timeout)
+
+
+def _lookup(key: str):
+    """Get the cache entry for key and whether it can be served without revalidation."""
+    with _lock:
+        entry = _entries.get(key)
+        if entry is not None:
+            _entries.move_to_end(key)
+
+    if entry is not None and entry["expires_at"] > time.time():
+        _bump("fresh_hits")
+        return entry, True
+    return entry, False
+
+
+def _usable_stale(entry: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The expired entry if it is recent enough to stand in for the upstream."""
+    if entry is not None and time.time() - entry["fetched_at"] <= HTTP_STALE_MAX_AGE:
+        return entry
+    return None
+
+
+def _serve_stale_now(key: str, url: str) -> bool:
+    """Serve the expired entry without waiting: a refresh is already running or the upstream is down."""
+    breaker = breaker_for_url(url)
+    return http_flights.pending(key) or (breaker is not None and not breaker.closed)
+
+
+def _refresh_due(key: str, url: str) -> bool:
+    """Start a background refresh unless one is running or the open circuit would reject it."""
+    breaker = breaker_for_url(url)
+    return not http_flights.pending(key) and (breaker is None or breaker.ready())
+
+
+def _serve_stale(entry: Dict[str, Any], url: str) -> Tuple[Any, float]:
+    age = time.time() - entry["fetched_at"]
+    _bump("stale_served")
+    logger.info(f"Serving {url} from a {age:.0f}s old response")
+    return entry["payload"], age
+
+
+def _refresh(key: str, url: str, fetch: Callable[[], Any]) -> None:
+    try:
+        http_flights.do(key, fetch)
+    except Exception as e:
+        logger.info(f"Background refresh of {url} failed: {str(e)}")
+
+
+async def _arefresh(key: str, url: str, fetch: Callable[[], Awaitable[Any]]) -> None:
+    try:
+        await http_flights.ado(key, fetch)
+    except Exception as e:
+        logger.info(f"Background refresh of {url} failed: {str(e)}")
+
+
+def _conditional_headers(entry: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Request headers plus the validators of a stale entry."""
+    request_headers = dict(headers or {})
+    if entry is not None:
+        if entry.get("etag"):
+            request_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            request_headers["If-Modified-Since"] = entry["last_modified"]
+    return request_headers
+
+
+def _revalidated(entry: Dict[str, Any], response) -> Any:
+    """Refresh a stale entry after a 304 and return its payload."""
+    freshness = _freshness(response)
+    with _lock:
+        entry["fetched_at"] = time.time()
+        entry["expires_at"] = entry["fetched_at"] + (freshness or 0.0)
+        entry["etag"] = response.headers.get("ETag", entry.get("etag"))
+        entry["last_modified"] = response.headers.get("Last-Modified", entry.get("last_modified"))
+        _stats["revalidations"] += 1
+    return entry["payload"]
+
+
+def _store(key: str, response, payload: Any) -> Any:
+    """Cache a freshly parsed payload if the response allows it, and return it.
+
+    Responses that are stale at once (no max-age, no validators) are still kept as
+    the last good response to fall back on when the upstream fails.
+    """
+    freshness = _freshness(response)
+    if freshness is None:
+        _bump("uncacheable")
+        return payload
+
+    now = time.time()
+    with _lock:
+        _entries[key] = {
+            "payload": payload,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": now,
+            "expires_at": now + freshness
+        }
+        _entries.move_to_end(key)
+        while len(_entries) > HTTP_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+        _stats["full_fetches"] += 1
+    return payload
+
+
+def get_http_cache_stats() -> Dict[str, Any]:
+    """Get counters for fresh hits, 304 revalidations, full fetches and stale responses served."""
+    with _lock:
+        stats = dict(_stats)
+        stats["entries"] = len(_entries)
+    return stats
+
+
+def clear_http_cache() -> None:
+    """Drop all cached responses."""
+    with _lock:
+        _entries.clear()
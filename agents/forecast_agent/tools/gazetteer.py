@@ -0,0 +1,314 @@
+import io
+import os
+import re
+import sys
+import csv
+import time
+import logging
+import zipfile
+import threading
+import unicodedata
+from typing import Dict, Any, Optional, List, Tuple
+
+from .cache import CACHE_DIR
+from .http_client import http_get
+
+logger = logging.getLogger(__name__)
+
+# Census Gazetteer files (places, ZCTAs, counties); refresh with the CLI below
+GAZETTEER_DIR = os.getenv("GAZETTEER_DIR", os.path.join(CACHE_DIR, "gazetteer"))
+GAZETTEER_YEAR = os.getenv("GAZETTEER_YEAR", "2023")
+GAZETTEER_BASE = "https://www2.census.gov/geo/docs/maps-data/data/gazetteer"
+# Seconds before a failed Gazetteer download or load is attempted again
+GAZETTEER_RETRY_SECONDS = float(os.getenv("GAZETTEER_RETRY_SECONDS", "300"))
+
+_LAYERS = ("place", "zcta", "counties")
+
+US_STATE_CODES = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR", "california": "CA",
+    "colorado": "CO", "connecticut": "CT", "delaware": "DE", "district of columbia": "DC",
+    "florida": "FL", "georgia": "GA", "hawaii": "HI", "idaho": "ID", "illinois": "IL",
+    "indiana": "IN", "iowa": "IA", "kansas": "KS", "kentucky": "KY", "louisiana": "LA",
+    "maine": "ME", "maryland": "MD", "massachusetts": "MA", "michigan": "MI", "minnesota": "MN",
+    "mississippi": "MS", "missouri": "MO", "montana": "MT", "nebraska": "NE", "nevada": "NV",
+    "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM", "new york": "NY",
+    "north carolina": "NC", "north dakota": "ND", "ohio": "OH", "oklahoma": "OK", "oregon": "OR",
+    "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC", "south dakota": "SD",
+    "tennessee": "TN", "texas": "TX", "utah": "UT", "vermont": "VT", "virginia": "VA",
+    "washington": "WA", "west virginia": "WV", "wisconsin": "WI", "wyoming": "WY",
+    "puerto rico": "PR", "guam": "GU", "american samoa": "AS", "virgin islands": "VI",
+    "northern mariana islands": "MP",
+}
+_STATE_CODES = set(US_STATE_CODES.values())
+
+# Legal/statistical area descriptions the Gazetteer appends to place names ("Miami city")
+_PLACE_SUFFIX_RE = re.compile(
+    r"\s+(?:city and borough|consolidated government|metropolitan government|metro government|"
+    r"unified government|urban county|municipality|borough|village|town|city|CDP|comunidad|"
+    r"zona urbana|corporation|plantation)(?:\s+\(balance\))?$"
+)
+_COUNTY_SUFFIX_RE = re.compile(r"\s+(?:county|parish|borough|census area|city and borough|municipality|municipio)$")
+_COUNTRY_SUFFIX_RE = re.compile(r"(?:,\s*|\s+)(?:usa|u\.s\.a\.|united states(?: of america)?|us|u\.s\.)$", re.IGNORECASE)
+_ZIP_RE = re.compile(r"^(\d{5})(?:-\d{4})?$")
+
+# Spelling variants folded to one form on both the index and the query side
+_TOKEN_ALIASES = {"saint": "st", "sainte": "ste", "fort": "ft", "mount": "mt"}
+
+# Record layout: (display name, state, latitude, longitude, GEOID)
+Record = Tuple[str, str, float, float, str]
+
+
+def normalize_name(text: str) -> str:
+    """Fold case, accents, punctuation and common abbreviations so equal names compare equal."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    text = text.replace("&", " and ").replace(".", " ").replace("'", "")
+    return " ".join(_TOKEN_ALIASES.get(token, token) for token in text.split())
+
+
+def parse_place_query(text: str) -> Optional[Dict[str, str]]:
+    """Split a query into a Gazetteer lookup: a ZIP code, or a name plus state.
+
+    Returns:
+        dict: {"zip": ...} or {"name": ..., "state": ...}; None for anything that
+            looks like a street address or has no recognizable state
+    """
+    text = _COUNTRY_SUFFIX_RE.sub("", " ".join((text or "").split())).strip(" ,")
+    zip_match = _ZIP_RE.match(text)
+    if zip_match:
+        return {"zip": zip_match.group(1)}
+    if any(ch.isdigit() for ch in text):
+        return None
+
+    if "," in text:
+        name, state_part = (part.strip() for part in text.rsplit(",", 1))
+    else:
+        name, _, state_part = text.rpartition(" ")
+    state = US_STATE_CODES.get(state_part.lower()) or (state_part.upper() if state_part.upper() in _STATE_CODES else None)
+    if not state and "," not in text:
+        # Multi-word state names without a comma ("Portland New York")
+        for state_name, code in US_STATE_CODES.items():
+            if text.lower().endswith(" " + state_name):
+                name, state = text[:-len(state_name)].strip(), code
+                break
+    if not state or not name or "," in name:
+        return None
+    return {"name": name, "state": state}
+
+
+class Gazetteer:
+    """In-memory Census Gazetteer: places and counties by (state, name), ZCTAs by ZIP."""
+
+    def __init__(self, places: List[Tuple], counties: List[Record], zctas: List[Record]):
+        """
+        Args:
+            places (list): (NAME, state, latitude, longitude, GEOID, land area) rows
+            counties (list): Records keyed by their full name ("Harris County")
+            zctas (list): Records keyed by ZIP code
+        """
+        self.places: Dict[Tuple[str, str], Record] = {}
+        self.counties: Dict[Tuple[str, str], Record] = {
+            (record[1], normalize_name(record[0])): record for record in counties
+        }
+        self.zctas: Dict[str, Record] = {record[4]: record for record in zctas}
+
+        # Incorporated places win over CDPs with the same name, then the larger land area
+        aliases = []
+        for name, state, latitude, longitude, geoid, _ in sorted(
+            places, key=lambda row: (row[0].endswith(" CDP"), -row[5])
+        ):
+            record = (_PLACE_SUFFIX_RE.sub("", name), state, latitude, longitude, geoid)
+            key = normalize_name(record[0])
+            self.places.setdefault((state, key), record)
+            # "Nashville-Davidson", "Louisville/Jefferson County": also answer to the first part
+            first = re.split(r"[-/]", key, 1)[0].strip()
+            if first and first != key:
+                aliases.append(((state, first), record))
+        for key, record in aliases:
+            self.places.setdefault(key, record)
+
+    def lookup(self, query: str) -> Optional[Dict[str, Any]]:
+        """Resolve "City, ST", "County Name, ST" or a ZIP code.
+
+        Returns:
+            dict: A geocode_address-shaped result, or None when the query is not in the Gazetteer
+        """
+        parsed = parse_place_query(query)
+        if not parsed:
+            return None
+
+        if "zip" in parsed:
+            record = self.zctas.get(parsed["zip"])
+            return _result(query, record, f"{record[0]}, USA", ["postal_code"]) if record else None
+
+        name = normalize_name(parsed["name"])
+        state = parsed["state"]
+        if _COUNTY_SUFFIX_RE.search(name):
+            record = self.counties.get((state, name))
+            types = ["administrative_area_level_2", "political"]
+        else:
+            record = self.places.get((state, name))
+            types = ["locality", "political"]
+        return _result(query, record, f"{record[0]}, {state}, USA", types) if record else None
+
+    def __len__(self) -> int:
+        return len(self.places) + len(self.counties) + len(self.zctas)
+
+
+def _result(query: str, record: Record, formatted_address: str, types: List[str]) -> Dict[str, Any]:
+    return {
+        "address": query,
+        "formatted_address": formatted_address,
+        "latitude": record[2],
+        "longitude": record[3],
+        "place_id": None,
+        "types": types,
+        "geoid": record[4],
+        "source": "census_gazetteer"
+    }
+
+
+def _layer_path(layer: str, directory: str = GAZETTEER_DIR, year: str = GAZETTEER_YEAR) -> str:
+    return os.path.join(directory, f"{year}_Gaz_{layer}_national.txt")
+
+
+def _read_rows(path: str) -> List[Dict[str, str]]:
+    """Read a tab-separated Gazetteer file (header names carry stray whitespace)."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        text = raw.decode("latin-1")  # Older vintages
+    reader = csv.reader(io.StringIO(text), delimiter="\t")
+    header = [column.strip() for column in next(reader, [])]
+    return [dict(zip(header, (value.strip() for value in row))) for row in reader]
+
+
+def _load_layer(layer: str, directory: str = GAZETTEER_DIR) -> List[Tuple]:
+    rows = []
+    for row in _read_rows(_layer_path(layer, directory)):
+        try:
+            latitude, longitude = float(row["INTPTLAT"]), float(row["INTPTLONG"])
+            if layer == "place":
+                rows.append((row["NAME"], row["USPS"], latitude, longitude, row["GEOID"], float(row["ALAND"] or 0)))
+            elif layer == "counties":
+                rows.append((row["NAME"], row["USPS"], latitude, longitude, row["GEOID"]))
+            else:
+                rows.append((row["GEOID"], "", latitude, longitude, row["GEOID"]))
+        except (KeyError, ValueError):
+            continue
+    return rows
+
+
+def refresh_gazetteer(directory: str = GAZETTEER_DIR, year: str = GAZETTEER_YEAR) -> int:
+    """Download the national places, ZCTA and counties Gazetteer files.
+
+    Returns:
+        int: Number of rows written across the three files
+    """
+    os.makedirs(directory, exist_ok=True)
+    total = 0
+    for layer in _LAYERS:
+        url = f"{GAZETTEER_BASE}/{year}_Gazetteer/{year}_Gaz_{layer}_national.zip"
+        response = http_get(url, timeout=120)
+        response.raise_for_status()
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            member = next(name for name in archive.namelist() if name.endswith(".txt"))
+            data = archive.read(member)
+
+        path = _layer_path(layer, directory, year)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        rows = data.count(b"\n") - 1
+        total += rows
+        logger.info(f"Wrote {rows} Gazetteer {layer} rows to {path}")
+
+    reset_gazetteer()
+    return total
+
+
+_gazetteer: Optional[Gazetteer] = None
+_gazetteer_lock = threading.Lock()
+_loader: Optional[threading.Thread] = None
+_retry_at = 0.0
+
+
+def _load_gazetteer() -> None:
+    """Background loader: read the files (downloading them if missing) and publish the index."""
+    global _gazetteer, _loader, _retry_at
+    try:
+        if not all(os.path.exists(_layer_path(layer)) for layer in _LAYERS):
+            logger.info(f"No Gazetteer files in {GAZETTEER_DIR}; downloading the {GAZETTEER_YEAR} vintage")
+            refresh_gazetteer()
+        gazetteer = Gazetteer(_load_layer("place"), _load_layer("counties"), _load_layer("zcta"))
+        with _gazetteer_lock:
+            _gazetteer = gazetteer
+        logger.info(f"Loaded {len(gazetteer)} Gazetteer entries from {GAZETTEER_DIR}")
+    except Exception as e:
+        with _gazetteer_lock:
+            _retry_at = time.monotonic() + GAZETTEER_RETRY_SECONDS
+        logger.warning(
+            f"Census Gazetteer unavailable, geocoding will use Google (retrying in {GAZETTEER_RETRY_SECONDS:.0f}s): {str(e)}"
+        )
+    finally:
+        with _gazetteer_lock:
+            _loader = None
+
+
+def get_gazetteer(wait: bool = False) -> Optional[Gazetteer]:
+    """Get the loaded Gazetteer, or None while it is not available yet.
+
+    The first call starts a background thread that loads the files, downloading
+    them if they are missing, so no tool call waits on census.gov; callers fall
+    back to Google meanwhile. A failed load is retried after
+    GAZETTEER_RETRY_SECONDS.
+
+    Args:
+        wait (bool): Block until the current load attempt finishes (CLI use)
+    """
+    global _loader
+    if _gazetteer is not None:
+        return _gazetteer
+    with _gazetteer_lock:
+        if _gazetteer is None and _loader is None and time.monotonic() >= _retry_at:
+            _loader = threading.Thread(target=_load_gazetteer, name="gazetteer-load", daemon=True)
+            _loader.start()
+        loader = _loader
+    if wait and loader is not None:
+        loader.join()
+    return _gazetteer
+
+
+def reset_gazetteer() -> None:
+    """Drop the in-memory Gazetteer so the next lookup reloads the files."""
+    global _gazetteer, _retry_at
+    with _gazetteer_lock:
+        _gazetteer = None
+        _retry_at = 0.0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python -m shared_tools.gazetteer refresh | lookup <query>"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ("refresh", "lookup"):
+        print("Usage: python -m shared_tools.gazetteer refresh | lookup <query>")
+        return 2
+
+    if argv[0] == "refresh":
+        count = refresh_gazetteer()
+        print(f"Wrote {count} Gazetteer rows to {GAZETTEER_DIR}")
+    else:
+        gazetteer = get_gazetteer(wait=True)
+        if gazetteer is None:
+            print("Census Gazetteer unavailable (would call Google)")
+            return 1
+        print(gazetteer.lookup(" ".join(argv[1:])) or "Not in the Gazetteer (would call Google)")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -1,14 +1,23 @@
 import os
 import json
+import time
+import inspect
 import logging
-import requests
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Union
 from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
 from google.adk.tools.tool_context import ToolContext
-from google.cloud import bigquery
-import google.auth
-from dotenv import load_dotenv
+from .http_cache import cached_get_json, cached_get_json_with_age, cached_get_parsed_with_age, fetch_json, fetch_parsed
+from .alerts_stream import iter_feature_properties, summarize_alerts, format_alert, SEVERITY_PRIORITY, LONG_TEXT_FIELDS
+from .alerts_diff import diff_alerts
+from .cache import TieredCache
+from .bigquery_client import run_query, ensure_env_loaded
+from .bq_metrics import current_tool
+from .zone_cache import get_zone_type, zone_record_from_feature, get_cached_zone, cache_zone
+from .zone_index import lookup_zone
+from .station_catalog import get_station_catalog, haversine_km
+from .gazetteer import get_gazetteer
 
 # Configure detailed logging for tools
 logging.basicConfig(
@@ -17,75 +26,97 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _log_tool_start(tool_name, func, args, kwargs):
+    logger.info(f"{'='*80}")
+    logger.info(f"🔧 TOOL CALL: {tool_name}")
+    logger.info(f"   Function: {func.__name__}")
+    
+    # Log parameters (skip tool_context)
+    params = {}
+    if len(args) > 1:
+        params['args'] = str(args[1:])[:200]  # Truncate long args
+    if kwargs:
+        params['kwargs'] = {k: str(v)[:100] for k, v in kwargs.items()}
+    
+    if params:
+        logger.info(f"   Parameters: {params}")
+    
+    logger.info(f"{'='*80}")
+
+
+def _log_tool_success(tool_name, result):
+    # Log result summary
+    logger.info(f"{'='*80}")
+    logger.info(f"✅ TOOL SUCCESS: {tool_name}")
+    if isinstance(result, dict):
+        if 'status' in result:
+            logger.info(f"   Status: {result.get('status')}")
+        if 'count' in result:
+            logger.info(f"   Count: {result.get('count')}")
+        if 'alerts' in result:
+            logger.info(f"   Alerts returned: {len(result.get('alerts', []))}")
+    logger.info(f"{'='*80}")
+
+
+def _log_tool_error(tool_name, e):
+    logger.error(f"{'='*80}")
+    logger.error(f"❌ TOOL ERROR: {tool_name}")
+    logger.error(f"   Error: {str(e)}")
+    logger.error(f"{'='*80}")
+
+
 # Tool call tracking decorator
 def track_tool_call(tool_name):
-    """Decorator to track tool calls with detailed logging"""
+    """Decorator to track tool calls with detailed logging (sync and async tools)"""
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                _log_tool_start(tool_name, func, args, kwargs)
+                tool_token = current_tool.set(tool_name)
+                try:
+                    result = await func(*args, **kwargs)
+                    _log_tool_success(tool_name, result)
+                    return result
+                except Exception as e:
+                    _log_tool_error(tool_name, e)
+                    raise
+                finally:
+                    current_tool.reset(tool_token)
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            logger.info(f"{'='*80}")
-            logger.info(f"🔧 TOOL CALL: {tool_name}")
-            logger.info(f"   Function: {func.__name__}")
-            
-            # Log parameters (skip tool_context)
-            params = {}
-            if len(args) > 1:
-                params['args'] = str(args[1:])[:200]  # Truncate long args
-            if kwargs:
-                params['kwargs'] = {k: str(v)[:100] for k, v in kwargs.items()}
-            
-            if params:
-                logger.info(f"   Parameters: {params}")
-            
-            logger.info(f"{'='*80}")
-            
+            _log_tool_start(tool_name, func, args, kwargs)
+            tool_token = current_tool.set(tool_name)
             try:
                 result = func(*args, **kwargs)
-                
-                # Log result summary
-                logger.info(f"{'='*80}")
-                logger.info(f"✅ TOOL SUCCESS: {tool_name}")
-                if isinstance(result, dict):
-                    if 'status' in result:
-                        logger.info(f"   Status: {result.get('status')}")
-                    if 'count' in result:
-                        logger.info(f"   Count: {result.get('count')}")
-                    if 'alerts' in result:
-                        logger.info(f"   Alerts returned: {len(result.get('alerts', []))}")
-                logger.info(f"{'='*80}")
-                
+                _log_tool_success(tool_name, result)
                 return result
             except Exception as e:
-                logger.error(f"{'='*80}")
-                logger.error(f"❌ TOOL ERROR: {tool_name}")
-                logger.error(f"   Error: {str(e)}")
-                logger.error(f"{'='*80}")
+                _log_tool_error(tool_name, e)
                 raise
+            finally:
+                current_tool.reset(tool_token)
         return wrapper
     return decorator
 
-# Load environment variables
-load_dotenv()
-
-# Initialize BigQuery client for direct queries
-application_default_credentials, project_id = google.auth.default()
-if not project_id:
-    project_id = os.getenv("GCP_PROJECT") or os.getenv("GOOGLE_CLOUD_PROJECT")
-
-# Create BigQuery client
-bq_client = bigquery.Client(
-    credentials=application_default_credentials,
-    project=project_id
-)
-
 # NWS API Configuration
-NWS_API_BASE = "https://api.weather.gov"
+# Overridable for benchmarks against a local stub (see benchmarks/async_tools.py --stub-latency)
+NWS_API_BASE = os.getenv("NWS_API_BASE", "https://api.weather.gov")
 NWS_USER_AGENT = os.getenv("NWS_USER_AGENT", "(WeatherAdvisor, contact@example.com)")
 NWS_HEADERS = {
     "User-Agent": NWS_USER_AGENT,
     "Accept": "application/geo+json"
 }
 
+# Read size for streaming the national /alerts/active feed
+NATIONAL_ALERTS_CHUNK_SIZE = 64 * 1024
+
+# Points -> gridpoint mapping is static, so keep it for a long time (keyed by 4-decimal coordinates)
+GRIDPOINT_CACHE_TTL = float(os.getenv("GRIDPOINT_CACHE_TTL", str(30 * 24 * 3600)))
+gridpoint_cache = TieredCache("nws_gridpoints", ttl_seconds=GRIDPOINT_CACHE_TTL, max_memory_items=4096)
+
 
 # BigQuery Helper Functions for Historical Weather Data and Census Demographics
 @track_tool_call("get_census_demographics")
@@ -148,8 +179,7 @@ def get_census_demographics(
         """
         
         logger.info(f"Querying census demographics for {city}, {state}")
-        query_job = bq_client.query(query)
-        results = query_job.result()
+        results = run_query(query)
         
         demographics = []
         total_population = 0
@@ -228,58 +258,48 @@ def find_nearest_weather_station(
     tool_context: ToolContext,
     latitude: float,
     longitude: float,
-    state: str
+    state: Optional[str] = None,
+    k: int = 3,
+    max_distance_km: Optional[float] = None
 ) -> Dict[str, Any]:
-    """Find the top 3 nearest weather stations to coordinates using BigQuery NOAA GSOD dataset.
+    """Find the nearest NOAA GSOD weather stations to coordinates.
+    
+    Uses the local station catalog (a snapshot of noaa_gsod.stations with a spatial
+    index) and great-circle distance, so stations across state borders are considered.
     
     Args:
         latitude (float): Latitude of the location (e.g., 37.7798)
         longitude (float): Longitude of the location (e.g., -121.9780)
-        state (str): State abbreviation (e.g., "CA") to filter stations
+        state (str, optional): State abbreviation (e.g., "CA"); only used if the catalog is unavailable
+        k (int): Number of stations to return (default 3)
+        max_distance_km (float, optional): Only return stations within this radius
         
     Returns:
-        dict: Top 3 nearest weather stations with IDs, names, and distances
+        dict: Nearest weather stations with IDs, names, and distances in km
     """
     try:
-        # Query to find top 3 nearest stations using Euclidean distance
-        query = f"""
-        SELECT
-            usaf,
-            wban,
-            name,
-            state,
-            lat,
-            lon,
-            SQRT(POW((lat - {latitude}), 2) + POW((lon - ({longitude})), 2)) as distance
-        FROM
-            `bigquery-public-data.noaa_gsod.stations`
-        WHERE
-            state = '{state}'
-            AND lat IS NOT NULL
-            AND lon IS NOT NULL
-        ORDER BY
-            distance
-        LIMIT 3
-        """
-        
-        logger.info(f"Finding top 3 nearest weather stations for coordinates ({latitude}, {longitude}) in {state}")
-        query_job = bq_client.query(query)
-        results = query_job.result()
+        try:
+            nearest = get_station_catalog().nearest(latitude, longitude, k=k, max_distance_km=max_distance_km)
+            stations = [
+                {
+                    "usaf": station["usaf"],
+                    "wban": station["wban"],
+                    "name": station["name"],
+                    "state": station["state"],
+                    "latitude": station["latitude"],
+                    "longitude": station["longitude"],
+                    "distance": station["distance_km"]
+                }
+                for station in nearest
+            ]
+        except Exception as e:
+            if not state:
+                raise
+            logger.warning(f"Station catalog unavailable ({str(e)}), falling back to BigQuery for {state}")
+            stations = _query_nearest_stations(latitude, longitude, state, k, max_distance_km)
         
-        stations = []
-        for row in results:
-            # Use USAF as the station identifier (used in stn field for queries)
-            station = {
-                "usaf": row.usaf,
-                "wban": row.wban,
-                "name": row.name,
-                "state": row.state,
-                "latitude": row.lat,
-                "longitude": row.lon,
-                "distance": row.distance
-            }
-            stations.append(station)
-            logger.info(f"Found station #{len(stations)}: {row.usaf} - {row.name} (distance: {row.distance:.4f})")
+        for rank, station in enumerate(stations, 1):
+            logger.info(f"Found station #{rank}: {station['usaf']} - {station['name']} (distance: {station['distance']:.1f} km)")
         
         if stations:
             tool_context.state["weather_stations"] = stations
@@ -292,7 +312,7 @@ def find_nearest_weather_station(
         
         return {
             "status": "error",
-            "message": f"No weather stations found for {state}"
+            "message": f"No weather stations found near ({latitude}, {longitude})"
         }
     
     except Exception as e:
@@ -303,6 +323,58 @@ def find_nearest_weather_station(
         }
 
 
+def _query_nearest_stations(
+    latitude: float,
+    longitude: float,
+    state: str,
+    k: int,
+    max_distance_km: Optional[float]
+) -> list:
+    """Fallback: nearest stations within a state, computed in BigQuery."""
+    from google.cloud import bigquery  # Imported lazily to keep agent cold starts fast
+    
+    query = """
+    SELECT
+        usaf,
+        wban,
+        name,
+        state,
+        lat,
+        lon,
+        ST_DISTANCE(ST_GEOGPOINT(lon, lat), ST_GEOGPOINT(@longitude, @latitude)) / 1000 as distance
+    FROM
+        `bigquery-public-data.noaa_gsod.stations`
+    WHERE
+        state = @state
+        AND lat IS NOT NULL
+        AND lon IS NOT NULL
+    ORDER BY
+        distance
+    LIMIT @k
+    """
+    query_params = [
+        bigquery.ScalarQueryParameter("latitude", "FLOAT64", latitude),
+        bigquery.ScalarQueryParameter("longitude", "FLOAT64", longitude),
+        bigquery.ScalarQueryParameter("state", "STRING", state),
+        bigquery.ScalarQueryParameter("k", "INT64", k)
+    ]
+    
+    stations = []
+    for row in run_query(query, query_parameters=query_params):
+        if max_distance_km is not None and row.distance > max_distance_km:
+            continue
+        stations.append({
+            "usaf": row.usaf,
+            "wban": row.wban,
+            "name": row.name,
+            "state": row.state,
+            "latitude": row.lat,
+            "longitude": row.lon,
+            "distance": round(row.distance, 2)
+        })
+    return stations
+
+
 @track_tool_call("query_historical_weather")
 def query_historical_weather(
     tool_context: ToolContext,
@@ -312,6 +384,10 @@ def query_historical_weather(
 ) -> Dict[str, Any]:
     """Query historical weather data from BigQuery public datasets with fallback to multiple stations.
     
+    All candidate stations are queried in a single job that only scans the yearly
+    GSOD tables spanned by the date range; the first station (in the given order)
+    with data is returned.
+    
     Args:
         usaf_ids (list): List of USAF station IDs to try (e.g., ["724927", "724930"])
         start_date (str): Start date in YYYY-MM-DD format
@@ -320,82 +396,104 @@ def query_historical_weather(
     Returns:
         dict: Historical weather observations from the first station with data
     """
-    # Extract year from start_date for table suffix
-    start_year = start_date.split('-')[0]
-    end_year = end_date.split('-')[0]
-    table_suffix = "*"  # Use wildcard to cover multiple years
-    
-    # Try each station in order until we get data
-    for idx, usaf_id in enumerate(usaf_ids):
-        try:
-            logger.info(f"Attempting to query station #{idx+1}: {usaf_id}")
+    try:
+        from google.cloud import bigquery  # Imported lazily to keep agent cold starts fast
+        
+        usaf_ids = [str(usaf_id) for usaf_id in usaf_ids]
+        start = datetime.strptime(start_date, "%Y-%m-%d").date()
+        end = datetime.strptime(end_date, "%Y-%m-%d").date()
+        if start > end:
+            start, end = end, start
+        
+        # Restrict the wildcard to the yearly tables actually spanned by the date range.
+        # The years are inlined as literals (they come from parsed dates) so BigQuery
+        # can prune tables at planning time.
+        query = f"""
+        SELECT 
+            stn,
+            CAST(date AS STRING) as date,
+            temp,
+            max,
+            min,
+            prcp,
+            sndp,
+            wdsp,
+            mxpsd
+        FROM `bigquery-public-data.noaa_gsod.gsod*`
+        WHERE _TABLE_SUFFIX BETWEEN '{start.year}' AND '{end.year}'
+            AND stn IN UNNEST(@usaf_ids)
+            AND date BETWEEN @start_date AND @end_date
+        QUALIFY ROW_NUMBER() OVER (PARTITION BY stn ORDER BY date DESC) <= 100
+        """
+        
+        query_params = [
+            bigquery.ArrayQueryParameter("usaf_ids", "STRING", usaf_ids),
+            bigquery.ScalarQueryParameter("start_date", "DATE", start),
+            bigquery.ScalarQueryParameter("end_date", "DATE", end)
+        ]
+        
+        logger.info(f"Querying {len(usaf_ids)} stations for {start_date} to {end_date} (tables gsod{start.year}-gsod{end.year})")
+        results = run_query(query, query_parameters=query_params)
+        bytes_processed = results.stats.get("total_bytes_processed", 0)
+        bytes_billed = results.stats.get("total_bytes_billed", 0)
+        
+        records_by_station = {}
+        for row in results:
+            records_by_station.setdefault(row.stn, []).append({
+                "date": str(row.date),
+                "temperature": row.temp,
+                "max_temp": row.max,
+                "min_temp": row.min,
+                "precipitation": row.prcp,
+                "snow_depth": row.sndp,
+                "wind_speed": row.wdsp,
+                "max_wind_speed": row.mxpsd
+            })
+        
+        for idx, usaf_id in enumerate(usaf_ids):
+            records = records_by_station.get(usaf_id)
+            if not records:
+                logger.warning(f"No data found for station {usaf_id}, trying next station...")
+                continue
             
-            # Build query using USAF as stn field
-            query = f"""
-            SELECT 
-                CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') as date,
-                temp,
-                max,
-                min,
-                prcp,
-                sndp,
-                wdsp,
-                mxpsd
-            FROM `bigquery-public-data.noaa_gsod.gsod{table_suffix}`
-            WHERE stn = '{usaf_id}'
-                AND CAST(year AS STRING) || '-' || LPAD(CAST(mo AS STRING), 2, '0') || '-' || LPAD(CAST(da AS STRING), 2, '0') 
-                    BETWEEN '{start_date}' AND '{end_date}'
-            ORDER BY year DESC, mo DESC, da DESC
-            LIMIT 100
-            """
+            records.sort(key=lambda record: record["date"], reverse=True)
             
-            query_job = bq_client.query(query)
-            results = query_job.result()
+            tool_context.state["historical_weather"] = {
+                "usaf_id": usaf_id,
+                "records": records,
+                "count": len(records)
+            }
             
-            records = []
-            for row in results:
-                records.append({
-                    "date": str(row.date),
-                    "temperature": row.temp,
-                    "max_temp": row.max,
-                    "min_temp": row.min,
-                    "precipitation": row.prcp,
-                    "snow_depth": row.sndp,
-                    "wind_speed": row.wdsp,
-                    "max_wind_speed": row.mxpsd
-                })
+            logger.info(f"Successfully retrieved {len(records)} records from station {usaf_id} ({bytes_processed} bytes processed)")
             
-            if records:
-                tool_context.state["historical_weather"] = {
-                    "usaf_id": usaf_id,
-                    "records": records,
-                    "count": len(records)
-                }
-                
-                logger.info(f"Successfully retrieved {len(records)} records from station {usaf_id}")
-                
-                return {
-                    "status": "success",
-                    "usaf_id": usaf_id,
-                    "records": records,
-                    "count": len(records),
-                    "station_tried": idx + 1,
-                    "total_stations": len(usaf_ids)
-                }
-            else:
-                logger.warning(f"No data found for station {usaf_id}, trying next station...")
-                
-        except Exception as e:
-            logger.error(f"Error querying station {usaf_id}: {str(e)}, trying next station...")
-            continue
+            return {
+                "status": "success",
+                "usaf_id": usaf_id,
+                "records": records,
+                "count": len(records),
+                "station_tried": idx + 1,
+                "total_stations": len(usaf_ids),
+                "bytes_processed": bytes_processed,
+                "bytes_billed": bytes_billed
+            }
+        
+        # If we get here, none of the stations had data
+        logger.error(f"No data found for any of the {len(usaf_ids)} stations")
+        return {
+            "status": "error",
+            "message": f"Failed to retrieve data from any of the {len(usaf_ids)} nearest weather stations",
+            "stations_tried": usaf_ids,
+            "bytes_processed": bytes_processed,
+            "bytes_billed": bytes_billed
+        }
     
-    # If we get here, none of the stations had data
-    logger.error(f"No data found for any of the {len(usaf_ids)} stations")
-    return {
-        "status": "error",
-        "message": f"Failed to retrieve data from any of the {len(usaf_ids)} nearest weather stations",
-        "stations_tried": usaf_ids
-    }
+    except Exception as e:
+        logger.error(f"Error querying historical weather: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to query historical weather: {str(e)}",
+            "stations_tried": usaf_ids
+        }
 
 
 @track_tool_call("get_weather_statistics")
@@ -438,10 +536,9 @@ def get_weather_statistics(
             {date_filter}
         """
         
-        query_job = bq_client.query(query)
-        results = query_job.result()
+        results = run_query(query)
         
-        row = next(results)
+        row = results[0]
         stats = {
             "station_id": station_id,
             "period": period,
@@ -472,6 +569,154 @@ def get_weather_statistics(
         }
 
 
+def _resolve_gridpoint(latitude: float, longitude: float, refresh: bool = False) -> Dict[str, Any]:
+    """Resolve coordinates to their NWS gridpoint (office, grid X/Y, forecast URLs, stations).
+    
+    Results are cached persistently by coordinates rounded to 4 decimals (the
+    precision NWS itself uses for /points), so steady-state forecasts skip /points.
+    """
+    key = _gridpoint_key(latitude, longitude)
+    if not refresh:
+        cached = gridpoint_cache.get(key)
+        if cached:
+            return cached
+    
+    points_data = cached_get_json(f"{NWS_API_BASE}/points/{key}", headers=NWS_HEADERS, timeout=10)
+    gridpoint = _gridpoint_from_points(points_data)
+    gridpoint_cache.set(key, gridpoint)
+    return gridpoint
+
+
+def _gridpoint_key(latitude: float, longitude: float) -> str:
+    lat, lon = round(float(latitude), 4), round(float(longitude), 4)
+    return f"{lat},{lon}"
+
+
+def _gridpoint_from_points(points_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the gridpoint fields from an NWS /points response."""
+    props = points_data["properties"]
+    return {
+        "office": props.get("gridId"),
+        "grid_x": props.get("gridX"),
+        "grid_y": props.get("gridY"),
+        "forecast": props["forecast"],
+        "forecast_hourly": props["forecastHourly"],
+        "forecast_grid_data": props.get("forecastGridData"),
+        "observation_stations": props.get("observationStations")
+    }
+
+
+def _format_forecast_periods(forecast_data: Dict[str, Any]) -> list:
+    """Extract and format forecast periods from an NWS forecast response."""
+    periods = []
+    for period_data in forecast_data["properties"]["periods"]:
+        periods.append({
+            "name": period_data.get("name"),
+            "temperature": period_data.get("temperature"),
+            "temperature_unit": period_data.get("temperatureUnit"),
+            "wind_speed": period_data.get("windSpeed"),
+            "wind_direction": period_data.get("windDirection"),
+            "short_forecast": period_data.get("shortForecast"),
+            "detailed_forecast": period_data.get("detailedForecast"),
+            "precipitation_probability": (period_data.get("probabilityOfPrecipitation") or {}).get("value")
+        })
+    return periods
+
+
+def _fetch_forecasts(latitude: float, longitude: float, kinds: list):
+    """Fetch one or more forecast products ("forecast", "forecast_hourly") for a location.
+    
+    Multiple products are fetched concurrently from a single gridpoint resolution.
+    A cached gridpoint that no longer works (NWS occasionally re-grids offices) is
+    re-resolved once.
+    
+    Returns:
+        tuple: (products by kind, age in seconds of the oldest stale product or None)
+    """
+    for attempt in range(2):
+        gridpoint = _resolve_gridpoint(latitude, longitude, refresh=attempt > 0)
+        try:
+            if len(kinds) == 1:
+                results = [cached_get_json_with_age(gridpoint[kinds[0]], headers=NWS_HEADERS, timeout=10)]
+            else:
+                with ThreadPoolExecutor(max_workers=len(kinds), thread_name_prefix="forecast-fetch") as executor:
+                    futures = [
+                        executor.submit(cached_get_json_with_age, gridpoint[kind], headers=NWS_HEADERS, timeout=10)
+                        for kind in kinds
+                    ]
+                    results = [future.result() for future in futures]
+            return {kind: payload for kind, (payload, _) in zip(kinds, results)}, _oldest_stale(results)
+        except Exception as e:
+            if attempt > 0:
+                raise
+            logger.warning(f"Forecast fetch via cached gridpoint failed ({str(e)}); re-resolving /points")
+
+
+def _oldest_stale(results: list) -> Optional[float]:
+    """Largest stale age among (payload, stale_age) results, or None if all are current."""
+    ages = [age for _, age in results if age is not None]
+    return max(ages) if ages else None
+
+
+def _mark_stale(result: Dict[str, Any], stale_age: Optional[float]) -> Dict[str, Any]:
+    """Flag a result built from the last good cached response while NWS was failing."""
+    if stale_age is not None:
+        result["stale"] = True
+        result["data_age_seconds"] = round(stale_age)
+        logger.warning(f"Returning NWS data from {stale_age:.0f}s ago (upstream unavailable)")
+    return result
+
+
+def _forecast_kinds(period: str) -> list:
+    """Forecast products needed for a get_nws_forecast period."""
+    if period == "hourly":
+        return ["forecast_hourly"]
+    if period == "both":
+        return ["forecast", "forecast_hourly"]
+    return ["forecast"]
+
+
+def _forecast_result(
+    tool_context: ToolContext,
+    latitude: float,
+    longitude: float,
+    period: str,
+    kinds: list,
+    forecasts: Dict[str, Any],
+    stale_age: Optional[float] = None
+) -> Dict[str, Any]:
+    """Build the get_nws_forecast result from fetched products and save it to state."""
+    forecast_data = forecasts[kinds[0]]
+    periods = _format_forecast_periods(forecast_data)
+    
+    update_time = forecast_data["properties"].get("updated") or forecast_data["properties"].get("updateTime")
+    
+    forecast_state = {
+        "location": f"{latitude},{longitude}",
+        "periods": periods,
+        "updated": update_time,
+        "timestamp": datetime.now().isoformat()
+    }
+    result = {
+        "status": "success",
+        "location": f"{latitude},{longitude}",
+        "periods": periods,
+        "updated": update_time
+    }
+    
+    if "forecast_hourly" in forecasts and period == "both":
+        hourly_periods = _format_forecast_periods(forecasts["forecast_hourly"])
+        forecast_state["hourly_periods"] = hourly_periods
+        result["hourly_periods"] = hourly_periods
+    
+    # Save to state
+    tool_context.state["forecast_data"] = forecast_state
+    
+    logger.info(f"Retrieved {len(periods)} forecast periods for {latitude},{longitude}")
+    
+    return _mark_stale(result, stale_age)
+
+
 @track_tool_call("get_nws_forecast")
 def get_nws_forecast(
     tool_context: ToolContext,
@@ -484,61 +729,16 @@ def get_nws_forecast(
     Args:
         latitude (float): Latitude of location
         longitude (float): Longitude of location
-        period (str): Forecast period - "7day" or "hourly"
+        period (str): Forecast period - "7day", "hourly", or "both" (7-day and hourly
+            fetched concurrently; hourly periods are returned as "hourly_periods")
         
     Returns:
         dict: Forecast data with periods, temperatures, and conditions
     """
     try:
-        # Step 1: Get grid points for the location
-        points_url = f"{NWS_API_BASE}/points/{latitude},{longitude}"
-        points_response = requests.get(points_url, headers=NWS_HEADERS, timeout=10)
-        points_response.raise_for_status()
-        points_data = points_response.json()
-        
-        # Extract forecast URL
-        if period == "hourly":
-            forecast_url = points_data["properties"]["forecastHourly"]
-        else:
-            forecast_url = points_data["properties"]["forecast"]
-        
-        # Step 2: Get forecast data
-        forecast_response = requests.get(forecast_url, headers=NWS_HEADERS, timeout=10)
-        forecast_response.raise_for_status()
-        forecast_data = forecast_response.json()
-        
-        # Extract and format forecast periods
-        periods = []
-        for period_data in forecast_data["properties"]["periods"]:
-            periods.append({
-                "name": period_data.get("name"),
-                "temperature": period_data.get("temperature"),
-                "temperature_unit": period_data.get("temperatureUnit"),
-                "wind_speed": period_data.get("windSpeed"),
-                "wind_direction": period_data.get("windDirection"),
-                "short_forecast": period_data.get("shortForecast"),
-                "detailed_forecast": period_data.get("detailedForecast"),
-                "precipitation_probability": period_data.get("probabilityOfPrecipitation", {}).get("value")
-            })
-        
-        update_time = forecast_data["properties"].get("updated") or forecast_data["properties"].get("updateTime")
-        
-        # Save to state
-        tool_context.state["forecast_data"] = {
-            "location": f"{latitude},{longitude}",
-            "periods": periods,
-            "updated": update_time,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        logger.info(f"Retrieved {len(periods)} forecast periods for {latitude},{longitude}")
-        
-        return {
-            "status": "success",
-            "location": f"{latitude},{longitude}",
-            "periods": periods,
-            "updated": update_time
-        }
+        kinds = _forecast_kinds(period)
+        forecasts, stale_age = _fetch_forecasts(latitude, longitude, kinds)
+        return _forecast_result(tool_context, latitude, longitude, period, kinds, forecasts, stale_age)
     
     except Exception as e:
         logger.error(f"Error getting NWS forecast: {str(e)}")
@@ -566,114 +766,461 @@ def get_hourly_forecast(
     return get_nws_forecast(tool_context, latitude, longitude, period="hourly")
 
 
+def _csv_param(value: Optional[Union[str, List[str]]], normalize=None) -> Optional[str]:
+    """Join a string or list of strings into the comma-separated form NWS accepts."""
+    if not value:
+        return None
+    values = [value] if isinstance(value, str) else value
+    items = [item.strip() for v in values if v for item in v.split(",") if item.strip()]
+    if normalize:
+        items = [normalize(item) for item in items]
+    return ",".join(dict.fromkeys(items)) or None
+
+
+def _nws_alert_params(
+    states: Optional[List[str]] = None,
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    zone: Optional[Union[str, List[str]]] = None,
+    region_type: Optional[str] = None,
+    severity: Optional[Union[str, List[str]]] = None,
+    urgency: Optional[Union[str, List[str]]] = None,
+    certainty: Optional[Union[str, List[str]]] = None,
+    event: Optional[Union[str, List[str]]] = None,
+    status: Optional[str] = None,
+    message_type: Optional[str] = None
+) -> Dict[str, str]:
+    """Build /alerts/active query parameters so NWS filters the feed server-side.
+
+    NWS accepts only one of point, area, zone and region_type per request; the
+    most specific one given wins.
+    """
+    params = {}
+    if latitude is not None and longitude is not None:
+        params["point"] = f"{latitude},{longitude}"
+    elif zone:
+        params["zone"] = _csv_param(zone, str.upper)
+    elif states:
+        params["area"] = _csv_param(states, str.upper)
+    elif region_type:
+        params["region_type"] = region_type.lower()
+
+    params["severity"] = _csv_param(severity, str.capitalize)
+    params["urgency"] = _csv_param(urgency, str.capitalize)
+    params["certainty"] = _csv_param(certainty, str.capitalize)
+    params["event"] = _csv_param(event)
+    params["status"] = status.lower() if status else None
+    params["message_type"] = message_type.lower() if message_type else None
+    return {key: value for key, value in params.items() if value}
+
+
+# Maximum concurrent NWS requests made by get_nws_alerts_multi
+ALERTS_FETCH_CONCURRENCY = int(os.getenv("ALERTS_FETCH_CONCURRENCY", "8"))
+
+
+def _fetch_alert_properties(params: Dict[str, str]) -> list:
+    """Fetch /alerts/active with the given filters and return each alert's properties."""
+    alerts_data = cached_get_json(f"{NWS_API_BASE}/alerts/active", params=params, headers=NWS_HEADERS, timeout=10)
+    return [feature.get("properties", {}) for feature in alerts_data.get("features", [])]
+
+
+def fetch_nws_alerts(
+    state: Optional[str] = None,
+    latitude: Optional[float] = None,
+    longitude: Optional[float] = None,
+    severity: Optional[str] = None,
+    states: Optional[List[str]] = None,
+    urgency: Optional[str] = None,
+    certainty: Optional[str] = None,
+    event: Optional[str] = None,
+    zone: Optional[str] = None,
+    region_type: Optional[str] = None,
+    status: Optional[str] = None,
+    message_type: Optional[str] = None,
+    since: Optional[str] = None
+) -> Dict[str, Any]:
+    """Fetch and rank active NWS alerts; the ToolContext-free core of get_nws_alerts.
+
+    Used directly by code paths that build alert summaries without an LLM.
+    """
+    try:
+        params, national = _alert_request(
+            state, latitude, longitude, severity, states, urgency, certainty,
+            event, zone, region_type, status, message_type
+        )
+        alerts_url = f"{NWS_API_BASE}/alerts/active"
+        
+        if since:
+            # Incremental polling diffs the full alert set, not just the top alerts
+            if national:
+                properties = fetch_parsed(
+                    alerts_url,
+                    lambda response: list(iter_feature_properties(response.iter_content(NATIONAL_ALERTS_CHUNK_SIZE))),
+                    params=params,
+                    headers=NWS_HEADERS,
+                    timeout=10,
+                    variant="alert-properties",
+                    stream=True
+                )
+            else:
+                properties = _fetch_alert_properties(params)
+            return _incremental_alerts_result(properties, params, since)
+        
+        if national:
+            # The national feed is several MB of features with geometry; stream it and
+            # keep only a bounded top-k instead of materializing every alert
+            summary, stale_age = cached_get_parsed_with_age(
+                alerts_url,
+                lambda response: summarize_alerts(
+                    iter_feature_properties(response.iter_content(NATIONAL_ALERTS_CHUNK_SIZE), defer=LONG_TEXT_FIELDS),
+                    top_k=10
+                ),
+                params=params,
+                headers=NWS_HEADERS,
+                timeout=10,
+                variant="alerts-top10",
+                stream=True
+            )
+            return _national_alerts_result(summary, params, stale_age)
+        
+        alerts_data, stale_age = cached_get_json_with_age(alerts_url, params=params, headers=NWS_HEADERS, timeout=10)
+        return _regional_alerts_result(alerts_data, params, stale_age)
+    
+    except Exception as e:
+        logger.error(f"Error getting NWS alerts: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get alerts: {str(e)}"
+        }
+
+
+def _alert_request(
+    state: Optional[str],
+    latitude: Optional[float],
+    longitude: Optional[float],
+    severity: Optional[str],
+    states: Optional[List[str]],
+    urgency: Optional[str],
+    certainty: Optional[str],
+    event: Optional[str],
+    zone: Optional[str],
+    region_type: Optional[str],
+    status: Optional[str],
+    message_type: Optional[str]
+):
+    """NWS query parameters for a get_nws_alerts call, and whether it is a national query."""
+    # Merge the single-state and multi-state arguments into one area filter
+    params = _nws_alert_params(
+        states=([state] if state else []) + list(states or []),
+        latitude=latitude if latitude and longitude else None,
+        longitude=longitude if latitude and longitude else None,
+        zone=zone,
+        region_type=region_type,
+        severity=severity,
+        urgency=urgency,
+        certainty=certainty,
+        event=event,
+        status=status,
+        message_type=message_type
+    )
+    national = not any(key in params for key in ("point", "area", "zone"))
+    return params, national
+
+
+def _national_alerts_result(summary: Dict[str, Any], params: Dict[str, str], stale_age: Optional[float] = None) -> Dict[str, Any]:
+    """get_nws_alerts result from the streamed top-10 summary of the national feed."""
+    alerts = summary["alerts"]
+    total_count = summary["total_count"]
+    severity_counts = dict(summary["severity_breakdown"])
+    if total_count > 10:
+        # National query - limit to top 5 most critical alerts
+        alerts = alerts[:5]
+        logger.info(f"National query: Limiting to top 5 critical alerts out of {total_count} total")
+    return _mark_stale(_alerts_result(alerts, total_count, severity_counts, params), stale_age)
+
+
+def _regional_alerts_result(alerts_data: Dict[str, Any], params: Dict[str, str], stale_age: Optional[float] = None) -> Dict[str, Any]:
+    """get_nws_alerts result from a filtered /alerts/active response."""
+    # Extract and format alerts
+    alerts = []
+    severity_counts = {"Extreme": 0, "Severe": 0, "Moderate": 0, "Minor": 0, "Unknown": 0}
+    
+    for feature in alerts_data.get("features", []):
+        props = feature.get("properties", {})
+        alert_severity = props.get("severity", "Unknown")
+        severity_counts[alert_severity] = severity_counts.get(alert_severity, 0) + 1
+        alerts.append(format_alert(props))
+    
+    # For large alert sets, only return top critical alerts to prevent timeout
+    total_count = len(alerts)
+    if total_count > 10:
+        # Sort by severity priority: Extreme > Severe > Moderate > Minor
+        alerts.sort(key=lambda x: SEVERITY_PRIORITY.get(x["severity"], 4))
+        
+        # Regional query - limit to top 10 alerts
+        alerts = alerts[:10]
+        logger.info(f"Regional query: Limiting to top 10 alerts out of {total_count} total")
+    return _mark_stale(_alerts_result(alerts, total_count, severity_counts, params), stale_age)
+
+
+def _alerts_result(alerts: list, total_count: int, severity_counts: Dict[str, int], params: Dict[str, str]) -> Dict[str, Any]:
+    logger.info(f"Retrieved {total_count} active alerts, returning {len(alerts)}")
+    
+    return {
+        "status": "success",
+        "alerts": alerts,
+        "total_count": total_count,
+        "returned_count": len(alerts),
+        "severity_breakdown": severity_counts,
+        "timestamp": datetime.now().isoformat(),
+        "limited": total_count > 10,
+        "filters": params,
+        "note": f"Showing top {len(alerts)} critical alerts out of {total_count} total" if total_count > 10 else None
+    }
+
+
+def _incremental_alerts_result(properties: list, params: Dict[str, str], since: str) -> Dict[str, Any]:
+    """Diff every matching alert against the cursor and return only the changes."""
+    severity_counts = {"Extreme": 0, "Severe": 0, "Moderate": 0, "Minor": 0, "Unknown": 0}
+    for props in properties:
+        alert_severity = props.get("severity", "Unknown")
+        severity_counts[alert_severity] = severity_counts.get(alert_severity, 0) + 1
+    
+    changes = diff_alerts(properties, since, params)
+    return {
+        "status": "success",
+        "mode": "incremental",
+        **changes,
+        "severity_breakdown": severity_counts,
+        "timestamp": datetime.now().isoformat(),
+        "filters": params,
+        "note": "Full alert set (resync)" if changes["reset"] else
+                f"{len(changes['added'])} added, {len(changes['updated'])} updated, {len(changes['expired'])} expired since last poll"
+    }
+
+
+def _save_alerts_state(tool_context: ToolContext, result: Dict[str, Any]) -> None:
+    """Save a get_nws_alerts result (or its poll cursor) to state."""
+    if result["status"] == "success" and result.get("mode") == "incremental":
+        tool_context.state["alerts_cursor"] = result["cursor"]
+    elif result["status"] == "success":
+        # Save to state
+        tool_context.state["alerts"] = {
+            "alerts": result["alerts"],
+            "count": result["total_count"],
+            "severity_breakdown": result["severity_breakdown"],
+            "timestamp": result["timestamp"],
+            "limited": result["total_count"] > 20
+        }
+
+
 @track_tool_call("get_nws_alerts")
 def get_nws_alerts(
     tool_context: ToolContext,
     state: Optional[str] = None,
     latitude: Optional[float] = None,
     longitude: Optional[float] = None,
-    severity: Optional[str] = None
+    severity: Optional[str] = None,
+    states: Optional[List[str]] = None,
+    urgency: Optional[str] = None,
+    certainty: Optional[str] = None,
+    event: Optional[str] = None,
+    zone: Optional[str] = None,
+    region_type: Optional[str] = None,
+    status: Optional[str] = None,
+    message_type: Optional[str] = None,
+    since: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get active weather alerts from NWS API (real-time).
     
+    All filters are applied by NWS, so only matching alerts are downloaded.
+    Comma-separated values are accepted wherever several values make sense.
+    
     Args:
-        state (str): Two-letter state code (e.g., "FL")
+        state (str): Two-letter state code (e.g., "FL") or several ("FL,GA,AL")
         latitude (float): Latitude for point-based alerts
         longitude (float): Longitude for point-based alerts
         severity (str): Filter by severity - "Extreme", "Severe", "Moderate", "Minor"
+        states (list): Two-letter state codes, fetched in a single request
+        urgency (str): Filter by urgency - "Immediate", "Expected", "Future", "Past"
+        certainty (str): Filter by certainty - "Observed", "Likely", "Possible", "Unlikely"
+        event (str): Filter by event name (e.g., "Tornado Warning,Flood Warning")
+        zone (str): NWS zone IDs (e.g., "FLZ069,FLC086")
+        region_type (str): "land" or "marine"
+        status (str): "actual", "exercise", "system", "test" or "draft"
+        message_type (str): "alert", "update" or "cancel"
+        since (str): Incremental polling. Pass "start" on the first poll, then the
+            "cursor" returned by the previous poll; only added, updated and expired
+            alerts are returned instead of the top alerts
         
     Returns:
-        dict: Active weather alerts
+        dict: Active weather alerts (or the changes since the cursor)
     """
-    try:
-        # Build alerts URL
-        if latitude and longitude:
-            alerts_url = f"{NWS_API_BASE}/alerts/active?point={latitude},{longitude}"
-        elif state:
-            alerts_url = f"{NWS_API_BASE}/alerts/active?area={state}"
-        else:
-            alerts_url = f"{NWS_API_BASE}/alerts/active"
-        
-        # Get alerts
-        alerts_response = requests.get(alerts_url, headers=NWS_HEADERS, timeout=10)
-        alerts_response.raise_for_status()
-        alerts_data = alerts_response.json()
-        
-        # Extract and format alerts
-        alerts = []
-        severity_counts = {"Extreme": 0, "Severe": 0, "Moderate": 0, "Minor": 0, "Unknown": 0}
-        
-        for feature in alerts_data.get("features", []):
-            props = feature.get("properties", {})
-            
-            # Filter by severity if specified
-            if severity and props.get("severity") != severity:
-                continue
-            
-            alert_severity = props.get("severity", "Unknown")
-            severity_counts[alert_severity] = severity_counts.get(alert_severity, 0) + 1
-            
-            alerts.append({
-                "event": props.get("event"),
-                "severity": alert_severity,
-                "urgency": props.get("urgency"),
-                "certainty": props.get("certainty"),
-                "headline": props.get("headline"),
-                "description": props.get("description"),
-                "instruction": props.get("instruction"),
-                "onset": props.get("onset"),
-                "expires": props.get("expires"),
-                "affected_zones": props.get("affectedZones", []),
-                "sender_name": props.get("senderName")
-            })
-        
-        # For large alert sets, only return top critical alerts to prevent timeout
-        total_count = len(alerts)
-        if total_count > 10:
-            # Sort by severity priority: Extreme > Severe > Moderate > Minor
-            severity_priority = {"Extreme": 0, "Severe": 1, "Moderate": 2, "Minor": 3, "Unknown": 4}
-            alerts.sort(key=lambda x: severity_priority.get(x["severity"], 4))
-            
-            # More aggressive limiting for national queries (no state/coords specified)
-            if not state and not latitude and not longitude:
-                # National query - limit to top 5 most critical alerts
-                alerts = alerts[:5]
-                logger.info(f"National query: Limiting to top 5 critical alerts out of {total_count} total")
-            else:
-                # Regional query - limit to top 10 alerts
-                alerts = alerts[:10]
-                logger.info(f"Regional query: Limiting to top 10 alerts out of {total_count} total")
-        
-        # Save to state
-        tool_context.state["alerts"] = {
-            "alerts": alerts,
-            "count": total_count,
-            "severity_breakdown": severity_counts,
-            "timestamp": datetime.now().isoformat(),
-            "limited": total_count > 20
-        }
+    result = fetch_nws_alerts(
+        state=state,
+        latitude=latitude,
+        longitude=longitude,
+        severity=severity,
+        states=states,
+        urgency=urgency,
+        certainty=certainty,
+        event=event,
+        zone=zone,
+        region_type=region_type,
+        status=status,
+        message_type=message_type,
+        since=since
+    )
+    
+    _save_alerts_state(tool_context, result)
+    return result
+
+
+@track_tool_call("get_nws_alerts_multi")
+def get_nws_alerts_multi(
+    tool_context: ToolContext,
+    states: Optional[List[str]] = None,
+    points: Optional[List[str]] = None,
+    severity: Optional[str] = None,
+    max_alerts: int = 20
+) -> Dict[str, Any]:
+    """Get active alerts for several states and/or points in one call.
+    
+    All states go to NWS as a single area request; each point is its own request.
+    The requests run concurrently, alerts returned by more than one location are
+    merged by their NWS id, and the result is ranked by severity, urgency and onset.
+    
+    Args:
+        states (list): Two-letter state codes (e.g., ["FL", "GA"])
+        points (list): "latitude,longitude" strings (e.g., ["25.7617,-80.1918"])
+        severity (str): Filter by severity - "Extreme", "Severe", "Moderate", "Minor"
+        max_alerts (int): Maximum number of alerts to return (most critical first)
         
-        logger.info(f"Retrieved {total_count} active alerts, returning {len(alerts)}")
+    Returns:
+        dict: Merged, deduplicated alerts with per-location counts
+    """
+    try:
+        requests_by_location, error = _alerts_multi_requests(states, points, severity)
+        if error:
+            return error
+        
+        locations = list(requests_by_location)
+        max_workers = max(1, min(ALERTS_FETCH_CONCURRENCY, len(locations)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="alerts-fetch") as executor:
+            futures = {
+                location: executor.submit(_fetch_alert_properties, requests_by_location[location])
+                for location in locations
+            }
         
-        return {
-            "status": "success",
-            "alerts": alerts,
-            "total_count": total_count,
-            "returned_count": len(alerts),
-            "severity_breakdown": severity_counts,
-            "timestamp": datetime.now().isoformat(),
-            "limited": total_count > 10,
-            "note": f"Showing top {len(alerts)} critical alerts out of {total_count} total" if total_count > 10 else None
-        }
+        outcomes = {}
+        for location in locations:
+            try:
+                outcomes[location] = futures[location].result()
+            except Exception as e:
+                outcomes[location] = e
+        return _merge_alerts_multi(tool_context, outcomes, max_alerts)
     
     except Exception as e:
-        logger.error(f"Error getting NWS alerts: {str(e)}")
+        logger.error(f"Error getting NWS alerts for multiple locations: {str(e)}")
         return {
             "status": "error",
             "message": f"Failed to get alerts: {str(e)}"
         }
 
 
+def _alerts_multi_requests(
+    states: Optional[List[str]],
+    points: Optional[List[str]],
+    severity: Optional[str]
+):
+    """NWS query parameters per location for get_nws_alerts_multi, plus an error dict (or None)."""
+    requests_by_location = {}
+    area = _csv_param(states, str.upper)
+    if area:
+        requests_by_location[area] = _nws_alert_params(states=[area], severity=severity)
+    for point in dict.fromkeys(points or []):
+        try:
+            lat, lon = (float(part) for part in point.split(","))
+        except ValueError:
+            return {}, {
+                "status": "error",
+                "message": f"Invalid point '{point}'; expected 'latitude,longitude'"
+            }
+        requests_by_location[point] = _nws_alert_params(latitude=lat, longitude=lon, severity=severity)
+    
+    if not requests_by_location:
+        return {}, {
+            "status": "error",
+            "message": "Provide at least one state or point"
+        }
+    return requests_by_location, None
+
+
+def _merge_alerts_multi(
+    tool_context: ToolContext,
+    outcomes: Dict[str, Any],
+    max_alerts: int
+) -> Dict[str, Any]:
+    """Merge per-location alert properties (or the exception each fetch raised) into one ranked result."""
+    # Merge in request order, keeping one copy of each alert
+    merged = {}
+    matched_locations = {}
+    location_counts = {}
+    errors = {}
+    for location, properties in outcomes.items():
+        if isinstance(properties, Exception):
+            logger.warning(f"Alerts fetch failed for {location}: {str(properties)}")
+            errors[location] = str(properties)
+            continue
+        location_counts[location] = len(properties)
+        for props in properties:
+            alert_id = props.get("id") or props.get("@id")
+            key = alert_id or id(props)
+            merged.setdefault(key, props)
+            matched_locations.setdefault(key, []).append(location)
+    
+    if errors and not location_counts:
+        return {
+            "status": "error",
+            "message": f"Failed to get alerts: {'; '.join(f'{loc}: {err}' for loc, err in errors.items())}"
+        }
+    
+    summary = summarize_alerts(merged.values(), top_k=max_alerts)
+    alerts = summary["alerts"]
+    for alert in alerts:
+        alert["matched_locations"] = matched_locations.get(alert["id"], [])
+    
+    total_count = summary["total_count"]
+    duplicates = sum(location_counts.values()) - total_count
+    
+    tool_context.state["alerts"] = {
+        "alerts": alerts,
+        "count": total_count,
+        "severity_breakdown": summary["severity_breakdown"],
+        "timestamp": datetime.now().isoformat(),
+        "limited": total_count > max_alerts
+    }
+    
+    logger.info(
+        f"Retrieved {total_count} unique alerts from {len(location_counts)} locations "
+        f"({duplicates} duplicates merged), returning {len(alerts)}"
+    )
+    
+    return {
+        "status": "success",
+        "alerts": alerts,
+        "total_count": total_count,
+        "returned_count": len(alerts),
+        "severity_breakdown": summary["severity_breakdown"],
+        "location_counts": location_counts,
+        "duplicates_merged": duplicates,
+        "errors": errors or None,
+        "timestamp": datetime.now().isoformat(),
+        "limited": total_count > max_alerts,
+        "note": f"Showing top {len(alerts)} critical alerts out of {total_count} total" if total_count > max_alerts else None
+    }
+
+
 @track_tool_call("get_current_conditions")
 def get_current_conditions(
     tool_context: ToolContext,
@@ -690,37 +1237,8 @@ def get_current_conditions(
     try:
         # Get latest observation
         obs_url = f"{NWS_API_BASE}/stations/{station_id}/observations/latest"
-        obs_response = requests.get(obs_url, headers=NWS_HEADERS, timeout=10)
-        obs_response.raise_for_status()
-        obs_data = obs_response.json()
-        
-        props = obs_data.get("properties", {})
-        
-        # Extract current conditions
-        conditions = {
-            "station_id": station_id,
-            "timestamp": props.get("timestamp"),
-            "temperature": props.get("temperature", {}).get("value"),
-            "temperature_unit": "C",  # NWS returns Celsius
-            "dewpoint": props.get("dewpoint", {}).get("value"),
-            "humidity": props.get("relativeHumidity", {}).get("value"),
-            "wind_speed": props.get("windSpeed", {}).get("value"),
-            "wind_direction": props.get("windDirection", {}).get("value"),
-            "barometric_pressure": props.get("barometricPressure", {}).get("value"),
-            "visibility": props.get("visibility", {}).get("value"),
-            "text_description": props.get("textDescription"),
-            "raw_message": props.get("rawMessage")
-        }
-        
-        # Save to state
-        tool_context.state["current_conditions"] = conditions
-        
-        logger.info(f"Retrieved current conditions for station {station_id}")
-        
-        return {
-            "status": "success",
-            "conditions": conditions
-        }
+        obs_data, stale_age = cached_get_json_with_age(obs_url, headers=NWS_HEADERS, timeout=10)
+        return _current_conditions_result(tool_context, station_id, obs_data, stale_age)
     
     except Exception as e:
         logger.error(f"Error getting current conditions: {str(e)}")
@@ -730,6 +1248,42 @@ def get_current_conditions(
         }
 
 
+def _current_conditions_result(
+    tool_context: ToolContext,
+    station_id: str,
+    obs_data: Dict[str, Any],
+    stale_age: Optional[float] = None
+) -> Dict[str, Any]:
+    """Build the get_current_conditions result from a latest-observation response and save it to state."""
+    props = obs_data.get("properties", {})
+    
+    # Extract current conditions
+    conditions = {
+        "station_id": station_id,
+        "timestamp": props.get("timestamp"),
+        "temperature": props.get("temperature", {}).get("value"),
+        "temperature_unit": "C",  # NWS returns Celsius
+        "dewpoint": props.get("dewpoint", {}).get("value"),
+        "humidity": props.get("relativeHumidity", {}).get("value"),
+        "wind_speed": props.get("windSpeed", {}).get("value"),
+        "wind_direction": props.get("windDirection", {}).get("value"),
+        "barometric_pressure": props.get("barometricPressure", {}).get("value"),
+        "visibility": props.get("visibility", {}).get("value"),
+        "text_description": props.get("textDescription"),
+        "raw_message": props.get("rawMessage")
+    }
+    
+    # Save to state
+    tool_context.state["current_conditions"] = conditions
+    
+    logger.info(f"Retrieved current conditions for station {station_id}")
+    
+    return _mark_stale({
+        "status": "success",
+        "conditions": conditions
+    }, stale_age)
+
+
 @track_tool_call("get_hurricane_track")
 def get_hurricane_track(
     tool_context: ToolContext,
@@ -748,177 +1302,263 @@ def get_hurricane_track(
         # Get active tropical cyclones
         active_storms_url = "https://www.nhc.noaa.gov/CurrentStorms.json"
         
-        response = requests.get(active_storms_url, timeout=15)
-        response.raise_for_status()
-        storms_data = response.json()
-        
-        active_storms = []
-        
-        # Parse active storms
-        if "activeStorms" in storms_data:
-            for storm in storms_data["activeStorms"]:
-                storm_id_val = storm.get("id", "")
-                
-                # If storm_id specified, filter for that storm
-                if storm_id and storm_id_val.lower() != storm_id.lower():
-                    continue
-                
-                # KMZ URLs need uppercase storm ID
-                storm_id_upper = storm_id_val.upper()
+        return _hurricane_track_result(tool_context, fetch_json(active_storms_url, timeout=15), storm_id)
+    
+    except Exception as e:
+        logger.error(f"Error getting hurricane track: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to get hurricane data: {str(e)}. Check https://www.nhc.noaa.gov/ for manual updates."
+        }
+
+
+def _hurricane_track_result(tool_context: ToolContext, storms_data: Dict[str, Any], storm_id: Optional[str]) -> Dict[str, Any]:
+    """Build the get_hurricane_track result from NHC CurrentStorms.json and save it to state."""
+    active_storms = []
+    
+    # Parse active storms
+    if "activeStorms" in storms_data:
+        for storm in storms_data["activeStorms"]:
+            storm_id_val = storm.get("id", "")
+            
+            # If storm_id specified, filter for that storm
+            if storm_id and storm_id_val.lower() != storm_id.lower():
+                continue
+            
+            # KMZ URLs need uppercase storm ID
+            storm_id_upper = storm_id_val.upper()
+            
+            # Get advisory number for accurate KMZ URLs
+            adv_num = "latest"
+            if "publicAdvisory" in storm and isinstance(storm["publicAdvisory"], dict):
+                adv_num = storm["publicAdvisory"].get("advNum", "latest")
+            
+            storm_info = {
+                "id": storm_id_val,
+                "name": storm.get("name"),
+                "classification": storm.get("classification"),
+                "intensity": storm.get("intensity"),
+                "pressure": storm.get("pressure"),
+                "wind_speed": storm.get("windSpeed"),
+                "movement": storm.get("movement"),
+                "current_position": {
+                    "latitude": storm.get("latitudeNumeric"),
+                    "longitude": storm.get("longitudeNumeric")
+                },
+                "last_update": storm.get("lastUpdate"),
+                "public_advisory_url": storm.get("publicAdvisory", {}).get("url") if isinstance(storm.get("publicAdvisory"), dict) else None,
+                "forecast_advisory_url": storm.get("forecastAdvisory", {}).get("url") if isinstance(storm.get("forecastAdvisory"), dict) else None,
+                "wind_graphic_url": storm.get("windFieldGraphic"),
+                "cone_graphic_url": storm.get("trackConeGraphic"),
                 
-                # Get advisory number for accurate KMZ URLs
-                adv_num = "latest"
-                if "publicAdvisory" in storm and isinstance(storm["publicAdvisory"], dict):
-                    adv_num = storm["publicAdvisory"].get("advNum", "latest")
+                # NHC KMZ files for visualization (use uppercase ID and advisory number)
+                "kmz_files": {
+                    "cone": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_{adv_num}adv_CONE.kmz",
+                    "track": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_{adv_num}adv_TRACK.kmz",
+                    "warnings": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_{adv_num}adv_WW.kmz",
+                    "initial_radii": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_initialradii_{adv_num}adv.kmz",
+                    "forecast_radii": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_forecastradii_{adv_num}adv.kmz"
+                },
                 
-                storm_info = {
-                    "id": storm_id_val,
-                    "name": storm.get("name"),
-                    "classification": storm.get("classification"),
-                    "intensity": storm.get("intensity"),
-                    "pressure": storm.get("pressure"),
-                    "wind_speed": storm.get("windSpeed"),
-                    "movement": storm.get("movement"),
-                    "current_position": {
-                        "latitude": storm.get("latitudeNumeric"),
-                        "longitude": storm.get("longitudeNumeric")
-                    },
-                    "last_update": storm.get("lastUpdate"),
-                    "public_advisory_url": storm.get("publicAdvisory", {}).get("url") if isinstance(storm.get("publicAdvisory"), dict) else None,
-                    "forecast_advisory_url": storm.get("forecastAdvisory", {}).get("url") if isinstance(storm.get("forecastAdvisory"), dict) else None,
-                    "wind_graphic_url": storm.get("windFieldGraphic"),
-                    "cone_graphic_url": storm.get("trackConeGraphic"),
-                    
-                    # NHC KMZ files for visualization (use uppercase ID and advisory number)
-                    "kmz_files": {
-                        "cone": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_{adv_num}adv_CONE.kmz",
-                        "track": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_{adv_num}adv_TRACK.kmz",
-                        "warnings": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_{adv_num}adv_WW.kmz",
-                        "initial_radii": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_initialradii_{adv_num}adv.kmz",
-                        "forecast_radii": f"https://www.nhc.noaa.gov/storm_graphics/api/{storm_id_upper}_forecastradii_{adv_num}adv.kmz"
-                    },
-                    
-                    # NHC Graphics page - shows all visualizations
-                    "nhc_graphics_url": f"https://www.nhc.noaa.gov/graphics_{storm.get('binNumber', '').lower()}.shtml",
-                    
-                    # Google Earth Web import instructions
-                    "google_earth_web_url": "https://earth.google.com/web/",
-                    "visualization_instructions": "To view in Google Earth: 1) Download the KMZ file, 2) Go to earth.google.com/web, 3) Click menu (☰) → Import KML file, 4) Select the downloaded KMZ file",
-                    
-                    # Shapefile downloads
-                    "shapefiles": {
-                        "5day_forecast": f"https://www.nhc.noaa.gov/gis/forecast/archive/{storm_id_val.lower()}_5day_latest.zip",
-                        "forecast_radii": f"https://www.nhc.noaa.gov/gis/forecast/archive/{storm_id_val.lower()}_fcst_latest.zip"
-                    }
-                }
+                # NHC Graphics page - shows all visualizations
+                "nhc_graphics_url": f"https://www.nhc.noaa.gov/graphics_{storm.get('binNumber', '').lower()}.shtml",
                 
-                # Get forecast track points if available
-                if "forecastTrack" in storm:
-                    storm_info["forecast_track"] = storm["forecastTrack"]
+                # Google Earth Web import instructions
+                "google_earth_web_url": "https://earth.google.com/web/",
+                "visualization_instructions": "To view in Google Earth: 1) Download the KMZ file, 2) Go to earth.google.com/web, 3) Click menu (☰) → Import KML file, 4) Select the downloaded KMZ file",
                 
-                active_storms.append(storm_info)
-        
-        # Save to state
-        tool_context.state["hurricane_data"] = {
-            "active_storms": active_storms,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        if not active_storms:
-            return {
-                "status": "success",
-                "message": "No active tropical cyclones at this time",
-                "data": {
-                    "active_storms": [],
-                    "nhc_url": "https://www.nhc.noaa.gov/"
+                # Shapefile downloads
+                "shapefiles": {
+                    "5day_forecast": f"https://www.nhc.noaa.gov/gis/forecast/archive/{storm_id_val.lower()}_5day_latest.zip",
+                    "forecast_radii": f"https://www.nhc.noaa.gov/gis/forecast/archive/{storm_id_val.lower()}_fcst_latest.zip"
                 }
             }
-        
-        logger.info(f"Retrieved {len(active_storms)} active tropical cyclone(s) with KMZ visualization links")
-        
+            
+            # Get forecast track points if available
+            if "forecastTrack" in storm:
+                storm_info["forecast_track"] = storm["forecastTrack"]
+            
+            active_storms.append(storm_info)
+    
+    # Save to state
+    tool_context.state["hurricane_data"] = {
+        "active_storms": active_storms,
+        "timestamp": datetime.now().isoformat()
+    }
+    
+    if not active_storms:
         return {
             "status": "success",
+            "message": "No active tropical cyclones at this time",
             "data": {
-                "active_storms": active_storms,
-                "count": len(active_storms),
-                "nhc_url": "https://www.nhc.noaa.gov/",
-                "visualization_note": "KMZ files can be opened in Google Earth or converted to GeoJSON for web mapping",
-                "timestamp": datetime.now().isoformat()
+                "active_storms": [],
+                "nhc_url": "https://www.nhc.noaa.gov/"
             }
         }
     
-    except Exception as e:
-        logger.error(f"Error getting hurricane track: {str(e)}")
-        return {
-            "status": "error",
-            "message": f"Failed to get hurricane data: {str(e)}. Check https://www.nhc.noaa.gov/ for manual updates."
+    logger.info(f"Retrieved {len(active_storms)} active tropical cyclone(s) with KMZ visualization links")
+    
+    return {
+        "status": "success",
+        "data": {
+            "active_storms": active_storms,
+            "count": len(active_storms),
+            "nhc_url": "https://www.nhc.noaa.gov/",
+            "visualization_note": "KMZ files can be opened in Google Earth or converted to GeoJSON for web mapping",
+            "timestamp": datetime.now().isoformat()
         }
+    }
 
 
 # Google Maps API Configuration
-GOOGLE_MAPS_API_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
 GOOGLE_MAPS_BASE = "https://maps.googleapis.com/maps/api"
 
 
-@track_tool_call("geocode_address")
-def geocode_address(
-    tool_context: ToolContext,
-    address: str
-) -> Dict[str, Any]:
-    """Geocode an address to latitude/longitude coordinates using Google Maps Geocoding API.
+def _google_maps_api_key() -> Optional[str]:
+    """Read the Maps API key (after lazily loading .env)."""
+    ensure_env_loaded()
+    return os.getenv("GOOGLE_MAPS_API_KEY")
+
+
+# Geocodes of the same (normalized) query rarely change, so keep Google results for a long time
+GEOCODE_CACHE_TTL = float(os.getenv("GEOCODE_CACHE_TTL", str(30 * 24 * 3600)))
+# Disk cap; eviction runs only when the tier passes it by CACHE_EVICT_SLACK, not on every miss
+GEOCODE_CACHE_MAX_ENTRIES = int(os.getenv("GEOCODE_CACHE_MAX_ENTRIES", "100000"))
+geocode_cache = TieredCache(
+    "geocode",
+    ttl_seconds=GEOCODE_CACHE_TTL,
+    max_memory_items=4096,
+    max_disk_items=GEOCODE_CACHE_MAX_ENTRIES
+)
+
+# Resolve "City, ST", ZIP and county queries from the Census Gazetteer instead of Google
+GEOCODE_USE_GAZETTEER = os.getenv("GEOCODE_USE_GAZETTEER", "true").lower() == "true"
+
+
+def normalize_geocode_query(address: str) -> str:
+    """Cache key for a geocoding query: case, spacing and comma spacing folded."""
+    text = " ".join((address or "").split()).strip(" ,").lower()
+    return ", ".join(part.strip() for part in text.split(",") if part.strip())
+
+
+def geocode_location(address: str) -> Dict[str, Any]:
+    """Geocode an address without a ToolContext.
+    
+    Plain place names ("Miami, FL"), ZIP codes and counties are answered from the
+    local Census Gazetteer; anything else goes to the Google Geocoding API and the
+    result is cached under the normalized query.
     
     Args:
-        address (str): Address to geocode (e.g., "1600 Amphitheatre Parkway, Mountain View, CA")
+        address (str): Address, "City, ST", county or ZIP code
         
     Returns:
-        dict: Geocoding results with coordinates and formatted address
+        dict: {"status": "success", "result": {...}} or an error dict
     """
-    try:
-        if not GOOGLE_MAPS_API_KEY:
-            return {
-                "status": "error",
-                "message": "GOOGLE_MAPS_API_KEY not configured"
-            }
-        
-        # Call Google Maps Geocoding API
-        geocode_url = f"{GOOGLE_MAPS_BASE}/geocode/json"
-        params = {
-            "address": address,
-            "key": GOOGLE_MAPS_API_KEY
+    query, local = _geocode_locally(address)
+    if local:
+        return local
+    
+    api_key = _google_maps_api_key()
+    if not api_key:
+        return {
+            "status": "error",
+            "message": "GOOGLE_MAPS_API_KEY not configured"
         }
-        
-        response = requests.get(geocode_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data["status"] != "OK":
-            return {
-                "status": "error",
-                "message": f"Geocoding failed: {data.get('status')}"
+    
+    # Call Google Maps Geocoding API
+    data = fetch_json(f"{GOOGLE_MAPS_BASE}/geocode/json", params={"address": address, "key": api_key}, timeout=10)
+    return _google_geocode_result(address, query, data)
+
+
+def _geocode_locally(address: str):
+    """Answer a geocoding query from the Gazetteer or the cache.
+    
+    Returns:
+        tuple: (normalized query, result dict or None when Google must be called)
+    """
+    query = normalize_geocode_query(address)
+    if not query:
+        return query, {
+            "status": "error",
+            "message": "Address is empty"
+        }
+    
+    # None while the Gazetteer is still loading (or failed to); Google answers meanwhile
+    gazetteer = get_gazetteer() if GEOCODE_USE_GAZETTEER else None
+    if gazetteer is not None:
+        geocode_result = gazetteer.lookup(address)
+        if geocode_result:
+            logger.info(f"Geocoded address from Census Gazetteer: {address} -> {geocode_result['latitude']},{geocode_result['longitude']}")
+            return query, {
+                "status": "success",
+                "result": geocode_result
             }
+    
+    cached = geocode_cache.get(query)
+    if cached is not None:
+        logger.info(f"Geocode cache hit: {address}")
+        return query, {
+            "status": "success",
+            "result": dict(cached, address=address)
+        }
+    return query, None
+
+
+def _google_geocode_result(address: str, query: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a geocode result from a Geocoding API response and cache it."""
+    if data["status"] != "OK":
+        return {
+            "status": "error",
+            "message": f"Geocoding failed: {data.get('status')}"
+        }
+    
+    # Extract first result
+    result = data["results"][0]
+    location = result["geometry"]["location"]
+    
+    geocode_result = {
+        "address": address,
+        "formatted_address": result["formatted_address"],
+        "latitude": location["lat"],
+        "longitude": location["lng"],
+        "place_id": result["place_id"],
+        "types": result.get("types", []),
+        "source": "google"
+    }
+    geocode_cache.set(query, geocode_result)
+    
+    logger.info(f"Geocoded address: {address} -> {location['lat']},{location['lng']}")
+    
+    return {
+        "status": "success",
+        "result": geocode_result
+    }
+
+
+@track_tool_call("geocode_address")
+def geocode_address(
+    tool_context: ToolContext,
+    address: str
+) -> Dict[str, Any]:
+    """Geocode an address to latitude/longitude coordinates.
+    
+    Cities ("Miami, FL"), counties and ZIP codes are resolved locally; street
+    addresses use the Google Maps Geocoding API (results are cached).
+    
+    Args:
+        address (str): Address to geocode (e.g., "1600 Amphitheatre Parkway, Mountain View, CA")
         
-        # Extract first result
-        result = data["results"][0]
-        location = result["geometry"]["location"]
-        
-        geocode_result = {
-            "address": address,
-            "formatted_address": result["formatted_address"],
-            "latitude": location["lat"],
-            "longitude": location["lng"],
-            "place_id": result["place_id"],
-            "types": result.get("types", [])
-        }
+    Returns:
+        dict: Geocoding results with coordinates and formatted address
+    """
+    try:
+        result = geocode_location(address)
         
         # Save to state
-        tool_context.state["geocode_result"] = geocode_result
-        
-        logger.info(f"Geocoded address: {address} -> {location['lat']},{location['lng']}")
+        if result.get("status") == "success":
+            tool_context.state["geocode_result"] = result["result"]
         
-        return {
-            "status": "success",
-            "result": geocode_result
-        }
+        return result
     
     except Exception as e:
         logger.error(f"Error geocoding address: {str(e)}")
@@ -948,7 +1588,8 @@ def get_directions(
         dict: Directions with routes, distances, and travel times
     """
     try:
-        if not GOOGLE_MAPS_API_KEY:
+        api_key = _google_maps_api_key()
+        if not api_key:
             return {
                 "status": "error",
                 "message": "GOOGLE_MAPS_API_KEY not configured"
@@ -961,57 +1602,11 @@ def get_directions(
             "destination": destination,
             "mode": mode,
             "alternatives": alternatives,
-            "key": GOOGLE_MAPS_API_KEY
-        }
-        
-        response = requests.get(directions_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data["status"] != "OK":
-            return {
-                "status": "error",
-                "message": f"Directions failed: {data.get('status')}"
-            }
-        
-        # Extract routes
-        routes = []
-        for route in data["routes"]:
-            leg = route["legs"][0]  # First leg
-            routes.append({
-                "summary": route.get("summary", "Route"),
-                "distance": leg["distance"]["text"],
-                "distance_meters": leg["distance"]["value"],
-                "duration": leg["duration"]["text"],
-                "duration_seconds": leg["duration"]["value"],
-                "start_address": leg["start_address"],
-                "end_address": leg["end_address"],
-                "steps": [
-                    {
-                        "instruction": step["html_instructions"],
-                        "distance": step["distance"]["text"],
-                        "duration": step["duration"]["text"]
-                    }
-                    for step in leg["steps"][:5]  # First 5 steps only
-                ]
-            })
-        
-        directions_result = {
-            "origin": origin,
-            "destination": destination,
-            "mode": mode,
-            "routes": routes
+            "key": api_key
         }
         
-        # Save to state
-        tool_context.state["directions"] = directions_result
-        
-        logger.info(f"Got directions: {origin} -> {destination}, {len(routes)} routes")
-        
-        return {
-            "status": "success",
-            "result": directions_result
-        }
+        data = fetch_json(directions_url, params=params, timeout=10)
+        return _directions_result(tool_context, origin, destination, mode, data)
     
     except Exception as e:
         logger.error(f"Error getting directions: {str(e)}")
@@ -1021,6 +1616,73 @@ def get_directions(
         }
 
 
+def _directions_result(
+    tool_context: ToolContext,
+    origin: str,
+    destination: str,
+    mode: str,
+    data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the get_directions result from a Directions API response and save it to state."""
+    if data["status"] != "OK":
+        return {
+            "status": "error",
+            "message": f"Directions failed: {data.get('status')}"
+        }
+    
+    # Extract routes
+    routes = []
+    for route in data["routes"]:
+        leg = route["legs"][0]  # First leg
+        routes.append({
+            "summary": route.get("summary", "Route"),
+            "distance": leg["distance"]["text"],
+            "distance_meters": leg["distance"]["value"],
+            "duration": leg["duration"]["text"],
+            "duration_seconds": leg["duration"]["value"],
+            "start_address": leg["start_address"],
+            "end_address": leg["end_address"],
+            "steps": [
+                {
+                    "instruction": step["html_instructions"],
+                    "distance": step["distance"]["text"],
+                    "duration": step["duration"]["text"]
+                }
+                for step in leg["steps"][:5]  # First 5 steps only
+            ]
+        })
+    
+    directions_result = {
+        "origin": origin,
+        "destination": destination,
+        "mode": mode,
+        "routes": routes
+    }
+    
+    # Save to state
+    tool_context.state["directions"] = directions_result
+    
+    logger.info(f"Got directions: {origin} -> {destination}, {len(routes)} routes")
+    
+    return {
+        "status": "success",
+        "result": directions_result
+    }
+
+
+def _format_place(place: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a Places Nearby Search result."""
+    return {
+        "name": place.get("name"),
+        "address": place.get("vicinity"),
+        "location": place["geometry"]["location"],
+        "place_id": place.get("place_id"),
+        "types": place.get("types", []),
+        "rating": place.get("rating"),
+        "open_now": place.get("opening_hours", {}).get("open_now")
+    }
+
+
 @track_tool_call("search_nearby_places")
 def search_nearby_places(
     tool_context: ToolContext,
@@ -1041,7 +1703,8 @@ def search_nearby_places(
         dict: List of nearby places with details
     """
     try:
-        if not GOOGLE_MAPS_API_KEY:
+        api_key = _google_maps_api_key()
+        if not api_key:
             return {
                 "status": "error",
                 "message": "GOOGLE_MAPS_API_KEY not configured"
@@ -1053,53 +1716,159 @@ def search_nearby_places(
             "location": location,
             "radius": radius,
             "type": place_type,
-            "key": GOOGLE_MAPS_API_KEY
+            "key": api_key
         }
         
         if keyword:
             params["keyword"] = keyword
         
-        response = requests.get(places_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data["status"] not in ["OK", "ZERO_RESULTS"]:
-            return {
-                "status": "error",
-                "message": f"Places search failed: {data.get('status')}"
-            }
-        
-        # Extract places
-        places = []
-        for place in data.get("results", [])[:10]:  # Limit to 10 results
-            places.append({
-                "name": place.get("name"),
-                "address": place.get("vicinity"),
-                "location": place["geometry"]["location"],
-                "place_id": place.get("place_id"),
-                "types": place.get("types", []),
-                "rating": place.get("rating"),
-                "open_now": place.get("opening_hours", {}).get("open_now")
-            })
-        
-        search_result = {
-            "location": location,
-            "place_type": place_type,
-            "radius_meters": radius,
-            "keyword": keyword,
-            "places": places,
-            "count": len(places)
+        data = fetch_json(places_url, params=params, timeout=10)
+        return _nearby_places_result(tool_context, location, place_type, radius, keyword, data)
+    
+    except Exception as e:
+        logger.error(f"Error searching nearby places: {str(e)}")
+        return {
+            "status": "error",
+            "message": f"Failed to search places: {str(e)}"
+        }
+
+
+def _nearby_places_result(
+    tool_context: ToolContext,
+    location: str,
+    place_type: str,
+    radius: int,
+    keyword: Optional[str],
+    data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the search_nearby_places result from a Nearby Search response and save it to state."""
+    if data["status"] not in ["OK", "ZERO_RESULTS"]:
+        return {
+            "status": "error",
+            "message": f"Places search failed: {data.get('status')}"
         }
+    
+    # Extract places
+    places = [_format_place(place) for place in data.get("results", [])[:10]]  # Limit to 10 results
+    
+    search_result = {
+        "location": location,
+        "place_type": place_type,
+        "radius_meters": radius,
+        "keyword": keyword,
+        "places": places,
+        "count": len(places)
+    }
+    
+    # Save to state
+    tool_context.state["nearby_places"] = search_result
+    
+    logger.info(f"Found {len(places)} places of type '{place_type}' near {location}")
+    
+    return {
+        "status": "success",
+        "result": search_result
+    }
+
+
+# Concurrent Places requests per search_nearby_places_multi call
+PLACES_FETCH_CONCURRENCY = int(os.getenv("PLACES_FETCH_CONCURRENCY", "8"))
+# A next_page_token only becomes valid a short time after it is issued
+PLACES_PAGE_TOKEN_DELAY = 2.0
+# Google returns at most 3 pages (60 results) per search
+PLACES_MAX_PAGES = 3
+
+
+def _iter_places(params: Dict[str, Any]):
+    """Yield Nearby Search results, fetching the next page only when more are consumed."""
+    places_url = f"{GOOGLE_MAPS_BASE}/place/nearbysearch/json"
+    page_params = params
+    for page in range(PLACES_MAX_PAGES):
+        for attempt in range(2):
+            data = fetch_json(places_url, params=page_params, timeout=10)
+            if _page_token_pending(page, attempt, data):
+                time.sleep(PLACES_PAGE_TOKEN_DELAY)
+                continue
+            break
         
-        # Save to state
-        tool_context.state["nearby_places"] = search_result
+        yield from _places_page_results(data)
+        
+        token = data.get("next_page_token")
+        if not token:
+            return
+        time.sleep(PLACES_PAGE_TOKEN_DELAY)
+        page_params = {"pagetoken": token, "key": params["key"]}
+
+
+def _page_token_pending(page: int, attempt: int, data: Dict[str, Any]) -> bool:
+    """INVALID_REQUEST on a follow-up page means the token is not active yet (retry once)."""
+    return bool(page) and attempt == 0 and data.get("status") == "INVALID_REQUEST"
+
+
+def _places_page_results(data: Dict[str, Any]) -> list:
+    if data.get("status") not in ["OK", "ZERO_RESULTS"]:
+        raise RuntimeError(f"Places search failed: {data.get('status')}")
+    return data.get("results", [])
+
+
+def _search_places_category(params: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+    """First `limit` results of one Nearby Search; later pages are only requested if needed."""
+    places = []
+    for place in _iter_places(params):
+        places.append(place)
+        if len(places) >= limit:
+            break
+    return places
+
+
+@track_tool_call("search_nearby_places_multi")
+def search_nearby_places_multi(
+    tool_context: ToolContext,
+    location: str,
+    place_types: Optional[List[str]] = None,
+    keywords: Optional[List[str]] = None,
+    radius: int = 5000,
+    max_per_category: int = 10,
+    max_results: int = 20
+) -> Dict[str, Any]:
+    """Search several kinds of nearby places in one call using Google Maps Places API.
+    
+    Each place type and each keyword is its own Nearby Search; the searches run
+    concurrently. Places found by more than one search are merged by place_id and
+    the merged list is ranked by distance from the center.
+    
+    Args:
+        location (str): Center point as "lat,lng"
+        place_types (list): Place types (e.g., ["hospital", "pharmacy", "gas_station"])
+        keywords (list): Free-text searches for places without a type (e.g., ["emergency shelter"])
+        radius (int): Search radius in meters (default 5000m = 5km)
+        max_per_category (int): Results to take from each search (more than 20 fetches extra pages)
+        max_results (int): Maximum number of merged places to return (nearest first; each
+            category that found places keeps its nearest max_results // categories)
         
-        logger.info(f"Found {len(places)} places of type '{place_type}' near {location}")
+    Returns:
+        dict: Nearby places with distance_km and the categories that matched them
+    """
+    try:
+        searches, error = _places_multi_searches(location, place_types, keywords, radius)
+        if error:
+            return error
+        
+        categories = list(searches)
+        max_workers = max(1, min(PLACES_FETCH_CONCURRENCY, len(categories)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="places-fetch") as executor:
+            futures = {
+                category: executor.submit(_search_places_category, searches[category], max_per_category)
+                for category in categories
+            }
         
-        return {
-            "status": "success",
-            "result": search_result
-        }
+        outcomes = {}
+        for category in categories:
+            try:
+                outcomes[category] = futures[category].result()
+            except Exception as e:
+                outcomes[category] = e
+        return _merge_places_multi(tool_context, location, radius, outcomes, max_results)
     
     except Exception as e:
         logger.error(f"Error searching nearby places: {str(e)}")
@@ -1109,6 +1878,191 @@ def search_nearby_places(
         }
 
 
+def _places_multi_searches(
+    location: str,
+    place_types: Optional[List[str]],
+    keywords: Optional[List[str]],
+    radius: int
+):
+    """Nearby Search parameters per category for search_nearby_places_multi, plus an error dict (or None)."""
+    api_key = _google_maps_api_key()
+    if not api_key:
+        return {}, {
+            "status": "error",
+            "message": "GOOGLE_MAPS_API_KEY not configured"
+        }
+    
+    try:
+        _parse_lat_lng(location)
+    except ValueError:
+        return {}, {
+            "status": "error",
+            "message": f"Invalid location '{location}'; expected 'lat,lng'"
+        }
+    
+    searches = {}
+    for place_type in dict.fromkeys(place_types or []):
+        searches[place_type] = {"location": location, "radius": radius, "type": place_type, "key": api_key}
+    for keyword in dict.fromkeys(keywords or []):
+        searches.setdefault(keyword, {"location": location, "radius": radius, "keyword": keyword, "key": api_key})
+    
+    if not searches:
+        return {}, {
+            "status": "error",
+            "message": "Provide at least one place type or keyword"
+        }
+    return searches, None
+
+
+def _parse_lat_lng(location: str):
+    latitude, longitude = (float(part) for part in location.split(","))
+    return latitude, longitude
+
+
+def _merge_places_multi(
+    tool_context: ToolContext,
+    location: str,
+    radius: int,
+    outcomes: Dict[str, Any],
+    max_results: int
+) -> Dict[str, Any]:
+    """Merge per-category results (or the exception each search raised), nearest first.
+    
+    Every category that found places keeps its nearest max_results // categories of
+    them (at least one), so close hospitals cannot push all shelters out of the list.
+    """
+    center_lat, center_lng = _parse_lat_lng(location)
+    categories = list(outcomes)
+    
+    # Merge in request order, keeping one copy of each place
+    merged = {}
+    category_counts = {}
+    errors = {}
+    for category, results in outcomes.items():
+        if isinstance(results, Exception):
+            logger.warning(f"Places search failed for '{category}': {str(results)}")
+            errors[category] = str(results)
+            continue
+        category_counts[category] = len(results)
+        for result in results:
+            key = result.get("place_id") or id(result)
+            if key not in merged:
+                place = _format_place(result)
+                place["distance_km"] = round(
+                    haversine_km(center_lat, center_lng, place["location"]["lat"], place["location"]["lng"]), 2
+                )
+                place["categories"] = []
+                merged[key] = place
+            merged[key]["categories"].append(category)
+    
+    if errors and not category_counts:
+        return {
+            "status": "error",
+            "message": f"Failed to search places: {'; '.join(f'{cat}: {err}' for cat, err in errors.items())}"
+        }
+    
+    places = _nearest_with_quota(list(merged.values()), categories, max_results)
+    search_result = {
+        "location": location,
+        "radius_meters": radius,
+        "categories": categories,
+        "category_counts": category_counts,
+        "places": places,
+        "count": len(places),
+        "total_unique": len(merged)
+    }
+    if errors:
+        search_result["errors"] = errors
+    
+    # Save to state
+    tool_context.state["nearby_places"] = search_result
+    
+    logger.info(
+        f"Found {len(merged)} unique places for {len(categories)} categories near {location}, "
+        f"returning nearest {len(places)}"
+    )
+    
+    return {
+        "status": "success",
+        "result": search_result
+    }
+
+
+def _nearest_with_quota(places: List[Dict[str, Any]], categories: List[str], max_results: int) -> List[Dict[str, Any]]:
+    """Nearest max_results places, after reserving each non-empty category's nearest share."""
+    ranked = sorted(places, key=lambda place: place["distance_km"])
+    found = [category for category in categories if any(category in place["categories"] for place in ranked)]
+    if not found:
+        return []
+    quota = max(1, max_results // len(found))
+    
+    chosen = {}
+    for category in found:
+        matches = [place for place in ranked if category in place["categories"]]
+        for place in matches[:quota]:
+            chosen[id(place)] = place
+    for place in ranked:
+        if len(chosen) >= max_results:
+            break
+        chosen.setdefault(id(place), place)
+    return sorted(chosen.values(), key=lambda place: place["distance_km"])
+
+
+def build_map_data(
+    center_lat: float,
+    center_lng: float,
+    zoom: int = 12,
+    markers: Optional[list] = None
+) -> Dict[str, Any]:
+    """Build the map_data structure (center, zoom, structured markers, Google Maps URL)."""
+    # Build Google Maps URL with markers
+    # For multiple markers, use the directions API format with waypoints
+    
+    if markers and len(markers) > 0:
+        # Build a URL that shows all markers
+        # Format: https://www.google.com/maps/dir/?api=1&destination=lat,lng&waypoints=lat1,lng1|lat2,lng2
+        
+        # Use first marker as destination
+        first_marker = markers[0]
+        dest_lat = first_marker.get('lat', center_lat)
+        dest_lng = first_marker.get('lng', center_lng)
+        
+        # Build waypoints from remaining markers (up to 9 waypoints max for Google Maps)
+        waypoints = []
+        for marker in markers[1:9]:  # Limit to 8 additional waypoints
+            lat = marker.get('lat')
+            lng = marker.get('lng')
+            if lat and lng:
+                waypoints.append(f"{lat},{lng}")
+        
+        # Construct the URL
+        map_url = f"https://www.google.com/maps/dir/?api=1&destination={dest_lat},{dest_lng}"
+        if waypoints:
+            map_url += f"&waypoints={('|').join(waypoints)}"
+        map_url += "&travelmode=driving"
+    else:
+        # No markers, just center location
+        map_url = f"https://www.google.com/maps/search/?api=1&query={center_lat},{center_lng}&zoom={zoom}"
+    
+    # Structured markers for the frontend
+    structured_markers = []
+    if markers:
+        for marker in markers:
+            structured_markers.append({
+                "lat": marker.get('lat'),
+                "lng": marker.get('lng'),
+                "title": marker.get('title', 'Location'),
+                "address": marker.get('address', '')
+            })
+    
+    return {
+        "center": {"lat": center_lat, "lng": center_lng},
+        "zoom": zoom,
+        "markers": structured_markers,
+        "map_url": map_url
+    }
+
+
 @track_tool_call("generate_map")
 def generate_map(
     tool_context: ToolContext,
@@ -1131,52 +2085,11 @@ def generate_map(
         dict: Google Maps URL and marker information with structured marker data
     """
     try:
-        # Build Google Maps URL with markers
-        # For multiple markers, use the directions API format with waypoints
-        
-        if markers and len(markers) > 0:
-            # Build a URL that shows all markers
-            # Format: https://www.google.com/maps/dir/?api=1&destination=lat,lng&waypoints=lat1,lng1|lat2,lng2
-            
-            # Use first marker as destination
-            first_marker = markers[0]
-            dest_lat = first_marker.get('lat', center_lat)
-            dest_lng = first_marker.get('lng', center_lng)
-            
-            # Build waypoints from remaining markers (up to 9 waypoints max for Google Maps)
-            waypoints = []
-            for marker in markers[1:9]:  # Limit to 8 additional waypoints
-                lat = marker.get('lat')
-                lng = marker.get('lng')
-                if lat and lng:
-                    waypoints.append(f"{lat},{lng}")
-            
-            # Construct the URL
-            map_url = f"https://www.google.com/maps/dir/?api=1&destination={dest_lat},{dest_lng}"
-            if waypoints:
-                map_url += f"&waypoints={('|').join(waypoints)}"
-            map_url += "&travelmode=driving"
-        else:
-            # No markers, just center location
-            map_url = f"https://www.google.com/maps/search/?api=1&query={center_lat},{center_lng}&zoom={zoom}"
+        map_data = build_map_data(center_lat, center_lng, zoom, markers)
+        map_url = map_data["map_url"]
+        structured_markers = map_data["markers"]
         
-        # Store map data in state with structured markers for frontend
-        structured_markers = []
-        if markers:
-            for marker in markers:
-                structured_markers.append({
-                    "lat": marker.get('lat'),
-                    "lng": marker.get('lng'),
-                    "title": marker.get('title', 'Location'),
-                    "address": marker.get('address', '')
-                })
-        
-        tool_context.state["map_data"] = {
-            "center": {"lat": center_lat, "lng": center_lng},
-            "zoom": zoom,
-            "markers": structured_markers,
-            "map_url": map_url
-        }
+        tool_context.state["map_data"] = map_data
         
         # Build marker summary for agent response
         marker_summary = []
@@ -1230,6 +2143,8 @@ def get_census_tracts_in_area(
         dict: Census tract data with demographics including elderly population percentages
     """
     try:
+        from google.cloud import bigquery  # Imported lazily to keep agent cold starts fast
+        
         # Build query for census tracts with demographic data
         # Note: This table doesn't have lat/lon columns, only geo_id
         query = """
@@ -1261,9 +2176,7 @@ def get_census_tracts_in_area(
         
         query += " AND total_pop > 0 ORDER BY elderly_percentage DESC LIMIT 100"
         
-        job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-        query_job = bq_client.query(query, job_config=job_config)
-        results = query_job.result()
+        results = run_query(query, query_parameters=query_params)
         
         census_tracts = []
         for row in results:
@@ -1338,6 +2251,8 @@ def get_flood_risk_data(
         dict: Flood risk information and historical flooding events
     """
     try:
+        from google.cloud import bigquery  # Imported lazily to keep agent cold starts fast
+        
         # Query NOAA historical weather data for flooding events
         # Join with stations table to filter by state
         query = """
@@ -1364,9 +2279,7 @@ def get_flood_risk_data(
             bigquery.ScalarQueryParameter("state", "STRING", state)
         ]
         
-        job_config = bigquery.QueryJobConfig(query_parameters=query_params)
-        query_job = bq_client.query(query, job_config=job_config)
-        results = query_job.result()
+        results = run_query(query, query_parameters=query_params)
         
         flood_events = []
         for row in results:
@@ -1425,6 +2338,110 @@ def get_flood_risk_data(
         }
 
 
+# Zone resolution configuration
+ZONE_FETCH_CONCURRENCY = int(os.getenv("ZONE_FETCH_CONCURRENCY", "8"))
+
+
+def _fetch_zone_coordinates(zone_id: str) -> Optional[Dict[str, Any]]:
+    """Resolve a single zone ID to its centroid, trying fallback endpoints in order.
+
+    Fallbacks are only attempted when the preferred endpoint does not return the
+    zone, and an endpoint is never requested twice for the same zone. Successful
+    lookups are written to the zone cache.
+    """
+    try:
+        data = None
+        for url in _zone_endpoints(zone_id):
+            try:
+                data = fetch_json(url, headers=NWS_HEADERS, timeout=10)
+                break
+            except Exception:
+                continue
+
+        return _zone_record(zone_id, data)
+
+    except Exception as e:
+        logger.error(f"Error getting coordinates for zone {zone_id}: {str(e)}")
+        return None
+
+
+def _zone_endpoints(zone_id: str) -> List[str]:
+    """Zone URLs to try in order: the zone's own type first, then the fallbacks."""
+    zone_type = get_zone_type(zone_id)
+
+    # Try different endpoints based on zone type
+    endpoints = [
+        f"{NWS_API_BASE}/zones/{zone_type}/{zone_id}",
+        f"{NWS_API_BASE}/zones/forecast/{zone_id}",  # Fallback
+        f"{NWS_API_BASE}/zones/county/{zone_id}",    # Fallback
+    ]
+    return list(dict.fromkeys(endpoints))
+
+
+def _zone_record(zone_id: str, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Turn a fetched zone feature into a centroid record and cache it."""
+    if not data:
+        logger.warning(f"Failed to get coordinates for zone {zone_id} from all endpoints")
+        return None
+
+    record = zone_record_from_feature(data, zone_id=zone_id)
+    if not record:
+        logger.warning(f"No geometry found for zone {zone_id}")
+        return None
+
+    cache_zone(record)
+    logger.info(f"Got coordinates for {get_zone_type(zone_id)} zone {zone_id}: ({record['latitude']}, {record['longitude']})")
+    return record
+
+
+def resolve_zone_coordinates(zone_ids: List[str]) -> List[Dict[str, Any]]:
+    """Resolve NWS zone IDs to centroid records, in the order requested.
+
+    Indexed and cached zones are served locally; only unknown zones go to the
+    network, at most ZONE_FETCH_CONCURRENCY at a time. Zones that cannot be
+    resolved are left out.
+    """
+    resolved, pending = _local_zone_coordinates(zone_ids)
+    
+    if pending:
+        max_workers = max(1, min(ZONE_FETCH_CONCURRENCY, len(pending)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zone-fetch") as executor:
+            for zone_id, coords in zip(pending, executor.map(_fetch_zone_coordinates, pending)):
+                if coords:
+                    resolved[zone_id] = coords
+    
+    # Preserve the requested order (including repeated IDs)
+    return [resolved[zone_id] for zone_id in zone_ids if zone_id in resolved]
+
+
+def _local_zone_coordinates(zone_ids: List[str]):
+    """Serve indexed and cached zones directly.
+    
+    Returns:
+        tuple: (records by zone ID, zone IDs that must be fetched from NWS)
+    """
+    unique_zone_ids = list(dict.fromkeys(zone_ids))
+    
+    resolved = {}
+    pending = []
+    for zone_id in unique_zone_ids:
+        indexed = lookup_zone(zone_id)
+        if indexed:
+            indexed.pop("bbox", None)
+            indexed["zone_id"] = zone_id
+            resolved[zone_id] = indexed
+            continue
+        
+        cached = get_cached_zone(zone_id)
+        if cached:
+            resolved[zone_id] = cached
+        else:
+            pending.append(zone_id)
+    
+    logger.info(f"Zone index/cache served {len(unique_zone_ids) - len(pending)} of {len(unique_zone_ids)} zones")
+    return resolved, pending
+
+
 @track_tool_call("get_zone_coordinates")
 def get_zone_coordinates(
     tool_context: ToolContext,
@@ -1437,6 +2454,9 @@ def get_zone_coordinates(
     - County zones (e.g., FLC073, TXC209)
     - Fire weather zones (e.g., FLZ001)
     
+    Zones are resolved concurrently (at most ZONE_FETCH_CONCURRENCY requests in
+    flight) and returned in the order they were requested.
+    
     Args:
         zone_ids (list[str]): List of NWS zone IDs
         
@@ -1444,113 +2464,7 @@ def get_zone_coordinates(
         dict: Coordinates for each zone with status
     """
     try:
-        zone_coords = []
-        
-        # Determine zone type based on the third character
-        def get_zone_type(zone_id):
-            """Determine the zone type from the zone ID."""
-            if len(zone_id) < 3:
-                return "forecast"  # Default
-            
-            type_char = zone_id[2].upper()
-            if type_char == 'Z':
-                return "forecast"
-            elif type_char == 'C':
-                return "county"
-            elif type_char == 'F':
-                return "fire"
-            else:
-                return "forecast"  # Default fallback
-        
-        def extract_geometry_centroid(geometry):
-            """Extract centroid from geometry object."""
-            if not geometry:
-                return None
-                
-            geom_type = geometry.get("type")
-            
-            if geom_type == "Polygon":
-                coords = geometry.get("coordinates", [[]])[0]
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    return {
-                        "lon": sum(lons) / len(lons),
-                        "lat": sum(lats) / len(lats)
-                    }
-            elif geom_type == "MultiPolygon":
-                # Use first polygon
-                coords = geometry.get("coordinates", [[[]]])[0][0]
-                if coords:
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-                    return {
-                        "lon": sum(lons) / len(lons),
-                        "lat": sum(lats) / len(lats)
-                    }
-            
-            return None
-        
-        for zone_id in zone_ids:
-            try:
-                zone_type = get_zone_type(zone_id)
-                
-                # Try different endpoints based on zone type
-                endpoints = [
-                    f"{NWS_API_BASE}/zones/{zone_type}/{zone_id}",
-                    f"{NWS_API_BASE}/zones/forecast/{zone_id}",  # Fallback
-                    f"{NWS_API_BASE}/zones/county/{zone_id}",    # Fallback
-                ]
-                
-                data = None
-                for url in endpoints:
-                    try:
-                        response = requests.get(url, headers=NWS_HEADERS, timeout=10)
-                        if response.status_code == 200:
-                            data = response.json()
-                            break
-                    except:
-                        continue
-                
-                if data:
-                    geometry = data.get("geometry")
-                    centroid = extract_geometry_centroid(geometry)
-                    
-                    if centroid:
-                        zone_coords.append({
-                            "zone_id": zone_id,
-                            "latitude": round(centroid["lat"], 4),
-                            "longitude": round(centroid["lon"], 4),
-                            "name": data.get("properties", {}).get("name", zone_id),
-                            "type": zone_type
-                        })
-                        logger.info(f"Got coordinates for {zone_type} zone {zone_id}: ({centroid['lat']}, {centroid['lon']})")
-                    else:
-                        logger.warning(f"No geometry found for zone {zone_id}")
-                else:
-                    logger.warning(f"Failed to get coordinates for zone {zone_id} from all endpoints")
-                    
-            except Exception as e:
-                logger.error(f"Error getting coordinates for zone {zone_id}: {str(e)}")
-                continue
-        
-        if not zone_coords:
-            return {
-                "status": "error",
-                "message": "Could not get coordinates for any zones"
-            }
-        
-        # Save to state
-        tool_context.state["zone_coordinates"] = zone_coords
-        
-        return {
-            "status": "success",
-            "data": {
-                "coordinates": zone_coords,
-                "count": len(zone_coords),
-                "summary": f"Retrieved coordinates for {len(zone_coords)} out of {len(zone_ids)} zones"
-            }
-        }
+        return _zone_coordinates_result(tool_context, zone_ids, resolve_zone_coordinates(zone_ids))
         
     except Exception as e:
         logger.error(f"Error in get_zone_coordinates: {str(e)}")
@@ -1560,6 +2474,26 @@ def get_zone_coordinates(
         }
 
 
+def _zone_coordinates_result(tool_context: ToolContext, zone_ids: List[str], zone_coords: List[Dict[str, Any]]) -> Dict[str, Any]:
+    if not zone_coords:
+        return {
+            "status": "error",
+            "message": "Could not get coordinates for any zones"
+        }
+    
+    # Save to state
+    tool_context.state["zone_coordinates"] = zone_coords
+    
+    return {
+        "status": "success",
+        "data": {
+            "coordinates": zone_coords,
+            "count": len(zone_coords),
+            "summary": f"Retrieved coordinates for {len(zone_coords)} out of {len(zone_ids)} zones"
+        }
+    }
+
+
 @track_tool_call("calculate_evacuation_priority")
 def calculate_evacuation_priority(
     tool_context: ToolContext,
@@ -0,0 +1,118 @@
+import os
+import sys
+import json
+import logging
+from typing import Dict, Any, Optional, List
+
+from .cache import TieredCache
+from .geometry import geometry_centroid
+
+logger = logging.getLogger(__name__)
+
+# NWS zone polygons essentially never change, so cache resolved zones for a long time
+ZONE_CACHE_TTL = float(os.getenv("ZONE_CACHE_TTL", str(30 * 24 * 3600)))
+ZONE_CACHE_MEMORY_ITEMS = int(os.getenv("ZONE_CACHE_MEMORY_ITEMS", "20000"))
+
+zone_cache = TieredCache(
+    "zone_centroids",
+    ttl_seconds=ZONE_CACHE_TTL,
+    max_memory_items=ZONE_CACHE_MEMORY_ITEMS
+)
+
+
+def get_zone_type(zone_id: str) -> str:
+    """Determine the zone type from the third character of a zone ID."""
+    if len(zone_id) < 3:
+        return "forecast"  # Default
+
+    type_char = zone_id[2].upper()
+    if type_char == 'Z':
+        return "forecast"
+    elif type_char == 'C':
+        return "county"
+    elif type_char == 'F':
+        return "fire"
+    else:
+        return "forecast"  # Default fallback
+
+
+def zone_record_from_feature(feature: Dict[str, Any], zone_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Build the cached zone record (centroid, name, type) from an NWS zone GeoJSON feature."""
+    props = feature.get("properties") or {}
+    zone_id = zone_id or props.get("id")
+    if not zone_id:
+        return None
+
+    centroid = geometry_centroid(feature.get("geometry"))
+    if not centroid:
+        return None
+
+    return {
+        "zone_id": zone_id,
+        "latitude": round(centroid["lat"], 4),
+        "longitude": round(centroid["lon"], 4),
+        "name": props.get("name", zone_id),
+        "type": get_zone_type(zone_id)
+    }
+
+
+def get_cached_zone(zone_id: str) -> Optional[Dict[str, Any]]:
+    """Get a resolved zone from the cache, or None."""
+    return zone_cache.get(zone_id.upper())
+
+
+def cache_zone(record: Dict[str, Any]) -> None:
+    """Store a resolved zone record."""
+    zone_cache.set(record["zone_id"].upper(), record)
+
+
+def warm_zone_cache(paths: List[str]) -> int:
+    """Preload the zone cache from local NWS zone dumps.
+
+    Each file is a GeoJSON FeatureCollection as returned by
+    https://api.weather.gov/zones?type=forecast (or county/fire) with geometry included.
+
+    Args:
+        paths (list[str]): GeoJSON files to load
+
+    Returns:
+        int: Number of zones written to the cache
+    """
+    total = 0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            collection = json.load(f)
+
+        records = []
+        for feature in collection.get("features", []):
+            record = zone_record_from_feature(feature)
+            if record:
+                records.append((record["zone_id"].upper(), record))
+
+        written = zone_cache.set_many(records)
+        logger.info(f"Warmed zone cache with {written} zones from {path}")
+        total += written
+    return total
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python -m shared_tools.zone_cache warm <zones.geojson>... | stats"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ("warm", "stats"):
+        print("Usage: python -m shared_tools.zone_cache warm <zones.geojson> [...] | stats")
+        return 2
+
+    if argv[0] == "warm":
+        if len(argv) < 2:
+            print("warm requires at least one GeoJSON zone dump")
+            return 2
+        count = warm_zone_cache(argv[1:])
+        print(f"Loaded {count} zones into {zone_cache.path}")
+    else:
+        print(json.dumps(zone_cache.stats(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
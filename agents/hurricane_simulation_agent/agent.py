@@ -9,7 +9,7 @@ from google.adk.agents import LlmAgent, SequentialAgent
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any
 from google.genai import types
-from .tools.tools import (
+from .tools.async_tools import (
     get_flood_risk_data,
     calculate_evacuation_priority
 )
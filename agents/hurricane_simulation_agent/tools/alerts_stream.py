@@ -0,0 +1,302 @@
+import re
+import json
+import heapq
+import codecs
+from datetime import datetime
+from typing import Dict, Any, Optional, Iterable, Iterator, List, AsyncIterable, AsyncIterator
+
+SEVERITY_PRIORITY = {"Extreme": 0, "Severe": 1, "Moderate": 2, "Minor": 3, "Unknown": 4}
+URGENCY_PRIORITY = {"Immediate": 0, "Expected": 1, "Future": 2, "Past": 3, "Unknown": 4}
+
+# Whole string literals, a lone quote (string not yet terminated in the buffer), an array
+# of flat scalar arrays (e.g. a polygon ring), a flat array, or a structural character,
+# so long descriptions and geometry are skipped at C speed
+_TOKEN_RE = re.compile(
+    r'"(?:[^"\\]|\\.)*"'
+    r'|"'
+    r'|\[\s*(?:\[[^\[\]{}"]*\]\s*,?\s*)*\]'
+    r'|\[[^\[\]{}"]*\]'
+    r'|[{}\[\]]'
+)
+_FEATURES_RE = re.compile(r'"features"\s*:\s*\[')
+_NEXT_ITEM_RE = re.compile(r'[\s,]*')
+
+# Long free-text properties that ranking never reads; top-k callers defer decoding them
+# until an alert is kept (see iter_feature_properties(defer=...))
+LONG_TEXT_FIELDS = ("description", "instruction")
+
+
+class _RawJSON:
+    """A deferred property value: its JSON text, decoded by format_alert if the alert is kept."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+def _resolve(value: Any) -> Any:
+    return json.loads(value.text) if isinstance(value, _RawJSON) else value
+
+
+class _FeatureScanner:
+    """Incrementally splits the "features" array of a GeoJSON FeatureCollection.
+
+    For each feature only the raw text of its "properties" object is extracted and
+    parsed; geometry and other members are scanned over but never decoded. String
+    properties named in defer are cut out before parsing and kept as _RawJSON.
+    """
+
+    def __init__(self, defer: Iterable[str] = ()):
+        self._defer = {json.dumps(name) for name in defer}
+        self._buffer = ""
+        self._in_features = False
+        self._done = False
+        self._reset_feature()
+
+    def _reset_feature(self):
+        self._feature_start = None
+        self._pos = 0
+        self._depth = 0
+        self._pending_key = None
+        self._props_start = None
+        self._props_span = None
+        self._deferred_key = None  # (name, end of key token) of a deferred property
+        self._deferred_spans = []
+
+    def feed(self, text: str) -> Iterator[Optional[Dict[str, Any]]]:
+        """Add text and yield the properties of every feature completed so far."""
+        if self._done:
+            return
+        self._buffer += text
+
+        if not self._in_features:
+            match = _FEATURES_RE.search(self._buffer)
+            if not match:
+                # Keep a tail in case the "features" key straddles chunks
+                self._buffer = self._buffer[-64:]
+                return
+            self._buffer = self._buffer[match.end():]
+            self._in_features = True
+
+        while True:
+            if self._feature_start is None:
+                start = _NEXT_ITEM_RE.match(self._buffer).end()
+                if start >= len(self._buffer):
+                    self._buffer = ""
+                    return
+                if self._buffer[start] == "]":
+                    self._done = True
+                    self._buffer = ""
+                    return
+                self._feature_start = start
+                self._pos = start
+
+            if not self._scan():
+                return
+
+            if self._props_span:
+                yield self._properties()
+            else:
+                yield None
+
+            self._buffer = self._buffer[self._pos:]
+            self._reset_feature()
+
+    def _properties(self) -> Dict[str, Any]:
+        """Parse the properties object, replacing deferred values with null first."""
+        start, end = self._props_span
+        if not self._deferred_spans:
+            return json.loads(self._buffer[start:end])
+        parts = []
+        deferred = {}
+        for name, (value_start, value_end) in self._deferred_spans:
+            parts.append(self._buffer[start:value_start])
+            parts.append("null")
+            deferred[name] = _RawJSON(self._buffer[value_start:value_end])
+            start = value_end
+        parts.append(self._buffer[start:end])
+        props = json.loads("".join(parts))
+        props.update(deferred)
+        return props
+
+    def _scan(self) -> bool:
+        """Advance through the current feature; True once its closing brace is reached."""
+        buffer = self._buffer
+        while True:
+            match = _TOKEN_RE.search(buffer, self._pos)
+            if not match:
+                self._pos = len(buffer)
+                return False
+
+            token = match.group()
+            if token[0] == '"':
+                if token == '"':
+                    # The string continues in the next chunk; rescan it then
+                    self._pos = match.start()
+                    return False
+                if self._depth == 1:
+                    self._pending_key = token
+                elif self._defer and self._depth == 2 and self._props_start is not None and self._props_span is None:
+                    self._note_deferred(token, match.start(), match.end())
+                self._pos = match.end()
+                continue
+
+            self._pos = match.end()
+            self._deferred_key = None
+            if len(token) > 1:
+                continue  # Whole array skipped; depth is unchanged
+            if token in "{[":
+                if self._depth == 1 and token == "{" and self._pending_key == '"properties"':
+                    self._props_start = match.start()
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 1 and self._props_start is not None and self._props_span is None:
+                    self._props_span = (self._props_start, match.end())
+                if self._depth == 0:
+                    return True
+
+    def _note_deferred(self, token: str, start: int, end: int) -> None:
+        """Track a string token directly inside properties: a deferred key, or its value."""
+        if self._deferred_key is not None:
+            name, key_end = self._deferred_key
+            self._deferred_key = None
+            if self._buffer[key_end:start].strip() == ":":
+                self._deferred_spans.append((name, (start, end)))
+                return
+        if token in self._defer:
+            self._deferred_key = (token[1:-1], end)
+
+
+class FeaturePropertiesStream:
+    """Push-style iter_feature_properties for callers that receive chunks one at a time."""
+
+    def __init__(self, defer: Iterable[str] = ()):
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._scanner = _FeatureScanner(defer)
+
+    def feed(self, chunk) -> List[Dict[str, Any]]:
+        """Add a chunk (bytes or str) and return the properties of every feature it completed."""
+        text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        return [props for props in self._scanner.feed(text) if props is not None]
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Flush the decoder and return any remaining features."""
+        return [props for props in self._scanner.feed(self._decoder.decode(b"", final=True)) if props is not None]
+
+
+def iter_feature_properties(chunks: Iterable[bytes], defer: Iterable[str] = ()) -> Iterator[Dict[str, Any]]:
+    """Stream the "properties" of each feature from raw FeatureCollection bytes.
+
+    Args:
+        chunks: Iterable of byte chunks (e.g. response.iter_content())
+        defer: String properties to leave undecoded (e.g. LONG_TEXT_FIELDS); only
+            format_alert can read them, so pass this only when every kept alert
+            goes through format_alert (summarize_alerts, TopAlerts)
+
+    Yields:
+        dict: Parsed properties of each feature, in feed order
+    """
+    stream = FeaturePropertiesStream(defer)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    yield from stream.close()
+
+
+async def aiter_feature_properties(chunks: AsyncIterable[bytes], defer: Iterable[str] = ()) -> AsyncIterator[Dict[str, Any]]:
+    """Async version of iter_feature_properties (e.g. for httpx response.aiter_bytes())."""
+    stream = FeaturePropertiesStream(defer)
+    async for chunk in chunks:
+        for props in stream.feed(chunk):
+            yield props
+    for props in stream.close():
+        yield props
+
+
+def _onset_timestamp(value: Optional[str]) -> float:
+    if not value:
+        return float("inf")
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return float("inf")
+
+
+def format_alert(props: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape NWS alert properties into the alert dict returned by get_nws_alerts."""
+    return {
+        "id": props.get("id"),
+        "event": props.get("event"),
+        "severity": props.get("severity", "Unknown"),
+        "urgency": props.get("urgency"),
+        "certainty": props.get("certainty"),
+        "headline": props.get("headline"),
+        "description": _resolve(props.get("description")),
+        "instruction": _resolve(props.get("instruction")),
+        "onset": props.get("onset"),
+        "expires": props.get("expires"),
+        "affected_zones": props.get("affectedZones", []),
+        "area_desc": props.get("areaDesc"),
+        "sender_name": props.get("senderName")
+    }
+
+
+class TopAlerts:
+    """Counts alerts and keeps only the top_k most critical as they are added.
+
+    Ranking is by severity, then urgency, then onset (already-active alerts first),
+    then feed order. Alert dicts are only built for features that enter the heap.
+    """
+
+    def __init__(self, top_k: int, severity: Optional[str] = None):
+        self.top_k = top_k
+        self.severity = severity
+        self.severity_counts = {"Extreme": 0, "Severe": 0, "Moderate": 0, "Minor": 0, "Unknown": 0}
+        self.total = 0
+        self._heap: List[tuple] = []  # Worst alert at heap[0]; entries are negated priorities
+
+    def add(self, props: Dict[str, Any]) -> None:
+        # Filter by severity if specified
+        if self.severity and props.get("severity") != self.severity:
+            return
+
+        alert_severity = props.get("severity", "Unknown")
+        self.severity_counts[alert_severity] = self.severity_counts.get(alert_severity, 0) + 1
+
+        entry = (
+            -SEVERITY_PRIORITY.get(alert_severity, 4),
+            -URGENCY_PRIORITY.get(props.get("urgency"), 4),
+            -_onset_timestamp(props.get("onset")),
+            -self.total
+        )
+        self.total += 1
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, (entry, format_alert(props)))
+        elif entry > self._heap[0][0]:
+            heapq.heapreplace(self._heap, (entry, format_alert(props)))
+
+    def summary(self) -> Dict[str, Any]:
+        """{"alerts": top_k alerts best-first, "total_count": int, "severity_breakdown": dict}"""
+        alerts = [alert for _, alert in sorted(self._heap, key=lambda item: item[0], reverse=True)]
+        return {
+            "alerts": alerts,
+            "total_count": self.total,
+            "severity_breakdown": self.severity_counts
+        }
+
+
+def summarize_alerts(
+    properties: Iterable[Dict[str, Any]],
+    top_k: int,
+    severity: Optional[str] = None
+) -> Dict[str, Any]:
+    """Count alerts and keep only the top_k most critical while reading (see TopAlerts).
+
+    Returns:
+        dict: {"alerts": top_k alerts best-first, "total_count": int, "severity_breakdown": dict}
+    """
+    top = TopAlerts(top_k, severity=severity)
+    for props in properties:
+        top.add(props)
+    return top.summary()
@@ -0,0 +1,124 @@
+import os
+import sys
+import json
+import logging
+import threading
+import contextvars
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Optional JSON-lines file that every BigQuery job record is appended to
+BQ_METRICS_LOG = os.getenv("BQ_METRICS_LOG")
+
+# Name of the tool currently executing (set by track_tool_call)
+current_tool: contextvars.ContextVar[str] = contextvars.ContextVar("current_tool", default="unknown")
+
+_SUMMED_FIELDS = ("total_bytes_processed", "total_bytes_billed", "slot_millis", "wall_ms")
+
+_summary: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
+
+
+def _empty_summary() -> Dict[str, Any]:
+    return {
+        "jobs": 0,
+        "bigquery_cache_hits": 0,
+        "result_cache_hits": 0,
+        "coalesced": 0,
+        "errors": 0,
+        **{field: 0 for field in _SUMMED_FIELDS}
+    }
+
+
+def _accumulate(summary: Dict[str, Dict[str, Any]], record: Dict[str, Any]) -> None:
+    tool_summary = summary.setdefault(record.get("tool", "unknown"), _empty_summary())
+    if record.get("result_cache_hit"):
+        tool_summary["result_cache_hits"] += 1
+        return
+    if record.get("coalesced"):
+        tool_summary["coalesced"] += 1
+        return
+
+    tool_summary["jobs"] += 1
+    if record.get("cache_hit"):
+        tool_summary["bigquery_cache_hits"] += 1
+    if record.get("error"):
+        tool_summary["errors"] += 1
+    for field in _SUMMED_FIELDS:
+        tool_summary[field] += record.get(field) or 0
+
+
+def record_query(record: Dict[str, Any]) -> None:
+    """Record one BigQuery call (a job or a result-cache hit).
+
+    Args:
+        record (dict): job_id, total_bytes_processed, total_bytes_billed, slot_millis,
+            cache_hit, result_cache_hit, coalesced (shared another call's job), wall_ms
+            and optional error
+    """
+    record = {"tool": current_tool.get(), "timestamp": datetime.now().isoformat(), **record}
+    with _lock:
+        _accumulate(_summary, record)
+
+    line = json.dumps(record, default=str)
+    logger.info(f"BQ_METRICS {line}")
+    if BQ_METRICS_LOG:
+        try:
+            with open(BQ_METRICS_LOG, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.warning(f"Could not write BigQuery metrics to {BQ_METRICS_LOG}: {str(e)}")
+
+
+def get_bq_metrics_summary() -> Dict[str, Dict[str, Any]]:
+    """Get per-tool BigQuery totals for this process."""
+    with _lock:
+        return {tool: dict(values) for tool, values in _summary.items()}
+
+
+def reset_bq_metrics() -> None:
+    """Clear the in-process totals."""
+    with _lock:
+        _summary.clear()
+
+
+def summarize_records(records: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Aggregate job records (e.g. read back from BQ_METRICS_LOG) per tool."""
+    summary: Dict[str, Dict[str, Any]] = {}
+    for record in records:
+        _accumulate(summary, record)
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python -m shared_tools.bq_metrics [metrics.jsonl ...] - per-tool cost summary"""
+    argv = sys.argv[1:] if argv is None else argv
+    paths = argv or ([BQ_METRICS_LOG] if BQ_METRICS_LOG else [])
+    if not paths:
+        print("Usage: python -m shared_tools.bq_metrics <metrics.jsonl> [...] (or set BQ_METRICS_LOG)")
+        return 2
+
+    def _records():
+        for path in paths:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+
+    summary = summarize_records(_records())
+    print(f"{'tool':32} {'jobs':>6} {'bq cache':>9} {'res cache':>10} {'shared':>7} {'GB processed':>13} {'GB billed':>10} {'slot s':>9} {'wall s':>8}")
+    for tool, values in sorted(summary.items(), key=lambda item: -item[1]["total_bytes_billed"]):
+        print(
+            f"{tool:32} {values['jobs']:>6} {values['bigquery_cache_hits']:>9} {values['result_cache_hits']:>10} "
+            f"{values['coalesced']:>7} "
+            f"{values['total_bytes_processed'] / 1e9:>13.3f} {values['total_bytes_billed'] / 1e9:>10.3f} "
+            f"{values['slot_millis'] / 1000:>9.1f} {values['wall_ms'] / 1000:>8.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
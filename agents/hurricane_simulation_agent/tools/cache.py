@@ -0,0 +1,210 @@
+import os
+import json
+import time
+import sqlite3
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Directory for on-disk caches (must be writable; /tmp on Cloud Run)
+CACHE_DIR = os.getenv("WEATHER_CACHE_DIR", os.path.join(tempfile.gettempdir(), "weather_agents_cache"))
+# A capped disk tier may grow this fraction past max_disk_items before it is trimmed back
+CACHE_EVICT_SLACK = float(os.getenv("CACHE_EVICT_SLACK", "0.1"))
+
+
+class TieredCache:
+    """Two-tier key/value cache: an in-process LRU in front of a SQLite file.
+
+    Values must be JSON-serializable. Entries expire after their TTL in both tiers.
+    When max_disk_items is set, the disk tier may grow CACHE_EVICT_SLACK past it;
+    the write that crosses that mark evicts expired entries and then the entries
+    closest to expiry down to max_disk_items, so eviction scans are amortized over
+    many writes. Disk failures are logged and treated as misses so a broken cache
+    never breaks a tool.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        max_memory_items: int = 1024,
+        path: Optional[str] = None,
+        max_disk_items: Optional[int] = None
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_items = max_memory_items
+        self.max_disk_items = max_disk_items
+        self.path = path or os.path.join(CACHE_DIR, f"{name}.sqlite3")
+
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Upper bound on disk rows (replaced keys are counted twice until the next trim)
+        self._disk_rows = 0
+        self._disk_high_water = (
+            max_disk_items + max(1, int(max_disk_items * CACHE_EVICT_SLACK)) if max_disk_items is not None else None
+        )
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "expired": 0,
+            "evicted": 0
+        }
+
+    def _db(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite backing store on first use (caller holds the lock)."""
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS entries ("
+                    " key TEXT PRIMARY KEY,"
+                    " value TEXT NOT NULL,"
+                    " expires_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at)")
+                conn.commit()
+                if self.max_disk_items is not None:
+                    self._disk_rows = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+                self._conn = conn
+            except Exception as e:
+                logger.warning(f"Cache '{self.name}' disk tier unavailable at {self.path}: {str(e)}")
+                self.path = None
+        return self._conn
+
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        """Insert into the memory tier, evicting the least recently used entry."""
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._stats["expired"] += 1
+
+            conn = self._db() if self.path else None
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+                    ).fetchone()
+                except Exception as e:
+                    logger.warning(f"Cache '{self.name}' read failed: {str(e)}")
+                    row = None
+                if row is not None:
+                    if row[1] > now:
+                        value = json.loads(row[0])
+                        self._remember(key, value, row[1])
+                        self._stats["disk_hits"] += 1
+                        return value
+                    self._stats["expired"] += 1
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value in both tiers."""
+        self.set_many([(key, value)], ttl_seconds=ttl_seconds)
+
+    def set_many(self, items: Iterable[Tuple[str, Any]], ttl_seconds: Optional[float] = None) -> int:
+        """Store many values in one disk transaction.
+
+        Returns:
+            int: Number of entries written
+        """
+        expires_at = time.time() + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+        rows = []
+        with self._lock:
+            for key, value in items:
+                self._remember(key, value, expires_at)
+                rows.append((key, json.dumps(value), expires_at))
+            self._stats["sets"] += len(rows)
+
+            conn = self._db() if self.path else None
+            if conn is not None and rows:
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)", rows
+                    )
+                    self._disk_rows += len(rows)
+                    if self._disk_high_water is not None and self._disk_rows > self._disk_high_water:
+                        self._evict(conn)
+                    conn.commit()
+                except Exception as e:
+                    logger.warning(f"Cache '{self.name}' write failed: {str(e)}")
+        return len(rows)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries, then the soonest-expiring ones beyond max_disk_items."""
+        evicted = conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),)).rowcount
+        self._disk_rows = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        overflow = self._disk_rows - self.max_disk_items
+        if overflow > 0:
+            evicted += conn.execute(
+                "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY expires_at LIMIT ?)",
+                (overflow,)
+            ).rowcount
+            self._disk_rows = self.max_disk_items
+        self._stats["evicted"] += max(evicted, 0)
+
+    def delete(self, key: str) -> None:
+        """Remove a key from both tiers."""
+        with self._lock:
+            self._memory.pop(key, None)
+            conn = self._db() if self.path else None
+            if conn is not None:
+                try:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    conn.commit()
+                except Exception as e:
+                    logger.warning(f"Cache '{self.name}' delete failed: {str(e)}")
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            conn = self._db() if self.path else None
+            if conn is not None:
+                try:
+                    conn.execute("DELETE FROM entries")
+                    conn.commit()
+                    self._disk_rows = 0
+                except Exception as e:
+                    logger.warning(f"Cache '{self.name}' clear failed: {str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics for this cache."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_items"] = len(self._memory)
+            conn = self._db() if self.path else None
+            stats["disk_items"] = 0
+            if conn is not None:
+                try:
+                    stats["disk_items"] = conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+                except Exception as e:
+                    logger.warning(f"Cache '{self.name}' read failed: {str(e)}")
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["name"] = self.name
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else None
+        return stats
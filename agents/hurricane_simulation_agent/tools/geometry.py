@@ -0,0 +1,127 @@
+import math
+from typing import Dict, Any, Optional, List
+
+# Approximate length of one degree of latitude in kilometers
+KM_PER_DEGREE = 111.32
+
+
+def _polygons(geometry: Optional[Dict[str, Any]]) -> List[list]:
+    """Normalize a GeoJSON Polygon/MultiPolygon to a list of polygons (lists of rings)."""
+    if not geometry:
+        return []
+
+    geom_type = geometry.get("type")
+    coords = geometry.get("coordinates") or []
+    if geom_type == "Polygon":
+        return [coords]
+    elif geom_type == "MultiPolygon":
+        return list(coords)
+    return []
+
+
+def polygon_stats(geometry: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Compute centroid, bounding box and area of a GeoJSON Polygon or MultiPolygon.
+
+    The centroid is the true area-weighted centroid over every part, with holes
+    (interior rings) subtracted, computed in a single pass over the vertices using
+    the shoelace formula. Geometries that cross the antimeridian (Alaska/Aleutian
+    zones) are unwrapped before computing and the result is wrapped back; their
+    bbox follows RFC 7946 and has min_lon > max_lon (west edge east of 180, east
+    edge west of it).
+
+    Args:
+        geometry (dict): GeoJSON geometry object
+
+    Returns:
+        dict: {"centroid": {"lat", "lon"}, "bbox": [min_lon, min_lat, max_lon, max_lat],
+               "area_sq_deg": float, "area_km2": float}, or None for empty/unsupported geometry
+    """
+    polygons = _polygons(geometry)
+    rings = [
+        (ring_index > 0, ring)
+        for polygon in polygons
+        for ring_index, ring in enumerate(polygon)
+        if ring and len(ring) >= 3
+    ]
+    if not rings:
+        return None
+
+    lons = [point[0] for _, ring in rings for point in ring]
+    lats = [point[1] for _, ring in rings for point in ring]
+    min_lon, max_lon = min(lons), max(lons)
+
+    # Unwrap geometries that straddle the antimeridian
+    shift = 360.0 if max_lon - min_lon > 180.0 else 0.0
+
+    area_total = 0.0
+    moment_lon = 0.0
+    moment_lat = 0.0
+    for is_hole, ring in rings:
+        # Shift the origin to the first vertex to keep the cross products well conditioned
+        x0 = ring[0][0] + (shift if ring[0][0] < 0 else 0.0)
+        y0 = ring[0][1]
+        xs = [point[0] + (shift if point[0] < 0 else 0.0) - x0 for point in ring]
+        ys = [point[1] - y0 for point in ring]
+
+        twice_area = 0.0
+        cx = 0.0
+        cy = 0.0
+        for x1, y1, x2, y2 in zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1]):
+            cross = x1 * y2 - x2 * y1
+            twice_area += cross
+            cx += (x1 + x2) * cross
+            cy += (y1 + y2) * cross
+
+        if twice_area == 0.0:
+            continue
+
+        ring_area = twice_area / 2.0
+        ring_lon = cx / (3.0 * twice_area) + x0
+        ring_lat = cy / (3.0 * twice_area) + y0
+
+        # Orientation is not guaranteed in NWS GeoJSON, so weight by absolute area
+        weight = -abs(ring_area) if is_hole else abs(ring_area)
+        area_total += weight
+        moment_lon += weight * ring_lon
+        moment_lat += weight * ring_lat
+
+    if area_total > 0.0:
+        centroid_lon = moment_lon / area_total
+        centroid_lat = moment_lat / area_total
+    else:
+        # Degenerate geometry (zero area): fall back to the vertex mean
+        centroid_lon = sum(lon + (shift if lon < 0 else 0.0) for lon in lons) / len(lons)
+        centroid_lat = sum(lats) / len(lats)
+        area_total = 0.0
+
+    if centroid_lon > 180.0:
+        centroid_lon -= 360.0
+
+    if shift:
+        # Bbox edges in the unwrapped frame, wrapped back to [-180, 180]
+        unwrapped = [lon + shift if lon < 0 else lon for lon in lons]
+        min_lon, max_lon = min(unwrapped), max(unwrapped)
+        min_lon = min_lon - 360.0 if min_lon > 180.0 else min_lon
+        max_lon = max_lon - 360.0 if max_lon > 180.0 else max_lon
+
+    return {
+        "centroid": {"lat": centroid_lat, "lon": centroid_lon},
+        "bbox": [min_lon, min(lats), max_lon, max(lats)],
+        "area_sq_deg": area_total,
+        "area_km2": area_total * KM_PER_DEGREE ** 2 * math.cos(math.radians(centroid_lat))
+    }
+
+
+def geometry_centroid(geometry: Optional[Dict[str, Any]]) -> Optional[Dict[str, float]]:
+    """Area-weighted centroid {"lat", "lon"} of a Polygon/MultiPolygon, or None."""
+    stats = polygon_stats(geometry)
+    return stats["centroid"] if stats else None
+
+
+def geometry_bbox(geometry: Optional[Dict[str, Any]]) -> Optional[List[float]]:
+    """Bounding box [min_lon, min_lat, max_lon, max_lat] of a Polygon/MultiPolygon, or None.
+
+    For geometries crossing the antimeridian min_lon > max_lon (RFC 7946, section 5.2).
+    """
+    stats = polygon_stats(geometry)
+    return stats["bbox"] if stats else None
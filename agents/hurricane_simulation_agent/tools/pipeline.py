@@ -0,0 +1,75 @@
+import os
+import logging
+from typing import List, Sequence, Tuple
+
+from google.adk.agents import BaseAgent, ParallelAgent, SequentialAgent
+
+logger = logging.getLogger(__name__)
+
+# "parallel" runs independent stages concurrently; "sequential" keeps the original
+# one-stage-at-a-time order (useful for latency comparisons and debugging)
+PIPELINE_MODE = os.getenv("PIPELINE_MODE", "parallel").lower()
+
+# A stage and the stages whose outputs (state keys) it reads
+Stage = Tuple[BaseAgent, Sequence[BaseAgent]]
+
+
+def dependency_layers(stages: Sequence[Stage]) -> List[List[BaseAgent]]:
+    """Group stages into layers; every stage runs after all of its dependencies.
+
+    Stages keep their declaration order within a layer.
+
+    Raises:
+        ValueError: For unknown dependencies or dependency cycles
+    """
+    names = [agent.name for agent, _ in stages]
+    deps = {agent.name: {dep.name for dep in depends_on} for agent, depends_on in stages}
+    for name, required in deps.items():
+        unknown = required - set(names)
+        if unknown:
+            raise ValueError(f"Stage {name} depends on unknown stages: {sorted(unknown)}")
+
+    agents = {agent.name: agent for agent, _ in stages}
+    done = set()
+    layers = []
+    while len(done) < len(names):
+        layer = [name for name in names if name not in done and deps[name] <= done]
+        if not layer:
+            raise ValueError(f"Dependency cycle among stages: {sorted(set(names) - done)}")
+        layers.append([agents[name] for name in layer])
+        done.update(layer)
+    return layers
+
+
+def staged_pipeline(name: str, description: str, stages: Sequence[Stage]) -> SequentialAgent:
+    """Build a workflow from stages with declared dependencies.
+
+    Stages whose dependencies are all satisfied run together in a ParallelAgent;
+    layers run in order. Parallel stages share session state but must write
+    different output keys. With PIPELINE_MODE=sequential every stage runs on its
+    own in declaration order.
+
+    Args:
+        name (str): Workflow name
+        description (str): Workflow description
+        stages (list): (agent, [agents it depends on]) in a valid sequential order
+
+    Returns:
+        SequentialAgent: The workflow
+    """
+    layers = dependency_layers(stages)
+    if PIPELINE_MODE == "sequential":
+        return SequentialAgent(name=name, description=description, sub_agents=[agent for agent, _ in stages])
+
+    sub_agents = []
+    for index, layer in enumerate(layers, 1):
+        if len(layer) == 1:
+            sub_agents.append(layer[0])
+        else:
+            sub_agents.append(ParallelAgent(
+                name=f"{name}_stage_{index}",
+                description=f"Runs {', '.join(agent.name for agent in layer)} concurrently",
+                sub_agents=layer,
+            ))
+    logger.info(f"{name}: {' -> '.join('[' + ', '.join(a.name for a in layer) + ']' for layer in layers)}")
+    return SequentialAgent(name=name, description=description, sub_agents=sub_agents)
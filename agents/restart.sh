@@ -17,9 +17,9 @@ for agent in "${AGENTS_TO_SYNC[@]}"; do
     AGENT_TOOLS_DEST="${agent}/tools"
     if [ -d "$AGENT_TOOLS_DEST" ]; then
         echo "  -> Syncing to ${AGENT_TOOLS_DEST}"
-        cp "${SHARED_TOOLS_SOURCE}/__init__.py" "${AGENT_TOOLS_DEST}/"
-        cp "${SHARED_TOOLS_SOURCE}/logging_utils.py" "${AGENT_TOOLS_DEST}/"
-        cp "${SHARED_TOOLS_SOURCE}/tools.py" "${AGENT_TOOLS_DEST}/"
+        cp "${SHARED_TOOLS_SOURCE}"/*.py "${AGENT_TOOLS_DEST}/"
+        # Prebuilt offline data (e.g. zones.idx from shared_tools.zone_index), if any
+        [ -f "${SHARED_TOOLS_SOURCE}/zones.idx" ] && cp "${SHARED_TOOLS_SOURCE}/zones.idx" "${AGENT_TOOLS_DEST}/"
     else
         echo "  -> Warning: ${AGENT_TOOLS_DEST} not found. Skipping sync."
     fi
@@ -0,0 +1,107 @@
+import os
+import uuid
+import logging
+from typing import Dict, Any, Optional, List
+
+from .cache import TieredCache
+from .alerts_stream import format_alert
+
+logger = logging.getLogger(__name__)
+
+# How long a poll cursor stays valid; older cursors get a full resync
+ALERT_CURSOR_TTL = float(os.getenv("ALERT_CURSOR_TTL", str(6 * 3600)))
+
+cursor_cache = TieredCache("alert_cursors", ttl_seconds=ALERT_CURSOR_TTL, max_memory_items=256, max_disk_items=5000)
+
+# Value of `since` that starts a new incremental session
+START_CURSOR = "start"
+
+
+def alert_id(props: Dict[str, Any]) -> Optional[str]:
+    """Stable NWS identifier of an alert."""
+    return props.get("id") or props.get("@id")
+
+
+def _referenced_ids(props: Dict[str, Any]) -> List[str]:
+    return [ref.get("identifier") for ref in props.get("references") or [] if ref.get("identifier")]
+
+
+def alert_fingerprint(props: Dict[str, Any]) -> str:
+    """Changes whenever NWS reissues the alert (new sent time or new references)."""
+    return f"{props.get('sent')}|{','.join(sorted(_referenced_ids(props)))}"
+
+
+def diff_alerts(
+    properties: List[Dict[str, Any]],
+    since: Optional[str],
+    filters: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Diff the current alert set against the set seen at cursor `since`.
+
+    An alert is "updated" when its id was seen before with a different sent time or
+    references, or when it is a new id that references (supersedes) a previously seen
+    alert that is no longer active; the superseded ids are listed under "replaces".
+    Previously seen ids that are gone and not superseded are "expired". Applying
+    added/updated and removing expired plus replaced ids to the client's previous set
+    reproduces the current set.
+
+    Args:
+        properties (list): Properties of every currently active alert
+        since (str): Cursor from the previous poll, or "start"
+        filters (dict): The NWS filters used; a cursor is only valid for the same filters
+
+    Returns:
+        dict: cursor, added, updated, expired, unchanged_count, total_count and
+            reset (True when the client must discard its set and use "added" as the full set)
+    """
+    previous = cursor_cache.get(since) if since and since != START_CURSOR else None
+    if previous is not None and previous.get("filters") != filters:
+        logger.info(f"Alert cursor {since} was issued for different filters; resyncing")
+        previous = None
+    seen: Dict[str, str] = previous["alerts"] if previous else {}
+
+    current: Dict[str, str] = {}
+    active: Dict[str, Dict[str, Any]] = {}
+    for props in properties:
+        identifier = alert_id(props)
+        if identifier and identifier not in active:
+            active[identifier] = props
+            current[identifier] = alert_fingerprint(props)
+
+    added, updated = [], []
+    replaced = set()
+    for identifier, props in active.items():
+        if identifier in seen:
+            if seen[identifier] != current[identifier]:
+                updated.append(format_alert(props))
+            continue
+
+        # A referenced alert that is still active was updated or kept, not replaced
+        supersedes = [ref for ref in _referenced_ids(props) if ref in seen and ref not in current]
+        if supersedes:
+            alert = format_alert(props)
+            alert["replaces"] = supersedes
+            updated.append(alert)
+            replaced.update(supersedes)
+        else:
+            added.append(format_alert(props))
+
+    expired = [identifier for identifier in seen if identifier not in current and identifier not in replaced]
+
+    cursor = uuid.uuid4().hex
+    cursor_cache.set(cursor, {"filters": filters, "alerts": current})
+
+    logger.info(
+        f"Alert diff since {since}: {len(added)} added, {len(updated)} updated, "
+        f"{len(expired)} expired, {len(current)} active"
+    )
+    return {
+        "cursor": cursor,
+        "since": since,
+        "reset": previous is None,
+        "added": added,
+        "updated": updated,
+        "expired": expired,
+        "unchanged_count": len(current) - len(added) - len(updated),
+        "total_count": len(current)
+    }
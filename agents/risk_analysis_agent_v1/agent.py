@@ -1,8 +1,9 @@
 from typing import List
-from google.adk.agents import LlmAgent, SequentialAgent
+from google.adk.agents import LlmAgent
 from pydantic import BaseModel, Field
-from .tools.tools import get_census_tracts_in_area, get_flood_risk_data, get_nws_alerts, get_census_demographics, geocode_address
+from .tools.async_tools import get_census_tracts_in_area, get_flood_risk_data, get_nws_alerts, get_census_demographics, geocode_address
 from .tools.logging_utils import log_agent_entry, log_agent_exit
+from .tools.pipeline import staged_pipeline
 
 class RiskAnalysisSummary(BaseModel):
     """Structured output for risk analysis"""
@@ -31,39 +32,77 @@ alert_parser = LlmAgent(
         *   `affected_zones`: A list of URLs pointing to the affected areas.
         *   `areaDesc`: A string describing the affected areas (e.g., "San Diego County").
         *   The full alert text for context.
-    3.  **Store for Next Agent**: Store these extracted fields in a structured way for the `census_data_retriever`.
+    3.  **Store for Next Agent**: Store these extracted fields in a structured way for the data retrievers.
     """,
     output_key="parsed_alert_data",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
 )
 
-# Phase 2: Census Data Retriever
-census_data_retriever = LlmAgent(
+# Phase 2: Data Retrievers - independent lookups for the parsed alert, run concurrently
+census_retriever = LlmAgent(
     model="gemini-2.5-flash-lite",
-    name="census_data_retriever",
-    description="Retrieves population and flood zone data for affected areas",
+    name="census_retriever",
+    description="Retrieves population data for affected areas",
     instruction="""
-    You are a demographic and geographic data specialist.
+    You are a demographic data specialist.
 
     **Your Task:**
     1.  **Get Parsed Data**: Access the structured data from `state['parsed_alert_data']`.
     2.  **Extract County Codes**: From the `affected_zones` list, extract the county FIPS code from each URL (e.g., extract `CAC073` from `https://api.weather.gov/zones/county/CAC073`).
     3.  **Get Demographics**: Use the extracted county codes with the `get_census_demographics` tool to get population data.
-    4.  **Get Flood Risk**: If the alert `event` from the parsed data is flood-related, use the `get_flood_risk_data` tool.
-    5.  **Calculate Total Population**: Sum the populations from all affected census tracts to get a total `population_at_risk`.
-    6.  **Store Data**: Store the combined census and flood risk data for the next agent.
+    4.  **Calculate Total Population**: Sum the populations from all affected census tracts to get a total `population_at_risk`.
+    5.  **Store Data**: Store the census data for the risk calculator.
 
     **Fallback**: If you cannot extract a specific county code, use the `geocode_address` tool on the `areaDesc` string from the parsed data to find the location.
-
-    Pass the aggregated census and risk data to the risk calculator.
     """,
-    tools=[get_census_demographics, get_census_tracts_in_area, get_flood_risk_data, geocode_address],
+    tools=[get_census_demographics, get_census_tracts_in_area, geocode_address],
     output_key="census_data",
     before_model_callback=log_agent_entry,
     after_model_callback=log_agent_exit,
 )
 
+flood_risk_retriever = LlmAgent(
+    model="gemini-2.5-flash-lite",
+    name="flood_risk_retriever",
+    description="Retrieves historical flood risk for affected areas",
+    instruction="""
+    You are a flood risk specialist.
+
+    **Your Task:**
+    1.  **Get Parsed Data**: Access the structured data from `state['parsed_alert_data']`.
+    2.  **Check Relevance**: If the alert `event` is not flood-related (flood, flash flood, storm surge, coastal flood,
+        hurricane or tropical storm), reply "No flood risk data needed" and do NOT call any tool.
+    3.  **Get Flood Risk**: Otherwise use the `get_flood_risk_data` tool with the two-letter state code from the
+        affected zones (e.g., `CA` from `CAC073`) and the county name from `areaDesc`.
+    4.  **Store Data**: Store the flood risk data for the risk calculator.
+    """,
+    tools=[get_flood_risk_data],
+    output_key="flood_data",
+    before_model_callback=log_agent_entry,
+    after_model_callback=log_agent_exit,
+)
+
+alerts_lookup = LlmAgent(
+    model="gemini-2.5-flash-lite",
+    name="alerts_lookup",
+    description="Checks current NWS alert status for affected areas",
+    instruction="""
+    You are a weather alert specialist.
+
+    **Your Task:**
+    1.  **Get Parsed Data**: Access the structured data from `state['parsed_alert_data']`.
+    2.  **Get Current Alerts**: Use the `get_nws_alerts` tool with `zone` set to the comma-separated zone IDs
+        from `affected_zones` (the last part of each URL, e.g. `CAC073`).
+    3.  **Summarize**: Report whether the alert is still active, its current severity, and any other
+        active alerts for the same zones.
+    """,
+    tools=[get_nws_alerts],
+    output_key="alert_data",
+    before_model_callback=log_agent_entry,
+    after_model_callback=log_agent_exit,
+)
+
 # Phase 3: Risk Calculator
 risk_calculator = LlmAgent(
     model="gemini-2.5-flash-lite",
@@ -73,9 +112,9 @@ risk_calculator = LlmAgent(
     You are a risk assessment specialist.
     
     **Your Task:**
-    1. Get alert severity from `state['alert_data']`.
+    1. Get alert severity from `state['parsed_alert_data']` and current alert status from `state['alert_data']`.
     2. Get population data from `state['census_data']`.
-    3. Get flood risk if available from `state['census_data']`.
+    3. Get flood risk if available from `state['flood_data']`.
     4. Calculate a risk score (0-100) based on:
        - Severity (Minor=10, Moderate=40, Severe=70, Extreme=90)
        - Population density (higher density = higher score)
@@ -108,7 +147,7 @@ recommendations_generator = LlmAgent(
     
     **Process:**
     1. Extract alert summary from state["alert_data"]
-    2. Extract population data from state["census_data"]
+    2. Extract population data from state["census_data"] and flood risk from state["flood_data"]
     3. Extract risk assessment from state["risk_scores"]
     4. Calculate overall risk score (0-100)
     5. Determine risk level (low/Medium/High/Severe)
@@ -131,15 +170,17 @@ recommendations_generator = LlmAgent(
 )
 
 
-# Sequential Pipeline: Alert -> Census -> Risk -> Recommendations
-risk_analysis_workflow = SequentialAgent(
+# Pipeline: Alert -> (Census ‖ Flood risk ‖ Alert status) -> Risk -> Recommendations
+risk_analysis_workflow = staged_pipeline(
     name="risk_analysis_pipeline",
     description="Analyzes weather alert risks by combining alert severity, population data, and flood zones to generate actionable safety recommendations",
-    sub_agents=[
-        alert_parser,
-        census_data_retriever,
-        risk_calculator,
-        recommendations_generator,
+    stages=[
+        (alert_parser, []),
+        (census_retriever, [alert_parser]),
+        (flood_risk_retriever, [alert_parser]),
+        (alerts_lookup, [alert_parser]),
+        (risk_calculator, [census_retriever, flood_risk_retriever, alerts_lookup]),
+        (recommendations_generator, [risk_calculator]),
     ],
 )
 root_agent = risk_analysis_workflow
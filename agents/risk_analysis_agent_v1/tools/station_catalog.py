@@ -0,0 +1,221 @@
+import os
+import sys
+import csv
+import math
+import heapq
+import logging
+import threading
+from typing import Dict, Any, Optional, List
+
+from .cache import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Snapshot of bigquery-public-data.noaa_gsod.stations (refresh with the CLI below)
+STATION_CATALOG_PATH = os.getenv("STATION_CATALOG_PATH", os.path.join(CACHE_DIR, "gsod_stations.csv"))
+
+EARTH_RADIUS_KM = 6371.0088
+
+_CATALOG_FIELDS = ["usaf", "wban", "name", "state", "country", "lat", "lon", "begin", "end"]
+
+_STATIONS_QUERY = """
+SELECT usaf, wban, name, state, country, lat, lon, begin, `end`
+FROM `bigquery-public-data.noaa_gsod.stations`
+WHERE lat IS NOT NULL
+    AND lon IS NOT NULL
+    AND NOT (lat = 0 AND lon = 0)
+"""
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometers."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _unit_vector(lat: float, lon: float):
+    """Map a lat/lon to a point on the unit sphere; chord length is monotonic in haversine distance."""
+    phi, lam = math.radians(lat), math.radians(lon)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+class StationCatalog:
+    """In-memory GSOD station list with a 3-D KD-tree for k-nearest-neighbor lookups."""
+
+    def __init__(self, stations: List[Dict[str, Any]]):
+        self.stations = stations
+        self._points = [_unit_vector(s["latitude"], s["longitude"]) for s in stations]
+        self._root = self._build(list(range(len(stations))), 0)
+
+    def _build(self, indices: List[int], depth: int):
+        """Build a KD-tree node as (point index, axis, left, right)."""
+        if not indices:
+            return None
+        axis = depth % 3
+        indices.sort(key=lambda i: self._points[i][axis])
+        mid = len(indices) // 2
+        return (
+            indices[mid],
+            axis,
+            self._build(indices[:mid], depth + 1),
+            self._build(indices[mid + 1:], depth + 1)
+        )
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        k: int = 3,
+        max_distance_km: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Find the k nearest stations, optionally within a radius.
+
+        Returns:
+            list[dict]: Station records with distance_km, nearest first
+        """
+        if k <= 0 or self._root is None:
+            return []
+
+        query = _unit_vector(latitude, longitude)
+        if max_distance_km is None:
+            max_chord_sq = 4.0  # Whole sphere
+        else:
+            half_angle = min(max_distance_km / (2 * EARTH_RADIUS_KM), math.pi / 2)
+            max_chord_sq = (2 * math.sin(half_angle)) ** 2
+
+        best: List[tuple] = []  # Max-heap of (-chord_sq, index)
+        stack = [(self._root, 0.0)]  # (node, lower bound on its chord_sq)
+        while stack:
+            node, lower_bound = stack.pop()
+            if node is None:
+                continue
+            bound = max_chord_sq if len(best) < k else min(max_chord_sq, -best[0][0])
+            if lower_bound > bound:
+                continue
+
+            index, axis, left, right = node
+            point = self._points[index]
+            chord_sq = (
+                (point[0] - query[0]) ** 2
+                + (point[1] - query[1]) ** 2
+                + (point[2] - query[2]) ** 2
+            )
+            if chord_sq <= max_chord_sq:
+                if len(best) < k:
+                    heapq.heappush(best, (-chord_sq, index))
+                elif chord_sq < -best[0][0]:
+                    heapq.heapreplace(best, (-chord_sq, index))
+
+            diff = query[axis] - point[axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            # Push the far side first so the near side is explored first; the far side
+            # is re-checked against the (by then tighter) bound when it is popped
+            stack.append((far, diff * diff))
+            stack.append((near, lower_bound))
+
+        results = []
+        for _, index in sorted(best, key=lambda item: -item[0]):
+            station = dict(self.stations[index])
+            station["distance_km"] = round(
+                haversine_km(latitude, longitude, station["latitude"], station["longitude"]), 2
+            )
+            results.append(station)
+        return results
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+
+def _load_stations(path: str) -> List[Dict[str, Any]]:
+    stations = []
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                stations.append({
+                    "usaf": row["usaf"],
+                    "wban": row["wban"],
+                    "name": row["name"],
+                    "state": row["state"] or None,
+                    "country": row["country"] or None,
+                    "latitude": float(row["lat"]),
+                    "longitude": float(row["lon"]),
+                    "begin": row["begin"] or None,
+                    "end": row["end"] or None
+                })
+            except (KeyError, ValueError):
+                continue
+    return stations
+
+
+def refresh_station_catalog(path: str = STATION_CATALOG_PATH) -> int:
+    """Download a fresh snapshot of the GSOD station list from BigQuery.
+
+    Returns:
+        int: Number of stations written
+    """
+    from .bigquery_client import run_query
+
+    rows = run_query(_STATIONS_QUERY, use_cache=False)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=_CATALOG_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({field: row.get(field) for field in _CATALOG_FIELDS})
+    os.replace(tmp_path, path)
+
+    logger.info(f"Wrote {len(rows)} stations to {path}")
+    reset_station_catalog()
+    return len(rows)
+
+
+_catalog: Optional[StationCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_station_catalog() -> StationCatalog:
+    """Load the station catalog on first use, downloading the snapshot if it is missing."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                if not os.path.exists(STATION_CATALOG_PATH):
+                    logger.info(f"No station snapshot at {STATION_CATALOG_PATH}; fetching from BigQuery")
+                    refresh_station_catalog(STATION_CATALOG_PATH)
+                _catalog = StationCatalog(_load_stations(STATION_CATALOG_PATH))
+                logger.info(f"Loaded {len(_catalog)} weather stations from {STATION_CATALOG_PATH}")
+    return _catalog
+
+
+def reset_station_catalog() -> None:
+    """Drop the in-memory catalog so the next lookup reloads the snapshot."""
+    global _catalog
+    _catalog = None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python -m shared_tools.station_catalog refresh | nearest <lat> <lon> [k] [max_km]"""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ("refresh", "nearest"):
+        print("Usage: python -m shared_tools.station_catalog refresh | nearest <lat> <lon> [k] [max_km]")
+        return 2
+
+    if argv[0] == "refresh":
+        count = refresh_station_catalog()
+        print(f"Wrote {count} stations to {STATION_CATALOG_PATH}")
+    else:
+        k = int(argv[3]) if len(argv) > 3 else 3
+        max_km = float(argv[4]) if len(argv) > 4 else None
+        for station in get_station_catalog().nearest(float(argv[1]), float(argv[2]), k=k, max_distance_km=max_km):
+            print(station)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -3,12 +3,14 @@ from .tools import (
     get_weather_statistics,
     get_nws_forecast,
     get_nws_alerts,
+    get_nws_alerts_multi,
     get_current_conditions,
     get_hourly_forecast,
     get_hurricane_track,
     geocode_address,
     get_directions,
     search_nearby_places,
+    search_nearby_places_multi,
     generate_map
 )
 
@@ -17,11 +19,13 @@ __all__ = [
     "get_weather_statistics",
     "get_nws_forecast",
     "get_nws_alerts",
+    "get_nws_alerts_multi",
     "get_current_conditions",
     "get_hourly_forecast",
     "get_hurricane_track",
     "geocode_address",
     "get_directions",
     "search_nearby_places",
+    "search_nearby_places_multi",
     "generate_map"
 ]
@@ -0,0 +1,261 @@
+import re
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional, List
+
+from .tools import fetch_nws_alerts, resolve_zone_coordinates, build_map_data
+from .gazetteer import US_STATE_CODES
+
+logger = logging.getLogger(__name__)
+
+_STATE_CODES = set(US_STATE_CODES.values())
+
+_NATIONAL_TERMS = {
+    "", "united states", "the united states", "us", "u.s.", "usa", "u.s.a.", "america",
+    "nationwide", "national", "all", "all states", "all us states", "all u.s. states",
+    "the us", "the country", "entire country", "everywhere",
+}
+
+_REQUEST_RE = re.compile(r"\b(?:alerts?|warnings?|watches)\b(?:\s+(?:for|in|across))?\s*(.*)$", re.IGNORECASE)
+_POINT_RE = re.compile(r"^\(?\s*(-?\d{1,2}(?:\.\d+)?)\s*,\s*(-?\d{1,3}(?:\.\d+)?)\s*\)?$")
+_SPLIT_RE = re.compile(r"\s*(?:,|;|/|&|\band\b)\s*", re.IGNORECASE)
+
+# Map framing used when there are no markers (continental US)
+US_CENTER = {"lat": 39.8283, "lng": -98.5795}
+
+DESCRIPTION_SHORT_LENGTH = 150
+
+
+def parse_alerts_request(text: str) -> Optional[Dict[str, Any]]:
+    """Turn a plain alerts request ("Get alerts for California, Texas") into fetch arguments.
+
+    Recognizes national requests, state names or postal codes (one or several) and
+    "lat,lng" coordinates. Anything else (cities, addresses, free-form questions)
+    returns None so the caller can fall back to the LLM pipeline.
+
+    Returns:
+        dict: Keyword arguments for fetch_nws_alerts, or None if the request is not recognized
+    """
+    text = (text or "").strip()
+    match = _REQUEST_RE.search(text)
+    location = (match.group(1) if match else text).strip().rstrip(".?!").strip()
+
+    if location.lower() in _NATIONAL_TERMS:
+        return {}
+
+    point = _POINT_RE.match(location)
+    if point:
+        return {"latitude": float(point.group(1)), "longitude": float(point.group(2))}
+
+    states = []
+    for part in _SPLIT_RE.split(location):
+        part = part.strip().strip(".")
+        if not part:
+            continue
+        code = US_STATE_CODES.get(part.lower()) or (part.upper() if part.upper() in _STATE_CODES else None)
+        if not code:
+            return None
+        states.append(code)
+
+    return {"states": list(dict.fromkeys(states))} if states else None
+
+
+def zone_id_from_url(zone: str) -> str:
+    """NWS lists affected zones as URLs; keep just the zone ID (e.g. FLZ069)."""
+    return zone.rstrip("/").rsplit("/", 1)[-1]
+
+
+def shorten_description(description: Optional[str], limit: int = DESCRIPTION_SHORT_LENGTH) -> str:
+    """Collapse whitespace and cut at a word boundary to fit a card."""
+    text = " ".join((description or "").split())
+    if len(text) <= limit:
+        return text
+    cut = text[:limit - 3].rsplit(" ", 1)[0]
+    return cut.rstrip(",;:") + "..."
+
+
+def _alert_detail(alert: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a get_nws_alerts alert into the AlertDetail schema."""
+    return {
+        "id": alert.get("id"),
+        "event": alert.get("event") or "",
+        "severity": alert.get("severity") or "Unknown",
+        "headline": alert.get("headline") or "",
+        "description": alert.get("description") or "",
+        "description_short": shorten_description(alert.get("description") or alert.get("headline")),
+        "affected_zones": [zone_id_from_url(zone) for zone in alert.get("affected_zones") or []],
+        "start_time": alert.get("onset") or "",
+        "end_time": alert.get("expires") or "",
+        "replaces": alert.get("replaces")
+    }
+
+
+def _locations(alerts: List[Dict[str, Any]]) -> List[str]:
+    """Unique area names across alerts, in first-seen order."""
+    names = []
+    for alert in alerts:
+        names.extend(part.strip() for part in (alert.get("area_desc") or "").split(";") if part.strip())
+    return list(dict.fromkeys(names))
+
+
+def _zoom_for(markers: List[Dict[str, Any]]) -> int:
+    """Pick a zoom level that fits every marker."""
+    if len(markers) < 2:
+        return 8 if markers else 4
+    span = max(
+        max(m["lat"] for m in markers) - min(m["lat"] for m in markers),
+        max(m["lng"] for m in markers) - min(m["lng"] for m in markers)
+    )
+    for max_span, zoom in ((1, 9), (2, 8), (5, 7), (10, 6), (20, 5)):
+        if span <= max_span:
+            return zoom
+    return 4
+
+
+def build_map_for_alerts(alert_details: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Resolve every affected zone to a marker and frame the map around them."""
+    event_by_zone = {}
+    for alert in alert_details:
+        for zone_id in alert["affected_zones"]:
+            event_by_zone.setdefault(zone_id, alert["event"])
+
+    markers = [
+        {
+            "lat": zone["latitude"],
+            "lng": zone["longitude"],
+            "title": zone.get("name") or zone["zone_id"],
+            "address": event_by_zone.get(zone["zone_id"], "")
+        }
+        for zone in resolve_zone_coordinates(list(event_by_zone))
+    ]
+
+    if markers:
+        center_lat = round(sum(m["lat"] for m in markers) / len(markers), 4)
+        center_lng = round(sum(m["lng"] for m in markers) / len(markers), 4)
+    else:
+        center_lat, center_lng = US_CENTER["lat"], US_CENTER["lng"]
+    return build_map_data(center_lat, center_lng, _zoom_for(markers), markers)
+
+
+def template_insights(summary: Dict[str, Any], severity_breakdown: Optional[Dict[str, int]] = None) -> str:
+    """Deterministic summary and safety guidance for an alerts snapshot."""
+    total = summary["total_count"]
+    if total == 0:
+        return "No active weather alerts for this area right now. Keep monitoring official NWS forecasts for changes."
+
+    alerts = summary["alerts"]
+    events = list(dict.fromkeys(alert["event"] for alert in alerts if alert["event"]))
+    parts = [f"{total} active alert{'s' if total != 1 else ''}"]
+    if severity_breakdown:
+        counts = [f"{count} {level.lower()}" for level, count in severity_breakdown.items() if count]
+        if counts:
+            parts[0] += f" ({', '.join(counts)})"
+    if events:
+        parts.append(f"Most critical: {', '.join(events[:3])}")
+    if summary["severe_count"]:
+        parts.append(
+            "Severe or extreme hazards are in effect: follow instructions from local officials, "
+            "review your emergency plan and be ready to act quickly"
+        )
+    else:
+        parts.append("Stay aware of changing conditions and check back for updates")
+    return ". ".join(parts) + "."
+
+
+def build_alerts_summary(
+    alerts_result: Dict[str, Any],
+    insights: Optional[str] = None,
+    include_map: bool = True
+) -> Dict[str, Any]:
+    """Build an AlertsSummary dict directly from a get_nws_alerts / fetch_nws_alerts result.
+
+    Args:
+        alerts_result (dict): Successful result of fetch_nws_alerts
+        insights (str): Insights text; a template is used when omitted
+        include_map (bool): Resolve zone coordinates into map_data
+
+    Returns:
+        dict: alerts, total_count, severe_count, locations, insights and map_data
+    """
+    alert_details = [_alert_detail(alert) for alert in alerts_result.get("alerts", [])]
+    breakdown = alerts_result.get("severity_breakdown") or {}
+    summary = {
+        "alerts": alert_details,
+        "total_count": alerts_result.get("total_count", len(alert_details)),
+        "severe_count": breakdown.get("Extreme", 0) + breakdown.get("Severe", 0),
+        "locations": _locations(alerts_result.get("alerts", [])),
+        "insights": "",
+        "map_data": build_map_for_alerts(alert_details) if include_map else None
+    }
+    summary["insights"] = insights or template_insights(summary, breakdown)
+    return summary
+
+
+def build_alerts_snapshot(request: Dict[str, Any], insights: Optional[str] = None) -> Dict[str, Any]:
+    """Fetch alerts for a parsed request and build the AlertsSummary, with no LLM involved.
+
+    Args:
+        request (dict): Output of parse_alerts_request
+        insights (str): Optional insights text (a template is used when omitted)
+
+    Returns:
+        dict: {"status": "success", "summary": AlertsSummary dict, "generated_at": ...}
+            or an error dict
+    """
+    alerts_result = fetch_nws_alerts(**request)
+    if alerts_result.get("status") != "success":
+        return alerts_result
+
+    summary = build_alerts_summary(alerts_result, insights=insights)
+    logger.info(
+        f"Built alerts snapshot for {request or 'national'}: "
+        f"{len(summary['alerts'])} alerts, {len(summary['map_data']['markers'])} markers"
+    )
+    return {
+        "status": "success",
+        "summary": summary,
+        "generated_at": datetime.now().isoformat()
+    }
+
+
+def build_alerts_delta(request: Dict[str, Any], since: str, insights: Optional[str] = None) -> Dict[str, Any]:
+    """Build an AlertsSummary holding only the alerts changed since a poll cursor.
+
+    "alerts" (and the map markers) cover added and updated alerts only; the ids to
+    drop are in expired_alert_ids and in each updated alert's "replaces". When
+    "reset" is True the client must discard its previous set.
+
+    Args:
+        request (dict): Output of parse_alerts_request
+        since (str): Cursor from the previous poll, or "start"
+        insights (str): Optional insights text (a template is used when omitted)
+
+    Returns:
+        dict: {"status": "success", "summary": AlertsSummary dict with cursor fields, ...}
+            or an error dict
+    """
+    result = fetch_nws_alerts(**request, since=since)
+    if result.get("status") != "success":
+        return result
+
+    changed = {
+        "alerts": result["added"] + result["updated"],
+        "total_count": result["total_count"],
+        "severity_breakdown": result["severity_breakdown"]
+    }
+    summary = build_alerts_summary(changed, insights=insights)
+    summary.update({
+        "cursor": result["cursor"],
+        "delta": True,
+        "reset": result["reset"],
+        "expired_alert_ids": result["expired"]
+    })
+    logger.info(
+        f"Built alerts delta for {request or 'national'}: {len(result['added'])} added, "
+        f"{len(result['updated'])} updated, {len(result['expired'])} expired"
+    )
+    return {
+        "status": "success",
+        "summary": summary,
+        "generated_at": datetime.now().isoformat()
+    }
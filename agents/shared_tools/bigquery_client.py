@@ -0,0 +1,247 @@
+import os
+import re
+import time
+import json
+import hashlib
+import logging
+import threading
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from typing import Optional, List
+
+from .cache import TieredCache
+from .bq_metrics import record_query
+from .singleflight import SingleFlight
+from .rate_limit import get_limiter
+
+logger = logging.getLogger(__name__)
+
+# The BigQuery client, credentials and .env are only initialized on first use so that
+# agents which never query BigQuery (forecast, alerts) don't pay for it at cold start.
+_client = None
+_client_lock = threading.Lock()
+_env_loaded = False
+_env_lock = threading.Lock()
+
+# Result cache for queries against public datasets. TTLs are per dataset: ACS census
+# releases are immutable, the station list changes rarely, and GSOD gains new days daily.
+BQ_CACHE_TTLS = {
+    "census_bureau_acs": float(os.getenv("BQ_CACHE_TTL_CENSUS", str(30 * 24 * 3600))),
+    "noaa_gsod.stations": float(os.getenv("BQ_CACHE_TTL_STATIONS", str(7 * 24 * 3600))),
+    "noaa_gsod.gsod": float(os.getenv("BQ_CACHE_TTL_GSOD", str(24 * 3600))),
+}
+BQ_CACHE_DEFAULT_TTL = float(os.getenv("BQ_CACHE_DEFAULT_TTL", str(3600)))
+BQ_CACHE_MAX_ENTRIES = int(os.getenv("BQ_CACHE_MAX_ENTRIES", "5000"))
+
+# Optional guard: BigQuery rejects any job that would bill more than this many bytes
+BQ_MAX_BYTES_BILLED = int(os.getenv("BQ_MAX_BYTES_BILLED", "0")) or None
+
+query_cache = TieredCache(
+    "bigquery_results",
+    ttl_seconds=BQ_CACHE_DEFAULT_TTL,
+    max_memory_items=256,
+    max_disk_items=BQ_CACHE_MAX_ENTRIES
+)
+
+# Concurrent identical queries (same SQL + parameters) share one job
+query_flights = SingleFlight("bigquery")
+
+
+def ensure_env_loaded() -> None:
+    """Load the .env file once, on first use."""
+    global _env_loaded
+    if not _env_loaded:
+        with _env_lock:
+            if not _env_loaded:
+                from dotenv import load_dotenv
+                load_dotenv()
+                _env_loaded = True
+
+
+def get_bq_client():
+    """Get the shared BigQuery client, creating it (and resolving credentials) on first call.
+
+    Returns:
+        google.cloud.bigquery.Client: Process-wide client instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                ensure_env_loaded()
+
+                import google.auth
+                from google.cloud import bigquery
+
+                credentials, project_id = google.auth.default()
+                if not project_id:
+                    project_id = os.getenv("GCP_PROJECT") or os.getenv("GOOGLE_CLOUD_PROJECT")
+
+                _client = bigquery.Client(credentials=credentials, project=project_id)
+                logger.info(f"Initialized BigQuery client for project {project_id}")
+    return _client
+
+
+class QueryResult(list):
+    """List of QueryRow with the job statistics attached as .stats."""
+
+    def __init__(self, rows=(), stats: Optional[dict] = None):
+        super().__init__(rows)
+        self.stats = stats or {}
+
+
+class QueryRow(dict):
+    """Result row that supports both row["col"] and row.col access, like bigquery.Row."""
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+
+def _to_json_value(value):
+    """Convert BigQuery cell values to JSON-friendly equivalents."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    return value
+
+
+def _cache_key(query: str, query_parameters: Optional[list]) -> str:
+    """Key a query by its whitespace-normalized SQL plus its parameters."""
+    normalized_sql = re.sub(r"\s+", " ", query).strip()
+    params = []
+    for p in (query_parameters or []):
+        if hasattr(p, "values"):  # ArrayQueryParameter
+            params.append([p.name, getattr(p, "array_type", None), [_to_json_value(v) for v in p.values]])
+        else:
+            params.append([getattr(p, "name", None), getattr(p, "type_", None), _to_json_value(getattr(p, "value", None))])
+    payload = json.dumps([normalized_sql, params], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """True for BigQuery quota errors (HTTP 429 or a rateLimitExceeded reason)."""
+    return getattr(error, "code", None) == 429 or "rateLimitExceeded" in str(error)
+
+
+def _ttl_for(query: str) -> float:
+    """Pick the cache TTL for the most volatile dataset referenced by the query."""
+    ttls = [ttl for dataset, ttl in BQ_CACHE_TTLS.items() if dataset in query]
+    return min(ttls) if ttls else BQ_CACHE_DEFAULT_TTL
+
+
+def run_query(
+    query: str,
+    query_parameters: Optional[list] = None,
+    use_cache: bool = True,
+    max_bytes_billed: Optional[int] = None
+) -> List[QueryRow]:
+    """Run a BigQuery query, serving repeated identical queries from the result cache.
+
+    Identical queries issued while one is already running wait for that job
+    instead of starting their own; new jobs are paced by the "bigquery" rate limiter. Every call is recorded in bq_metrics (job id,
+    bytes processed/billed, slot time, cache hit, wall time) under the name of the
+    calling tool; calls that shared another caller's job are recorded as coalesced.
+
+    Args:
+        query (str): SQL text
+        query_parameters (list): Optional bigquery.ScalarQueryParameter list
+        use_cache (bool): Set False to always run a fresh job
+        max_bytes_billed (int): Reject the job if it would bill more than this
+            (defaults to BQ_MAX_BYTES_BILLED; unlimited when unset)
+
+    Returns:
+        QueryResult: Result rows with JSON-friendly values (dates as ISO strings);
+            .stats holds bytes processed/billed and whether the result cache was hit
+    """
+    start = time.perf_counter()
+    key = _cache_key(query, query_parameters)
+    if use_cache:
+        cached = query_cache.get(key)
+        if cached is not None:
+            logger.info(f"BigQuery result cache hit ({len(cached)} rows)")
+            stats = {
+                "result_cache_hit": True,
+                "total_bytes_processed": 0,
+                "total_bytes_billed": 0,
+                "wall_ms": round((time.perf_counter() - start) * 1000, 2)
+            }
+            record_query(stats)
+            return QueryResult((QueryRow(row) for row in cached), stats)
+
+    (rows, stats), shared = query_flights.do(
+        key, lambda: _execute(query, query_parameters, key if use_cache else None, max_bytes_billed, start)
+    )
+    if shared:
+        stats = {
+            "job_id": stats.get("job_id"),
+            "coalesced": True,
+            "result_cache_hit": False,
+            "total_bytes_processed": 0,
+            "total_bytes_billed": 0,
+            "wall_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+        record_query(stats)
+    return QueryResult((QueryRow(row) for row in rows), stats)
+
+
+def _execute(
+    query: str,
+    query_parameters: Optional[list],
+    cache_key: Optional[str],
+    max_bytes_billed: Optional[int],
+    start: float
+):
+    """Run one BigQuery job, record it and cache its rows under cache_key (if given).
+
+    Returns:
+        tuple: (rows as JSON-friendly dicts, job stats)
+    """
+    from google.cloud import bigquery
+    job_config = bigquery.QueryJobConfig(query_parameters=query_parameters or [])
+    max_bytes_billed = max_bytes_billed or BQ_MAX_BYTES_BILLED
+    if max_bytes_billed:
+        job_config.maximum_bytes_billed = max_bytes_billed
+
+    limiter = get_limiter("bigquery")
+    if limiter:
+        limiter.acquire()
+
+    query_job = None
+    try:
+        query_job = get_bq_client().query(query, job_config=job_config)
+        rows = [
+            {name: _to_json_value(value) for name, value in row.items()}
+            for row in query_job.result()
+        ]
+    except Exception as e:
+        if limiter and _is_rate_limited(e):
+            limiter.throttled()
+        record_query({
+            "job_id": query_job.job_id if query_job else None,
+            "result_cache_hit": False,
+            "wall_ms": round((time.perf_counter() - start) * 1000, 2),
+            "max_bytes_billed": max_bytes_billed,
+            "error": str(e)[:500]
+        })
+        raise
+
+    stats = {
+        "job_id": query_job.job_id,
+        "result_cache_hit": False,
+        "cache_hit": bool(query_job.cache_hit),
+        "total_bytes_processed": query_job.total_bytes_processed or 0,
+        "total_bytes_billed": query_job.total_bytes_billed or 0,
+        "slot_millis": query_job.slot_millis or 0,
+        "wall_ms": round((time.perf_counter() - start) * 1000, 2)
+    }
+    record_query(stats)
+    if limiter:
+        limiter.succeeded()
+
+    if cache_key:
+        query_cache.set(cache_key, rows, ttl_seconds=_ttl_for(query))
+    return rows, stats
@@ -0,0 +1,203 @@
+import os
+import time
+import asyncio
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Client-side pacing of upstream calls; false disables every limiter
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+# A call that would have to wait longer than this fails instead of queueing
+RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "30"))
+# On a 429/503 the rate is multiplied by this (never below RATE_LIMIT_MIN_FRACTION of
+# the configured rate); each success adds back RATE_LIMIT_RECOVERY of the configured rate
+RATE_LIMIT_BACKOFF = float(os.getenv("RATE_LIMIT_BACKOFF", "0.5"))
+RATE_LIMIT_MIN_FRACTION = float(os.getenv("RATE_LIMIT_MIN_FRACTION", "0.1"))
+RATE_LIMIT_RECOVERY = float(os.getenv("RATE_LIMIT_RECOVERY", "0.05"))
+
+# Upstream -> (requests per second, burst); override with RATE_LIMIT_<NAME> and RATE_LIMIT_<NAME>_BURST
+_DEFAULT_LIMITS = {
+    "nws": (10.0, 20),
+    "nhc": (5.0, 10),
+    "maps_geocode": (25.0, 50),
+    "maps_directions": (10.0, 20),
+    "maps_places": (10.0, 20),
+    "bigquery": (5.0, 10),
+}
+
+# Responses that mean "slow down"
+THROTTLE_STATUS_CODES = (429, 503)
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised when a call would wait longer than RATE_LIMIT_MAX_WAIT for its turn."""
+
+
+class TokenBucket:
+    """Token bucket shared by threads and coroutines, with AIMD rate adaptation.
+
+    Callers reserve a token and sleep until it is theirs, so waiters are served in
+    arrival order. Throttling responses halve the rate and pause the bucket for
+    Retry-After; successes raise it back towards the configured rate.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int):
+        self.name = name
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {
+            "acquired": 0, "waited": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0,
+            "queue_depth": 0, "max_queue_depth": 0, "throttled": 0, "rejected": 0
+        }
+
+    def _refill(self, now: float) -> None:
+        # No tokens accrue while paused for Retry-After
+        since = max(self._updated, self._blocked_until)
+        if now > since:
+            self._tokens = min(float(self.burst), self._tokens + (now - since) * self.rate)
+        self._updated = max(self._updated, now)
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = max(0.0, self._blocked_until - now) + max(0.0, -self._tokens / self.rate)
+            if wait > RATE_LIMIT_MAX_WAIT:
+                self._tokens += 1
+                self._stats["rejected"] += 1
+                raise RateLimitExceeded(
+                    f"{self.name} rate limit: would wait {wait:.1f}s (limit {RATE_LIMIT_MAX_WAIT:.0f}s)"
+                )
+            self._stats["acquired"] += 1
+            if wait > 0:
+                self._stats["waited"] += 1
+                self._stats["wait_seconds"] += wait
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], wait)
+                self._stats["queue_depth"] += 1
+                self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._stats["queue_depth"])
+            return wait
+
+    def _dequeue(self) -> None:
+        with self._lock:
+            self._stats["queue_depth"] -= 1
+
+    def acquire(self) -> float:
+        """Block until the caller may make one call. Returns the seconds waited."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._dequeue()
+        return wait
+
+    async def aacquire(self) -> float:
+        """Async acquire(): waits without blocking the event loop."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._dequeue()
+        return wait
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """Upstream said slow down: cut the rate and pause for Retry-After seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.base_rate * RATE_LIMIT_MIN_FRACTION, self.rate * RATE_LIMIT_BACKOFF)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            self._stats["throttled"] += 1
+        logger.warning(
+            f"{self.name} throttled upstream; rate now {self.rate:.2f}/s"
+            + (f", paused {retry_after:.1f}s" if retry_after else "")
+        )
+
+    def succeeded(self) -> None:
+        """A call went through: recover the rate additively."""
+        if self.rate < self.base_rate:
+            with self._lock:
+                self.rate = min(self.base_rate, self.rate + self.base_rate * RATE_LIMIT_RECOVERY)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["rate"] = round(self.rate, 3)
+            stats["base_rate"] = self.base_rate
+            stats["burst"] = self.burst
+            stats["paused_seconds"] = round(max(0.0, self._blocked_until - time.monotonic()), 2)
+        stats["wait_seconds"] = round(stats["wait_seconds"], 3)
+        stats["max_wait_seconds"] = round(stats["max_wait_seconds"], 3)
+        stats["avg_wait_ms"] = round(stats["wait_seconds"] * 1000 / stats["waited"], 2) if stats["waited"] else 0.0
+        return stats
+
+
+def _configured(name: str) -> TokenBucket:
+    rate, burst = _DEFAULT_LIMITS[name]
+    rate = float(os.getenv(f"RATE_LIMIT_{name.upper()}", str(rate)))
+    burst = int(os.getenv(f"RATE_LIMIT_{name.upper()}_BURST", str(burst)))
+    return TokenBucket(name, rate, burst)
+
+
+_buckets: Dict[str, TokenBucket] = {name: _configured(name) for name in _DEFAULT_LIMITS}
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), or None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def upstream_for(host: str, path: str = "") -> Optional[str]:
+    """Name of the limiter for a host and path, or None for hosts that are not paced."""
+    host = host.split(":", 1)[0].lower()
+    if host == "api.weather.gov":
+        return "nws"
+    if host.endswith("nhc.noaa.gov"):
+        return "nhc"
+    if host == "maps.googleapis.com":
+        for segment, name in (("/geocode/", "maps_geocode"), ("/directions/", "maps_directions"), ("/place/", "maps_places")):
+            if segment in path:
+                return name
+    return None
+
+
+def get_limiter(name: Optional[str]) -> Optional[TokenBucket]:
+    """The limiter for an upstream name, or None when unknown or rate limiting is disabled."""
+    if not RATE_LIMIT_ENABLED or not name:
+        return None
+    return _buckets.get(name)
+
+
+def limiter_for_url(url: str) -> Optional[TokenBucket]:
+    parts = urlsplit(url)
+    return get_limiter(upstream_for(parts.netloc, parts.path))
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-upstream rate, queue depth and wait-time counters."""
+    return {name: bucket.stats() for name, bucket in _buckets.items()}
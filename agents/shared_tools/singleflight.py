@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Dict, Any, Callable, Awaitable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Every group by name, for get_singleflight_stats()
+_groups: Dict[str, "SingleFlight"] = {}
+
+
+class _Call:
+    """An in-flight sync call that other threads can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls into one upstream call.
+
+    While a call for a key is in flight, later callers with the same key wait for
+    it and receive its result (or its exception) instead of starting their own.
+    Nothing is kept once the call finishes; caching is the caller's job.
+
+    Sync callers (threads) and async callers (one event loop) are coalesced
+    separately: a thread never waits on a coroutine and vice versa.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._tasks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = weakref.WeakKeyDictionary()
+        self._stats = {"calls": 0, "upstream_calls": 0, "coalesced": 0, "errors": 0}
+        _groups[name] = self
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run fn() unless an identical call is already in flight, then share its outcome.
+
+        Args:
+            key (str): Identity of the call (e.g. URL + params, SQL + params)
+            fn (callable): Makes the upstream call
+
+        Returns:
+            tuple: (result, shared) where shared is True if another caller's call was reused
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats["upstream_calls"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            with self._lock:
+                self._stats["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    async def ado(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """Async do(): fn() is a coroutine function, run once per key on the running loop.
+
+        The upstream call runs as its own task, so cancelling one waiter (even the
+        one that started it) does not cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._stats["calls"] += 1
+            tasks = self._tasks.setdefault(loop, {})
+            task = tasks.get(key)
+            shared = task is not None
+            if shared:
+                self._stats["coalesced"] += 1
+            else:
+                self._stats["upstream_calls"] += 1
+                task = tasks[key] = loop.create_task(fn())
+                task.add_done_callback(lambda finished: self._finish(tasks, key, finished))
+
+        return await asyncio.shield(task), shared
+
+    def _finish(self, tasks: Dict[str, asyncio.Task], key: str, task: asyncio.Task) -> None:
+        with self._lock:
+            if tasks.get(key) is task:
+                del tasks[key]
+            if not task.cancelled() and task.exception() is not None:
+                self._stats["errors"] += 1
+
+    def pending(self, key: str) -> bool:
+        """Whether a call for key is in flight (in any thread or event loop)."""
+        with self._lock:
+            return key in self._calls or any(key in tasks for tasks in self._tasks.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for this group; coalesced calls never reached the upstream."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["in_flight"] = len(self._calls) + sum(len(tasks) for tasks in self._tasks.values())
+        stats["coalesced_ratio"] = round(stats["coalesced"] / stats["calls"], 4) if stats["calls"] else 0.0
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for stat in self._stats:
+                self._stats[stat] = 0
+
+
+def get_singleflight_stats() -> Dict[str, Dict[str, Any]]:
+    """Get per-group coalescing counters (e.g. "http", "bigquery")."""
+    return {name: group.stats() for name, group in _groups.items()}
+
+
+def reset_singleflight_stats() -> None:
+    """Clear the counters of every group."""
+    for group in _groups.values():
+        group.reset_stats()
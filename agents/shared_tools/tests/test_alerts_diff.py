@@ -0,0 +1,107 @@
+import pytest
+
+from shared_tools import alerts_diff
+from shared_tools.alerts_diff import diff_alerts, START_CURSOR
+from shared_tools.cache import TieredCache
+
+FILTERS = {"area": "FL"}
+
+
+@pytest.fixture(autouse=True)
+def cursor_cache(tmp_path, monkeypatch):
+    cache = TieredCache("alert_cursors", ttl_seconds=60, path=str(tmp_path / "cursors.sqlite3"))
+    monkeypatch.setattr(alerts_diff, "cursor_cache", cache)
+    return cache
+
+
+def alert(identifier, sent="2026-10-18T00:00:00+00:00", references=()):
+    return {
+        "id": identifier,
+        "event": "Flood Watch",
+        "sent": sent,
+        "references": [{"identifier": ref} for ref in references]
+    }
+
+
+def ids(alerts):
+    return [a["id"] for a in alerts]
+
+
+def apply(client_set, delta):
+    """What a client holds after applying a delta to its previous set."""
+    if delta["reset"]:
+        client_set = set()
+    replaced = {ref for a in delta["updated"] for ref in a.get("replaces", [])}
+    return (client_set - set(delta["expired"]) - replaced) | set(ids(delta["added"] + delta["updated"]))
+
+
+def test_start_returns_everything_and_a_cursor():
+    delta = diff_alerts([alert("A"), alert("B"), alert("A")], START_CURSOR, FILTERS)
+
+    assert delta["reset"] is True
+    assert ids(delta["added"]) == ["A", "B"]
+    assert delta["total_count"] == 2
+    assert delta["cursor"]
+
+
+def test_unchanged_updated_added_and_expired():
+    first = diff_alerts([alert("A"), alert("B"), alert("C")], START_CURSOR, FILTERS)
+    delta = diff_alerts(
+        [alert("A"), alert("B", sent="2026-10-18T01:00:00+00:00"), alert("D")], first["cursor"], FILTERS
+    )
+
+    assert delta["reset"] is False
+    assert ids(delta["added"]) == ["D"]
+    assert ids(delta["updated"]) == ["B"]
+    assert delta["expired"] == ["C"]
+    assert delta["unchanged_count"] == 1
+    assert apply({"A", "B", "C"}, delta) == {"A", "B", "D"}
+
+
+def test_new_alert_replacing_a_gone_alert():
+    first = diff_alerts([alert("A")], START_CURSOR, FILTERS)
+    delta = diff_alerts([alert("A2", references=["A"])], first["cursor"], FILTERS)
+
+    assert ids(delta["updated"]) == ["A2"]
+    assert delta["updated"][0]["replaces"] == ["A"]
+    assert delta["expired"] == []
+    assert apply({"A"}, delta) == {"A2"}
+
+
+def test_referenced_alert_still_active_is_not_replaced():
+    first = diff_alerts([alert("A")], START_CURSOR, FILTERS)
+    # NWS lists the new alert before the one it references
+    delta = diff_alerts([alert("A2", references=["A"]), alert("A")], first["cursor"], FILTERS)
+
+    assert ids(delta["added"]) == ["A2"]
+    assert delta["updated"] == []
+    assert apply({"A"}, delta) == {"A", "A2"}
+
+
+def test_cursors_chain():
+    cursor = diff_alerts([alert("A")], START_CURSOR, FILTERS)["cursor"]
+    cursor = diff_alerts([alert("A"), alert("B")], cursor, FILTERS)["cursor"]
+    delta = diff_alerts([alert("B")], cursor, FILTERS)
+
+    assert delta["expired"] == ["A"]
+    assert delta["added"] == []
+
+
+def test_unknown_or_foreign_cursor_resyncs():
+    first = diff_alerts([alert("A")], START_CURSOR, FILTERS)
+
+    unknown = diff_alerts([alert("A")], "no-such-cursor", FILTERS)
+    assert unknown["reset"] is True
+    assert ids(unknown["added"]) == ["A"]
+
+    other_filters = diff_alerts([alert("A")], first["cursor"], {"area": "TX"})
+    assert other_filters["reset"] is True
+    assert apply({"stale"}, other_filters) == {"A"}
+
+
+def test_cursor_survives_a_restart(tmp_path, monkeypatch):
+    first = diff_alerts([alert("A")], START_CURSOR, FILTERS)
+    reopened = TieredCache("alert_cursors", ttl_seconds=60, path=str(tmp_path / "cursors.sqlite3"))
+    monkeypatch.setattr(alerts_diff, "cursor_cache", reopened)
+
+    assert diff_alerts([alert("A")], first["cursor"], FILTERS)["reset"] is False
@@ -0,0 +1,115 @@
+import json
+import asyncio
+
+import pytest
+
+from shared_tools.alerts_stream import (
+    iter_feature_properties, aiter_feature_properties, summarize_alerts, format_alert, LONG_TEXT_FIELDS
+)
+
+
+def feature(index, severity="Moderate", urgency="Expected", description=None, instruction=None):
+    return {
+        "id": f"https://api.weather.gov/alerts/{index}",
+        "type": "Feature",
+        "geometry": {"type": "Polygon", "coordinates": [[[-82.5, 27.9], [-82.4, 27.9], [-82.4, 28.0], [-82.5, 27.9]]]}
+        if index % 2 else None,
+        "properties": {
+            "id": f"alert-{index}",
+            "areaDesc": "Hillsborough, FL; Pinellas, FL",
+            "geocode": {"UGC": ["FLZ050", "FLZ151"]},
+            "affectedZones": ["https://api.weather.gov/zones/forecast/FLZ050"],
+            "references": [{"identifier": "older", "sent": "2026-10-18T00:00:00+00:00"}],
+            "event": "description",  # A value that equals a deferred key
+            "severity": severity,
+            "urgency": urgency,
+            "onset": f"2026-10-18T{index % 24:02d}:00:00+00:00",
+            "description": description,
+            "instruction": instruction,
+            "headline": "Flood Watch — \"quoted\" \\ café ☃",
+            "parameters": {"description": ["nested, not deferred"]}
+        }
+    }
+
+
+FEATURES = [
+    feature(0, "Extreme", "Immediate", "Line one\nLine \"two\" é☃" * 40, "Move to higher ground."),
+    feature(1, "Severe", description="Severe text", instruction=None),
+    feature(2, "Minor", description=None, instruction="Stay tuned"),
+    feature(3, "Moderate", description="x" * 5000, instruction="y"),
+    feature(4, "Unknown"),
+]
+FEED = json.dumps({
+    "type": "FeatureCollection",
+    "features": FEATURES,
+    "title": "Current watches, warnings, and advisories"
+}, indent=1).encode("utf-8")
+
+
+def chunked(raw, size):
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 1000, len(FEED)])
+def test_properties_survive_every_chunk_boundary(size):
+    assert list(iter_feature_properties(chunked(FEED, size))) == [f["properties"] for f in FEATURES]
+
+
+@pytest.mark.parametrize("size", [1, 5, 64, len(FEED)])
+def test_deferred_fields_decode_to_the_same_alerts(size):
+    expected = summarize_alerts((f["properties"] for f in FEATURES), top_k=3)
+    deferred = summarize_alerts(iter_feature_properties(chunked(FEED, size), defer=LONG_TEXT_FIELDS), top_k=3)
+
+    assert deferred == expected
+    assert json.dumps(deferred)
+
+
+def test_deferred_fields_are_not_decoded():
+    props = next(iter_feature_properties([FEED], defer=LONG_TEXT_FIELDS))
+
+    assert not isinstance(props["description"], str)
+    assert props["event"] == "description"
+    assert props["parameters"] == {"description": ["nested, not deferred"]}
+    assert format_alert(props)["description"] == FEATURES[0]["properties"]["description"]
+    # null values are left as they are
+    assert next(iter_feature_properties([json.dumps({"features": [feature(9)]}).encode()], defer=LONG_TEXT_FIELDS))["description"] is None
+
+
+def test_multibyte_characters_split_across_chunks():
+    raw = json.dumps({"features": FEATURES}, ensure_ascii=False).encode("utf-8")
+
+    assert list(iter_feature_properties(chunked(raw, 1))) == [f["properties"] for f in FEATURES]
+
+
+def test_features_key_split_across_chunks_and_empty_feed():
+    raw = b'{"type": "FeatureCollection", "feat' + b'ures": [{"properties": {"id": "a"}}]}'
+
+    assert list(iter_feature_properties([raw[:30], raw[30:]])) == [{"id": "a"}]
+    assert list(iter_feature_properties([b'{"features": []}'])) == []
+
+
+def test_async_iterator_matches_sync():
+    async def chunks():
+        for chunk in chunked(FEED, 7):
+            yield chunk
+
+    async def collect():
+        return [props async for props in aiter_feature_properties(chunks(), defer=LONG_TEXT_FIELDS)]
+
+    result = asyncio.run(collect())
+    assert [format_alert(props) for props in result] == [format_alert(f["properties"]) for f in FEATURES]
+
+
+def test_top_k_ranking_and_counts():
+    summary = summarize_alerts((f["properties"] for f in FEATURES), top_k=2)
+
+    assert [alert["id"] for alert in summary["alerts"]] == ["alert-0", "alert-1"]
+    assert summary["total_count"] == 5
+    assert summary["severity_breakdown"] == {"Extreme": 1, "Severe": 1, "Moderate": 1, "Minor": 1, "Unknown": 1}
+
+
+def test_severity_filter():
+    summary = summarize_alerts((f["properties"] for f in FEATURES), top_k=10, severity="Severe")
+
+    assert [alert["id"] for alert in summary["alerts"]] == ["alert-1"]
+    assert summary["total_count"] == 1
@@ -0,0 +1,55 @@
+import pytest
+
+from shared_tools.alerts_summary import parse_alerts_request, zone_id_from_url, shorten_description
+
+
+@pytest.mark.parametrize("text", [
+    "Get alerts for the United States",
+    "alerts nationwide",
+    "Show me all weather warnings across the country.",
+    "USA",
+    "",
+])
+def test_national_requests(text):
+    assert parse_alerts_request(text) == {}
+
+
+@pytest.mark.parametrize("text, states", [
+    ("Get alerts for Florida", ["FL"]),
+    ("Get alerts for California, Texas", ["CA", "TX"]),
+    ("warnings in New York and new jersey", ["NY", "NJ"]),
+    ("Alerts for TX; ok / la", ["TX", "OK", "LA"]),
+    ("FL, Florida", ["FL"]),
+    ("District of Columbia?", ["DC"]),
+])
+def test_state_requests(text, states):
+    assert parse_alerts_request(text) == {"states": states}
+
+
+def test_point_requests():
+    assert parse_alerts_request("Get alerts for 27.95,-82.46") == {"latitude": 27.95, "longitude": -82.46}
+    assert parse_alerts_request("alerts for (61.2, -149.9)") == {"latitude": 61.2, "longitude": -149.9}
+
+
+@pytest.mark.parametrize("text", [
+    "Get alerts for Tampa, FL",
+    "alerts near 1600 Pennsylvania Ave",
+    "Is it going to flood in Houston tomorrow?",
+    "Florida and Narnia",
+])
+def test_unrecognized_requests_go_to_the_llm(text):
+    assert parse_alerts_request(text) is None
+
+
+def test_zone_id_from_url():
+    assert zone_id_from_url("https://api.weather.gov/zones/forecast/FLZ069/") == "FLZ069"
+    assert zone_id_from_url("FLZ069") == "FLZ069"
+
+
+def test_shorten_description_cuts_on_a_word():
+    text = "Heavy   rain\nexpected " + "word " * 50
+    short = shorten_description(text, limit=30)
+
+    assert len(short) <= 30 and short.endswith("...")
+    assert "  " not in short and "\n" not in short
+    assert shorten_description(None) == ""
@@ -0,0 +1,79 @@
+import os
+
+from shared_tools.cache import TieredCache
+
+
+def make_cache(tmp_path, **kwargs):
+    return TieredCache("test", ttl_seconds=60, path=str(tmp_path / "test.sqlite3"), **kwargs)
+
+
+def test_disk_tier_survives_a_new_process(tmp_path):
+    make_cache(tmp_path).set("zone:FLZ069", {"lat": 27.9, "lon": -82.4})
+
+    cache = make_cache(tmp_path)
+    assert cache.get("zone:FLZ069") == {"lat": 27.9, "lon": -82.4}
+    assert cache.stats()["disk_hits"] == 1
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("key", "value", ttl_seconds=-1)
+
+    assert cache.get("key") is None
+    assert cache.stats()["expired"] >= 1
+
+
+def test_memory_tier_is_lru(tmp_path):
+    cache = make_cache(tmp_path, max_memory_items=2)
+    cache.set_many([("a", 1), ("b", 2)])
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert list(cache._memory) == ["a", "c"]
+
+
+def test_disk_tier_is_trimmed_to_max_disk_items(tmp_path):
+    cache = make_cache(tmp_path, max_disk_items=10)
+    for index in range(50):
+        cache.set(f"key{index}", index, ttl_seconds=100 + index)
+
+    assert cache.stats()["disk_items"] <= cache._disk_high_water
+    # The entries closest to expiry go first
+    assert make_cache(tmp_path).get("key49") == 49
+    assert make_cache(tmp_path).get("key0") is None
+
+
+def test_delete_and_clear(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set_many([("a", 1), ("b", 2)])
+
+    cache.delete("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert cache.get("b") is None
+    assert cache.stats()["disk_items"] == 0
+
+
+def test_disk_errors_do_not_raise(tmp_path, caplog):
+    cache = make_cache(tmp_path)
+    cache.set("a", 1)
+    cache._db().execute("DROP TABLE entries")
+
+    cache.set("b", 2)
+    cache.delete("a")
+    cache.clear()
+    assert cache.stats()["disk_items"] == 0
+    assert "delete failed" in caplog.text
+    assert "clear failed" in caplog.text
+
+
+def test_unwritable_directory_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    cache = TieredCache("test", ttl_seconds=60, path=os.path.join(str(blocker), "cache.sqlite3"))
+
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.path is None
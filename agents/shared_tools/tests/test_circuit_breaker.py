@@ -0,0 +1,79 @@
+import time
+
+import pytest
+
+from shared_tools import http_client
+from shared_tools.circuit_breaker import CircuitBreaker, CircuitOpenError, breaker_for_url, CLOSED, OPEN, HALF_OPEN
+
+
+def open_breaker(reset_timeout=0.1):
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=reset_timeout)
+    for _ in range(3):
+        breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_consecutive_failures_only():
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_half_open_trial_closes_on_success():
+    breaker = open_breaker()
+    time.sleep(0.15)
+
+    assert breaker.ready()
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # Only one trial at a time
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.closed
+    assert breaker.allow()
+
+
+def test_failed_trial_reopens():
+    breaker = open_breaker()
+    time.sleep(0.15)
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.stats()["opened"] == 2
+
+
+def test_lost_trial_is_replaced_after_another_timeout():
+    breaker = open_breaker()
+    time.sleep(0.15)
+    assert breaker.allow()  # The trial never reports back
+
+    assert not breaker.allow()
+    time.sleep(0.15)
+    assert breaker.allow()
+
+
+def test_breakers_are_per_upstream():
+    assert breaker_for_url("https://api.weather.gov/alerts/active").name == "nws"
+    assert breaker_for_url("https://api.weather.gov/points/27.9,-82.4") is breaker_for_url("https://api.weather.gov/alerts")
+    assert breaker_for_url("https://example.com/") is None
+
+
+def test_http_get_fails_fast_when_open(monkeypatch):
+    breaker = open_breaker(reset_timeout=30)
+    monkeypatch.setattr(http_client, "breaker_for_url", lambda url: breaker)
+    monkeypatch.setattr(http_client, "get_session", lambda url: pytest.fail("called an open upstream"))
+
+    with pytest.raises(CircuitOpenError):
+        http_client.http_get("https://api.weather.gov/alerts/active")
@@ -0,0 +1,75 @@
+import pytest
+
+from shared_tools.gazetteer import Gazetteer, normalize_name, parse_place_query
+
+
+@pytest.mark.parametrize("text, parsed", [
+    ("Tampa, FL", {"name": "Tampa", "state": "FL"}),
+    ("Tampa FL", {"name": "Tampa", "state": "FL"}),
+    ("Tampa, Florida, USA", {"name": "Tampa", "state": "FL"}),
+    ("Portland New York", {"name": "Portland", "state": "NY"}),
+    ("Harris County, Texas", {"name": "Harris County", "state": "TX"}),
+    ("  St. Louis ,  mo ", {"name": "St. Louis", "state": "MO"}),
+    ("33602", {"zip": "33602"}),
+    ("33602-1234", {"zip": "33602"}),
+])
+def test_parse_place_query(text, parsed):
+    assert parse_place_query(text) == parsed
+
+
+@pytest.mark.parametrize("text", [
+    "1600 Pennsylvania Ave, Washington, DC",
+    "Tampa",
+    "Springfield, Narnia",
+    "",
+    None,
+])
+def test_parse_place_query_rejects(text):
+    assert parse_place_query(text) is None
+
+
+def test_normalize_name():
+    assert normalize_name("Saint Augustine") == normalize_name("St. Augustine")
+    assert normalize_name("Cañon City") == "canon city"
+    assert normalize_name("Coeur d'Alene") == "coeur dalene"
+    assert normalize_name("Fort  Myers") == "ft myers"
+
+
+@pytest.fixture
+def gazetteer():
+    places = [
+        ("Tampa city", "FL", 27.97, -82.46, "1271000", 293.7),
+        ("Springfield city", "IL", 39.78, -89.65, "1772000", 159.0),
+        ("Springfield CDP", "IL", 40.0, -89.0, "1799999", 400.0),
+        ("Nashville-Davidson metropolitan government (balance)", "TN", 36.17, -86.78, "4752006", 1230.0),
+        ("St. Augustine city", "FL", 29.89, -81.31, "1262500", 26.0),
+    ]
+    counties = [("Harris County", "TX", 29.86, -95.39, "48201")]
+    zctas = [("33602", "", 27.95, -82.46, "33602")]
+    return Gazetteer(places, counties, zctas)
+
+
+def test_lookup_place(gazetteer):
+    result = gazetteer.lookup("Tampa, FL")
+
+    assert result["formatted_address"] == "Tampa, FL, USA"
+    assert (result["latitude"], result["longitude"]) == (27.97, -82.46)
+    assert result["types"] == ["locality", "political"]
+    assert result["source"] == "census_gazetteer"
+
+
+def test_incorporated_place_wins_over_cdp(gazetteer):
+    assert gazetteer.lookup("Springfield, IL")["geoid"] == "1772000"
+
+
+def test_lookup_alias_county_and_zip(gazetteer):
+    assert gazetteer.lookup("Nashville, TN")["geoid"] == "4752006"
+    assert gazetteer.lookup("Saint Augustine, Florida")["geoid"] == "1262500"
+    assert gazetteer.lookup("harris county, tx")["types"][0] == "administrative_area_level_2"
+    assert gazetteer.lookup("33602")["types"] == ["postal_code"]
+
+
+def test_lookup_misses(gazetteer):
+    assert gazetteer.lookup("Tampa, GA") is None
+    assert gazetteer.lookup("99999") is None
+    assert gazetteer.lookup("Dallas County, TX") is None
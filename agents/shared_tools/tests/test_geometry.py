@@ -0,0 +1,80 @@
+import pytest
+
+from shared_tools.geometry import polygon_stats, geometry_bbox, geometry_centroid
+
+
+def square(min_lon, min_lat, size):
+    return [
+        [min_lon, min_lat], [min_lon + size, min_lat], [min_lon + size, min_lat + size],
+        [min_lon, min_lat + size], [min_lon, min_lat]
+    ]
+
+
+def test_square_centroid_bbox_and_area():
+    stats = polygon_stats({"type": "Polygon", "coordinates": [square(-82.0, 27.0, 2.0)]})
+
+    assert stats["centroid"] == pytest.approx({"lat": 28.0, "lon": -81.0})
+    assert stats["bbox"] == [-82.0, 27.0, -80.0, 29.0]
+    assert stats["area_sq_deg"] == pytest.approx(4.0)
+
+
+def test_orientation_does_not_matter():
+    ring = square(-82.0, 27.0, 2.0)
+    clockwise = polygon_stats({"type": "Polygon", "coordinates": [ring[::-1]]})
+
+    assert clockwise["area_sq_deg"] == pytest.approx(4.0)
+    assert clockwise["centroid"] == pytest.approx({"lat": 28.0, "lon": -81.0})
+
+
+def test_hole_is_subtracted_and_moves_the_centroid():
+    outer = square(0.0, 0.0, 4.0)
+    hole = square(2.0, 0.0, 2.0)  # Right-hand lower quarter
+    stats = polygon_stats({"type": "Polygon", "coordinates": [outer, hole]})
+
+    assert stats["area_sq_deg"] == pytest.approx(12.0)
+    # Three unit-4 quarters centered at (1, 1), (1, 3) and (3, 3)
+    assert stats["centroid"] == pytest.approx({"lat": 7.0 / 3.0, "lon": 5.0 / 3.0})
+    assert stats["bbox"] == [0.0, 0.0, 4.0, 4.0]
+
+
+def test_multipolygon_is_area_weighted():
+    stats = polygon_stats({
+        "type": "MultiPolygon",
+        "coordinates": [[square(0.0, 0.0, 3.0)], [square(10.0, 0.0, 1.0)]]
+    })
+
+    assert stats["area_sq_deg"] == pytest.approx(10.0)
+    assert stats["centroid"]["lon"] == pytest.approx((9 * 1.5 + 1 * 10.5) / 10)
+
+
+def test_antimeridian_polygon_is_unwrapped():
+    # Aleutian-style zone from 179E to 179W
+    ring = [[179.0, 51.0], [-179.0, 51.0], [-179.0, 53.0], [179.0, 53.0], [179.0, 51.0]]
+    stats = polygon_stats({"type": "Polygon", "coordinates": [ring]})
+
+    assert stats["area_sq_deg"] == pytest.approx(4.0)
+    assert abs(stats["centroid"]["lon"]) == pytest.approx(180.0)
+    assert stats["centroid"]["lat"] == pytest.approx(52.0)
+    # RFC 7946: the west edge is east of the east edge
+    assert stats["bbox"] == [179.0, 51.0, -179.0, 53.0]
+
+
+def test_antimeridian_centroid_is_wrapped_back():
+    ring = [[178.0, 51.0], [-179.0, 51.0], [-179.0, 52.0], [178.0, 52.0], [178.0, 51.0]]
+    centroid = geometry_centroid({"type": "Polygon", "coordinates": [ring]})
+
+    assert centroid["lon"] == pytest.approx(179.5)
+
+
+def test_empty_or_unsupported_geometry():
+    assert polygon_stats(None) is None
+    assert polygon_stats({"type": "Point", "coordinates": [0.0, 0.0]}) is None
+    assert geometry_bbox({"type": "Polygon", "coordinates": []}) is None
+
+
+def test_zero_area_falls_back_to_vertex_mean():
+    line = [[0.0, 0.0], [2.0, 0.0], [4.0, 0.0]]
+    stats = polygon_stats({"type": "Polygon", "coordinates": [line]})
+
+    assert stats["area_sq_deg"] == 0.0
+    assert stats["centroid"] == pytest.approx({"lat": 0.0, "lon": 2.0})
@@ -0,0 +1,84 @@
+import pytest
+
+from shared_tools.tools import _merge_places_multi
+
+CENTER = "27.9500,-82.4500"
+
+
+class FakeToolContext:
+    def __init__(self):
+        self.state = {}
+
+
+def place(place_id, km_north):
+    """A Nearby Search result km_north kilometers north of CENTER."""
+    return {
+        "place_id": place_id,
+        "name": place_id,
+        "vicinity": "Tampa",
+        "geometry": {"location": {"lat": 27.95 + km_north / 111.2, "lng": -82.45}},
+        "types": ["point_of_interest"]
+    }
+
+
+def merge(outcomes, max_results=20):
+    return _merge_places_multi(FakeToolContext(), CENTER, 5000, outcomes, max_results)
+
+
+def categories_in(result):
+    return {category for p in result["result"]["places"] for category in p["categories"]}
+
+
+def test_far_category_is_not_pushed_out_by_a_near_one():
+    hospitals = [place(f"hospital{i}", 0.1 * i) for i in range(20)]
+    shelters = [place(f"shelter{i}", 8 + i) for i in range(5)]
+    result = merge({"hospital": hospitals, "emergency shelter": shelters})
+
+    places = result["result"]["places"]
+    assert len(places) == 20
+    assert sum("emergency shelter" in p["categories"] for p in places) == 5
+    # Still ordered nearest first
+    assert [p["distance_km"] for p in places] == sorted(p["distance_km"] for p in places)
+
+
+@pytest.mark.parametrize("max_results", [1, 2, 3, 5, 20])
+def test_no_non_empty_category_is_emptied(max_results):
+    outcomes = {
+        "hospital": [place(f"h{i}", 0.1 * i) for i in range(10)],
+        "pharmacy": [place(f"p{i}", 0.2 + 0.1 * i) for i in range(10)],
+        "emergency shelter": [place(f"s{i}", 20 + i) for i in range(3)],
+        "fire_station": [],
+    }
+    result = merge(outcomes, max_results=max_results)
+
+    assert categories_in(result) == {"hospital", "pharmacy", "emergency shelter"}
+    assert result["result"]["count"] <= max(max_results, 3)
+
+
+def test_quota_is_filled_nearest_first():
+    hospitals = [place(f"h{i}", 0.1 * i) for i in range(10)]
+    shelters = [place(f"s{i}", 5 + i) for i in range(10)]
+    places = merge({"hospital": hospitals, "emergency shelter": shelters}, max_results=6)["result"]["places"]
+
+    # Three of each, then nothing else because the cap is reached
+    assert [p["place_id"] for p in places] == ["h0", "h1", "h2", "s0", "s1", "s2"]
+
+
+def test_places_found_twice_are_merged():
+    shared = place("both", 1.0)
+    result = merge({"hospital": [shared], "emergency_room": [dict(shared), place("other", 2.0)]})
+
+    places = result["result"]["places"]
+    assert [p["place_id"] for p in places] == ["both", "other"]
+    assert places[0]["categories"] == ["hospital", "emergency_room"]
+    assert result["result"]["total_unique"] == 2
+
+
+def test_failed_searches_are_reported():
+    partial = merge({"hospital": [place("h0", 1.0)], "pharmacy": RuntimeError("OVER_QUERY_LIMIT")})
+    assert partial["status"] == "success"
+    assert partial["result"]["errors"] == {"pharmacy": "OVER_QUERY_LIMIT"}
+
+    failed = merge({"hospital": RuntimeError("REQUEST_DENIED")})
+    assert failed["status"] == "error"
+    assert "REQUEST_DENIED" in failed["message"]
@@ -0,0 +1,110 @@
+import time
+import asyncio
+
+import httpx
+import pytest
+
+from shared_tools import async_http, rate_limit
+from shared_tools.http_client import _build_session
+from shared_tools.rate_limit import TokenBucket, RateLimitExceeded, retry_after_seconds, upstream_for
+
+
+def test_burst_is_free_then_calls_are_paced():
+    bucket = TokenBucket("test", rate=50.0, burst=3)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    start = time.monotonic()
+    bucket.acquire()
+    bucket.acquire()
+    assert 2 / 50.0 - 0.005 <= time.monotonic() - start < 0.2
+    assert bucket.stats()["waited"] == 2
+
+
+def test_throttled_pauses_and_halves_the_rate():
+    bucket = TokenBucket("test", rate=100.0, burst=5)
+    bucket.throttled(retry_after=0.2)
+
+    assert bucket.rate == 50.0
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.2
+
+    for _ in range(100):
+        bucket.succeeded()
+    assert bucket.rate == 100.0
+
+
+def test_rate_never_drops_below_the_floor():
+    bucket = TokenBucket("test", rate=10.0, burst=1)
+    for _ in range(20):
+        bucket.throttled()
+
+    assert bucket.rate == pytest.approx(10.0 * rate_limit.RATE_LIMIT_MIN_FRACTION)
+
+
+def test_long_waits_are_rejected(monkeypatch):
+    monkeypatch.setattr(rate_limit, "RATE_LIMIT_MAX_WAIT", 0.5)
+    bucket = TokenBucket("test", rate=1.0, burst=1)
+    bucket.acquire()
+    bucket.throttled(retry_after=5)
+
+    with pytest.raises(RateLimitExceeded):
+        bucket.acquire()
+    assert bucket.stats()["rejected"] == 1
+
+
+def test_async_waiters_are_served_in_order():
+    bucket = TokenBucket("test", rate=100.0, burst=1)
+    finished = []
+
+    async def call(index):
+        await bucket.aacquire()
+        finished.append(index)
+
+    async def run():
+        await asyncio.gather(*(call(index) for index in range(5)))
+
+    asyncio.run(run())
+    assert finished == [0, 1, 2, 3, 4]
+
+
+def test_upstream_for():
+    assert upstream_for("api.weather.gov") == "nws"
+    assert upstream_for("www.nhc.noaa.gov:443") == "nhc"
+    assert upstream_for("maps.googleapis.com", "/maps/api/place/nearbysearch/json") == "maps_places"
+    assert upstream_for("maps.googleapis.com", "/maps/api/staticmap") is None
+    assert upstream_for("example.com") is None
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert retry_after_seconds(httpx.Response(429)) is None
+
+
+def test_sync_retries_leave_retry_after_to_the_limiter():
+    retry = _build_session().get_adapter("https://api.weather.gov/").max_retries
+
+    assert retry.respect_retry_after_header is (not rate_limit.RATE_LIMIT_ENABLED)
+
+
+def test_async_retry_waits_out_retry_after_once(monkeypatch):
+    bucket = TokenBucket("test", rate=100.0, burst=5)
+    monkeypatch.setattr(async_http, "limiter_for_url", lambda url: bucket)
+    monkeypatch.setattr(async_http, "breaker_for_url", lambda url: None)
+    monkeypatch.setattr(async_http, "HTTP_BACKOFF_FACTOR", 0.01)
+    responses = [httpx.Response(429, headers={"Retry-After": "0.3"}), httpx.Response(200, json={"ok": True})]
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        async_http._clients[loop] = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+        start = time.monotonic()
+        response = await async_http.async_http_get("https://api.weather.gov/alerts/active")
+        elapsed = time.monotonic() - start
+        await async_http.close_async_client()
+        return response, elapsed
+
+    response, elapsed = asyncio.run(run())
+    assert response.status_code == 200
+    assert 0.3 <= elapsed < 0.5
+    assert bucket.stats()["throttled"] == 1
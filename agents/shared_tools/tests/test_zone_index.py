@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from shared_tools.zone_index import build_zone_index, ZoneIndex
+
+
+def zone(zone_id, name, lon, lat, zone_type="forecast"):
+    ring = [[lon, lat], [lon + 1, lat], [lon + 1, lat + 1], [lon, lat + 1], [lon, lat]]
+    return {
+        "type": "Feature",
+        "properties": {"id": zone_id, "name": name, "type": zone_type},
+        "geometry": {"type": "Polygon", "coordinates": [ring]}
+    }
+
+
+@pytest.fixture
+def index(tmp_path):
+    dump = tmp_path / "zones.json"
+    dump.write_text(json.dumps({"features": [
+        zone("FLZ069", "Coastal Hillsborough", -82.5, 27.5),
+        zone("FLZ069", "Fire zone duplicate", 0.0, 0.0, zone_type="fire"),
+        zone("AKZ191", "Aleutians", 179.5, 51.0),
+        zone("PRZ001", "é" * 40000, -66.0, 18.0),  # 80000 bytes of two-byte characters
+    ]}), encoding="utf-8")
+    path = str(tmp_path / "zones.idx")
+    assert build_zone_index([str(dump)], path) == 3
+    return ZoneIndex(path)
+
+
+def test_lookup(index):
+    result = index.lookup("flz069")
+
+    assert result["name"] == "Coastal Hillsborough"
+    assert (result["latitude"], result["longitude"]) == pytest.approx((28.0, -82.0))
+    assert index.lookup("TXZ999") is None
+    assert len(index) == 3
+
+
+def test_forecast_zone_wins_over_fire_zone(index):
+    assert index.lookup("FLZ069")["latitude"] == pytest.approx(28.0)
+
+
+def test_long_multibyte_name_is_cut_on_a_character_boundary(index):
+    name = index.lookup("PRZ001")["name"]
+
+    assert name == "é" * (0xFFFF // 2)
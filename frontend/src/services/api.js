@@ -389,9 +389,9 @@ class WeatherAgentAPI {
     try {
       console.log('[API] Getting alerts for:', location);
       
-      // Create session first
+      // Create session first; the fast path builds the summary without the LLM formatting chain
       const sessionResponse = await this.clients.alerts.post('/apps/alerts_snapshot_agent/users/user_001/sessions', {
-        state: {}
+        state: { alerts_mode: 'fast' }
       });
       const sessionId = sessionResponse.data.id;
       console.log('[API] Created alerts session:', sessionId);